@@ -3,70 +3,194 @@ Events API Routes
 Create, read, update, and delete events with Supabase
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
-from typing import Optional, List
-from datetime import datetime, date, time
-
-from app.shared.supabase import get_supabase_client
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from postgrest.exceptions import APIError
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+from typing import Annotated, Optional, List, Any, Awaitable, Callable, Hashable
+import datetime
+import email.utils
+import hashlib
+import orjson
+from cachetools import TTLCache
+import asyncio
+import os
+import time
+import uuid
+
+from supabase import AsyncClient
+
+from app.shared.supabase import get_db
+from app.shared.postgres import get_pg_pool, record_to_dict
 
 
 router = APIRouter()
 
+# Postgres error code for a foreign key violation (event_id doesn't exist)
+FOREIGN_KEY_VIOLATION = "23503"
+
+
+# ==================== CACHING ====================
+
+# Short-lived in-process caches for the read endpoints.
+# Write endpoints invalidate them, so the TTL only bounds staleness for
+# changes made outside this process. For multi-instance deployments swap
+# these for a shared cache (e.g. Redis) keyed the same way.
+EVENTS_CACHE_TTL = float(os.getenv("EVENTS_CACHE_TTL", "30"))
+
+# (date_filter, limit, offset, cursor) -> (etag, list of event rows)
+events_list_cache: TTLCache = TTLCache(maxsize=1024, ttl=EVENTS_CACHE_TTL)
+# event_id -> (last_modified, event row)
+event_cache: TTLCache = TTLCache(maxsize=1024, ttl=EVENTS_CACHE_TTL)
+# One lock per cache key so concurrent misses only hit Supabase once
+_cache_locks: TTLCache = TTLCache(maxsize=2048, ttl=EVENTS_CACHE_TTL)
+
+_MISSING = object()
+
 
 # ==================== REQUEST MODELS ====================
 
+# Constraints live in the type so pydantic-core builds the schema once
+Title = Annotated[str, StringConstraints(min_length=1, max_length=200)]
+Description = Annotated[str, StringConstraints(max_length=2000)]
+Location = Annotated[str, StringConstraints(max_length=500)]
+
+# Reject unknown fields and strip whitespace during validation (in Rust);
+# request models are read-only once parsed
+REQUEST_MODEL_CONFIG = ConfigDict(extra='forbid', str_strip_whitespace=True, frozen=True)
+
+
 class EventCreate(BaseModel):
     """Model for creating a new event"""
-    title: str = Field(..., min_length=1, max_length=200, description="Event title")
-    description: Optional[str] = Field(None, max_length=2000, description="Event description")
-    date: str = Field(..., description="Event date (YYYY-MM-DD)")
-    time: str = Field(..., description="Event time (HH:MM)")
-    location: Optional[str] = Field(None, max_length=500, description="Event location")
+    model_config = REQUEST_MODEL_CONFIG
+    
+    title: Title = Field(..., description="Event title")
+    description: Optional[Description] = Field(None, description="Event description")
+    date: datetime.date = Field(..., description="Event date (YYYY-MM-DD)")
+    time: datetime.time = Field(..., description="Event time (HH:MM)")
+    location: Optional[Location] = Field(None, description="Event location")
     max_participants: Optional[int] = Field(None, ge=1, description="Maximum number of participants")
     created_by: Optional[str] = Field(None, description="User ID who created the event")
 
 
 class EventUpdate(BaseModel):
     """Model for updating an event"""
-    title: Optional[str] = Field(None, min_length=1, max_length=200)
-    description: Optional[str] = Field(None, max_length=2000)
-    date: Optional[str] = None
-    time: Optional[str] = None
-    location: Optional[str] = Field(None, max_length=500)
+    model_config = REQUEST_MODEL_CONFIG
+    
+    title: Optional[Title] = None
+    description: Optional[Description] = None
+    date: Optional[datetime.date] = None
+    time: Optional[datetime.time] = None
+    location: Optional[Location] = None
     max_participants: Optional[int] = Field(None, ge=1)
 
 
 class EventRegistration(BaseModel):
     """Model for registering to an event"""
+    model_config = REQUEST_MODEL_CONFIG
+    
     event_id: str = Field(..., description="Event ID")
     user_id: str = Field(..., description="User ID registering for the event")
 
 
-# ==================== HELPER FUNCTIONS ====================
+async def get_cached(cache: TTLCache, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """Return cache[key], calling loader() once on a miss"""
+    value = cache.get(key, _MISSING)
+    if value is not _MISSING:
+        return value
+    
+    lock_key = (id(cache), key)
+    lock = _cache_locks.get(lock_key)
+    if lock is None:
+        lock = _cache_locks[lock_key] = asyncio.Lock()
+    
+    async with lock:
+        # Another request may have filled the cache while we waited
+        value = cache.get(key, _MISSING)
+        if value is _MISSING:
+            value = await loader()
+            cache[key] = value
+    return value
 
-def validate_date_format(date_str: str) -> bool:
-    """Validate date format (YYYY-MM-DD)"""
-    try:
-        datetime.strptime(date_str, "%Y-%m-%d")
-        return True
-    except ValueError:
+
+# (epoch second, "YYYY-MM-DD") - refreshed at most once per second
+_today_cache = (0, "")
+
+
+def today_str() -> str:
+    """Today's date as YYYY-MM-DD, recomputed at most once per second"""
+    global _today_cache
+    now = int(time.time())
+    if _today_cache[0] != now:
+        _today_cache = (now, datetime.date.today().isoformat())
+    return _today_cache[1]
+
+
+# ==================== CONDITIONAL GET ====================
+
+def make_etag(rows: Any) -> str:
+    """Strong ETag from a short blake2b digest of the serialized rows"""
+    return '"' + hashlib.blake2b(orjson.dumps(rows), digest_size=8).hexdigest() + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the client's If-None-Match already names this ETag"""
+    header = request.headers.get("if-none-match")
+    if not header:
         return False
+    if header.strip() == "*":
+        return True
+    return etag in (tag.strip().removeprefix("W/") for tag in header.split(","))
+
 
+def http_date(timestamp: Optional[str]) -> Optional[str]:
+    """ISO timestamp (e.g. updated_at) as an HTTP Last-Modified date"""
+    if not timestamp:
+        return None
+    return email.utils.format_datetime(
+        datetime.datetime.fromisoformat(timestamp).astimezone(datetime.timezone.utc),
+        usegmt=True
+    )
 
-def validate_time_format(time_str: str) -> bool:
-    """Validate time format (HH:MM)"""
+
+def not_modified_since(request: Request, last_modified: Optional[str]) -> bool:
+    """True if the client's If-Modified-Since copy is still current"""
+    header = request.headers.get("if-modified-since")
+    if not header or not last_modified:
+        return False
     try:
-        datetime.strptime(time_str, "%H:%M")
-        return True
-    except ValueError:
+        return email.utils.parsedate_to_datetime(header) >= email.utils.parsedate_to_datetime(last_modified)
+    except (TypeError, ValueError):
         return False
 
 
+async def event_exists(supabase: AsyncClient, event_id: str) -> bool:
+    """Check an event exists with a HEAD count query (no row payload)"""
+    response = await supabase.table('events').select(
+        'id', count='exact', head=True
+    ).eq('id', event_id).execute()
+    return bool(response.count)
+
+
+def invalidate_event_caches(event_id: Optional[str] = None) -> None:
+    """Drop cached event lists (and the given event) after a write"""
+    events_list_cache.clear()
+    if event_id:
+        event_cache.pop(event_id, None)
+
+
 # ==================== EVENT ENDPOINTS ====================
 
+# Every handler issues at most one Supabase query on its normal path.
+# Related rows are fetched with PostgREST embeds (e.g. the participant
+# count below) instead of a follow-up query per row.
+# Columns are listed explicitly (no wildcard selects) to keep payloads small.
+EVENT_LIST_COLUMNS = 'id,title,description,date,time,location,max_participants,participant_count:event_registrations(count)'
+EVENT_DETAIL_COLUMNS = 'id,title,description,date,time,location,max_participants,created_by,created_at,updated_at'
+REGISTRATION_COLUMNS = 'id,event_id,user_id,registered_at'
+
 @router.get("/")
-def events_info():
+async def events_info():
     """Get information about the Events module"""
     return {
         "module": "Events",
@@ -83,11 +207,71 @@ def events_info():
     }
 
 
+def keyset_filter(after_date: datetime.date, after_time: datetime.time, after_id: uuid.UUID) -> str:
+    """PostgREST or= filter for rows sorted after (date, time, id)"""
+    # Values are quoted because times contain colons
+    d, t, i = f'"{after_date.isoformat()}"', f'"{after_time.isoformat()}"', f'"{after_id}"'
+    return (
+        f"date.gt.{d},"
+        f"and(date.eq.{d},time.gt.{t}),"
+        f"and(date.eq.{d},time.eq.{t},id.gt.{i})"
+    )
+
+
+# Same columns as EVENT_LIST_COLUMNS, for the direct Postgres path
+EVENT_LIST_SQL = """
+    SELECT e.id, e.title, e.description, e.date, e.time, e.location, e.max_participants,
+           (SELECT count(*) FROM event_registrations r WHERE r.event_id = e.id) AS participant_count
+    FROM events e
+"""
+
+
+async def fetch_events_pg(pool, date_filter: Optional[str], limit: int, offset: int, cursor: Optional[tuple]) -> list:
+    """List events straight from Postgres, shaped like the PostgREST response"""
+    conditions, args = [], []
+    
+    def param(value) -> str:
+        args.append(value)
+        return f"${len(args)}"
+    
+    if date_filter == "today":
+        conditions.append(f"e.date = {param(datetime.date.fromisoformat(today_str()))}")
+    elif date_filter == "upcoming":
+        conditions.append(f"e.date >= {param(datetime.date.fromisoformat(today_str()))}")
+    elif date_filter:
+        conditions.append(f"e.date = {param(datetime.date.fromisoformat(date_filter))}")
+    
+    if cursor:
+        after_date, after_time, after_id = cursor
+        conditions.append(f"(e.date, e.time, e.id) > ({param(after_date)}, {param(after_time)}, {param(after_id)})")
+    
+    sql = EVENT_LIST_SQL
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += f" ORDER BY e.date, e.time, e.id LIMIT {param(limit)}"
+    if not cursor:
+        sql += f" OFFSET {param(offset)}"
+    
+    events = []
+    async with pool.acquire() as conn:
+        for record in await conn.fetch(sql, *args):
+            event = record_to_dict(record)
+            event["participant_count"] = [{"count": event["participant_count"]}]
+            events.append(event)
+    return events
+
+
 @router.get("/list")
-def get_events(
-    date_filter: Optional[str] = None,
+async def get_events(
+    request: Request,
+    response: Response,
+    date_filter: Optional[str] = Query(None, pattern=r"^(today|upcoming|\d{4}-\d{2}-\d{2})$"),
     limit: int = 50,
-    offset: int = 0
+    offset: int = 0,
+    after_date: Optional[datetime.date] = None,
+    after_time: Optional[datetime.time] = None,
+    after_id: Optional[uuid.UUID] = None,
+    supabase: AsyncClient = Depends(get_db)
 ):
     """
     Get all events with optional filters
@@ -96,336 +280,354 @@ def get_events(
     - date_filter: Filter by date (YYYY-MM-DD) or special values ('today', 'upcoming')
     - limit: Maximum number of events to return (default: 50)
     - offset: Number of events to skip (default: 0)
+    - after_date, after_time, after_id: Keyset cursor - return events after this one.
+      Pass the previous response's next_cursor; cheaper than offset for deep pages.
+    
+    Each event includes participant_count: [{"count": N}] from an embedded
+    count of event_registrations, so no per-event lookup is needed.
+    
+    Responses carry an ETag; send it back as If-None-Match to get a
+    304 Not Modified when the page hasn't changed.
     """
-    try:
-        supabase = get_supabase_client()
+    cursor = (after_date, after_time, after_id)
+    use_cursor = all(value is not None for value in cursor)
+    if not use_cursor and any(value is not None for value in cursor):
+        raise HTTPException(
+            status_code=400,
+            detail="after_date, after_time and after_id must be given together"
+        )
+    if date_filter not in (None, "today", "upcoming"):
+        # The pattern only checks the shape - reject dates like 2025-13-45
+        try:
+            datetime.date.fromisoformat(date_filter)
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid date_filter: {date_filter}")
+    
+    async def fetch_events() -> list:
+        pool = get_pg_pool()
+        if pool is not None:
+            return await fetch_events_pg(pool, date_filter, limit, offset, cursor if use_cursor else None)
         
         # Build query
-        query = supabase.table('events').select('*')
+        query = supabase.table('events').select(EVENT_LIST_COLUMNS)
         
         # Apply filters
         if date_filter == "today":
-            today = datetime.now().strftime("%Y-%m-%d")
-            query = query.eq('date', today)
+            query = query.eq('date', today_str())
         elif date_filter == "upcoming":
-            today = datetime.now().strftime("%Y-%m-%d")
-            query = query.gte('date', today)
+            query = query.gte('date', today_str())
         elif date_filter:
             # Specific date filter
-            if validate_date_format(date_filter):
-                query = query.eq('date', date_filter)
-            else:
-                raise HTTPException(status_code=400, detail="Invalid date format. Use YYYY-MM-DD")
+            query = query.eq('date', date_filter)
         
-        # Order by date and time
-        query = query.order('date', desc=False).order('time', desc=False)
+        # Order by date and time, id breaks ties so the cursor is stable
+        query = query.order('date', desc=False).order('time', desc=False).order('id', desc=False)
         
-        # Apply pagination
-        query = query.range(offset, offset + limit - 1)
+        # Apply pagination - the keyset cursor uses idx_events_date_time_id
+        # instead of scanning and discarding `offset` rows
+        if use_cursor:
+            query = query.or_(keyset_filter(*cursor)).limit(limit)
+        else:
+            query = query.range(offset, offset + limit - 1)
         
         # Execute query
-        response = query.execute()
-        
-        return {
-            "success": True,
-            "events": response.data,
-            "count": len(response.data),
-            "filter": date_filter or "all",
-            "limit": limit,
-            "offset": offset
+        result = await query.execute()
+        return result.data
+    
+    async def fetch_page() -> tuple:
+        # Hash once per cache fill, not on every hit
+        events = await fetch_events()
+        return make_etag(events), events
+    
+    cache_key = (date_filter, limit, offset, cursor if use_cursor else None)
+    etag, events = await get_cached(events_list_cache, cache_key, fetch_page)
+    
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    
+    # A full page may have more after it
+    next_cursor = None
+    if events and len(events) == limit:
+        last = events[-1]
+        next_cursor = {
+            "after_date": last["date"],
+            "after_time": last["time"],
+            "after_id": last["id"]
         }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error fetching events: {str(e)}"
-        )
+    
+    return {
+        "success": True,
+        "events": events,
+        "count": len(events),
+        "filter": date_filter or "all",
+        "limit": limit,
+        "offset": offset,
+        "next_cursor": next_cursor
+    }
+
+
+# Same columns as EVENT_DETAIL_COLUMNS - with asyncpg's statement cache this
+# is prepared once per connection rather than parsed on every request
+EVENT_DETAIL_SQL = """
+    SELECT id, title, description, date, time, location, max_participants,
+           created_by, created_at, updated_at
+    FROM events WHERE id = $1
+"""
 
 
 @router.get("/{event_id}")
-def get_event(event_id: str):
+async def get_event(event_id: str, request: Request, response: Response, supabase: AsyncClient = Depends(get_db)):
     """
     Get a specific event by ID
+    
+    Last-Modified comes from the row's updated_at; send it back as
+    If-Modified-Since to get a 304 Not Modified.
     """
-    try:
-        supabase = get_supabase_client()
-        
-        response = supabase.table('events').select('*').eq('id', event_id).execute()
-        
-        if not response.data or len(response.data) == 0:
+    async def fetch_event() -> dict:
+        pool = get_pg_pool()
+        if pool is not None:
+            record = await pool.fetchrow(EVENT_DETAIL_SQL, uuid.UUID(event_id))
+            if record is None:
+                raise HTTPException(status_code=404, detail="Event not found")
+            return record_to_dict(record)
+        
+        result = await supabase.table('events').select(EVENT_DETAIL_COLUMNS).eq('id', event_id).execute()
+        
+        # Raising here means a missing event is never cached
+        if not result.data or len(result.data) == 0:
             raise HTTPException(status_code=404, detail="Event not found")
-        
-        return {
-            "success": True,
-            "event": response.data[0]
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error fetching event: {str(e)}"
-        )
+        return result.data[0]
+    
+    async def fetch_event_entry() -> tuple:
+        event = await fetch_event()
+        return http_date(event.get("updated_at")), event
+    
+    last_modified, event = await get_cached(event_cache, event_id, fetch_event_entry)
+    
+    if not_modified_since(request, last_modified):
+        return Response(status_code=304, headers={"Last-Modified": last_modified})
+    if last_modified:
+        response.headers["Last-Modified"] = last_modified
+    
+    return {
+        "success": True,
+        "event": event
+    }
 
 
 @router.post("/create")
-def create_event(event: EventCreate):
+async def create_event(event: EventCreate, supabase: AsyncClient = Depends(get_db)):
     """
     Create a new event
     """
-    try:
-        # Validate date and time formats
-        if not validate_date_format(event.date):
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid date format. Use YYYY-MM-DD"
-            )
-        
-        if not validate_time_format(event.time):
-            raise HTTPException(
-                status_code=400,
-                detail="Invalid time format. Use HH:MM (24-hour format)"
-            )
-        
-        supabase = get_supabase_client()
-        
-        # Prepare event data
-        event_data = {
-            "title": event.title,
-            "description": event.description,
-            "date": event.date,
-            "time": event.time,
-            "location": event.location,
-            "max_participants": event.max_participants,
-            "created_by": event.created_by
-        }
-        
-        # Insert into Supabase
-        response = supabase.table('events').insert(event_data).execute()
-        
-        if not response.data or len(response.data) == 0:
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to create event"
-            )
-        
-        return {
-            "success": True,
-            "message": "Event created successfully!",
-            "event": response.data[0]
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
+    # Prepare event data - mode="json" renders date/time as ISO strings
+    event_data = event.model_dump(mode="json")
+    
+    # Insert into Supabase
+    response = await supabase.table('events').insert(event_data).execute()
+    
+    if not response.data or len(response.data) == 0:
         raise HTTPException(
             status_code=500,
-            detail=f"Error creating event: {str(e)}"
+            detail="Failed to create event"
         )
+    
+    invalidate_event_caches()
+    
+    return {
+        "success": True,
+        "message": "Event created successfully!",
+        "event": response.data[0]
+    }
 
 
 @router.put("/{event_id}")
-def update_event(event_id: str, event_update: EventUpdate):
+async def update_event(event_id: str, event_update: EventUpdate, supabase: AsyncClient = Depends(get_db)):
     """
     Update an existing event
     """
-    try:
-        supabase = get_supabase_client()
-        
-        # Check if event exists
-        existing = supabase.table('events').select('*').eq('id', event_id).execute()
-        if not existing.data or len(existing.data) == 0:
-            raise HTTPException(status_code=404, detail="Event not found")
-        
-        # Prepare update data (only include provided fields)
-        update_data = {}
-        if event_update.title is not None:
-            update_data["title"] = event_update.title
-        if event_update.description is not None:
-            update_data["description"] = event_update.description
-        if event_update.date is not None:
-            if not validate_date_format(event_update.date):
-                raise HTTPException(status_code=400, detail="Invalid date format")
-            update_data["date"] = event_update.date
-        if event_update.time is not None:
-            if not validate_time_format(event_update.time):
-                raise HTTPException(status_code=400, detail="Invalid time format")
-            update_data["time"] = event_update.time
-        if event_update.location is not None:
-            update_data["location"] = event_update.location
-        if event_update.max_participants is not None:
-            update_data["max_participants"] = event_update.max_participants
-        
-        # Update in Supabase
-        response = supabase.table('events').update(update_data).eq('id', event_id).execute()
-        
-        return {
-            "success": True,
-            "message": "Event updated successfully!",
-            "event": response.data[0] if response.data else None
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error updating event: {str(e)}"
-        )
+    # Prepare update data (only include provided fields)
+    update_data = event_update.model_dump(mode="json", exclude_unset=True, exclude_none=True)
+    
+    # Update in Supabase - an empty result means no row matched the ID
+    response = await supabase.table('events').update(update_data).eq('id', event_id).execute()
+    if not response.data:
+        raise HTTPException(status_code=404, detail="Event not found")
+    
+    invalidate_event_caches(event_id)
+    
+    return {
+        "success": True,
+        "message": "Event updated successfully!",
+        "event": response.data[0]
+    }
 
 
 @router.delete("/{event_id}")
-def delete_event(event_id: str):
+async def delete_event(event_id: str, supabase: AsyncClient = Depends(get_db)):
     """
     Delete an event
     """
-    try:
-        supabase = get_supabase_client()
-        
-        # Check if event exists
-        existing = supabase.table('events').select('*').eq('id', event_id).execute()
-        if not existing.data or len(existing.data) == 0:
-            raise HTTPException(status_code=404, detail="Event not found")
-        
-        # Delete from Supabase
-        response = supabase.table('events').delete().eq('id', event_id).execute()
-        
-        return {
-            "success": True,
-            "message": "Event deleted successfully!",
-            "event_id": event_id
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error deleting event: {str(e)}"
-        )
+    # Delete from Supabase - an empty result means no row matched the ID
+    response = await supabase.table('events').delete().eq('id', event_id).execute()
+    if not response.data:
+        raise HTTPException(status_code=404, detail="Event not found")
+    
+    invalidate_event_caches(event_id)
+    
+    return {
+        "success": True,
+        "message": "Event deleted successfully!",
+        "event_id": event_id
+    }
 
 
 # ==================== EVENT REGISTRATION ENDPOINTS ====================
 
 @router.post("/register")
-def register_for_event(registration: EventRegistration):
+async def register_for_event(registration: EventRegistration, supabase: AsyncClient = Depends(get_db)):
     """
     Register a user for an event
     """
+    # Create registration in one round-trip:
+    # - a missing event fails the foreign key constraint
+    # - an existing registration is skipped by ON CONFLICT DO NOTHING
+    registration_data = {
+        "event_id": registration.event_id,
+        "user_id": registration.user_id
+    }
+    
     try:
-        supabase = get_supabase_client()
-        
-        # Check if event exists
-        event = supabase.table('events').select('*').eq('id', registration.event_id).execute()
-        if not event.data or len(event.data) == 0:
+        response = await supabase.table('event_registrations').upsert(
+            registration_data,
+            on_conflict='event_id,user_id',
+            ignore_duplicates=True
+        ).execute()
+    except APIError as e:
+        if e.code == FOREIGN_KEY_VIOLATION:
             raise HTTPException(status_code=404, detail="Event not found")
-        
-        # Check if already registered
-        existing = supabase.table('event_registrations').select('*').eq(
+        raise
+    
+    if not response.data:
+        # Nothing inserted - the user is already registered
+        existing = await supabase.table('event_registrations').select(REGISTRATION_COLUMNS).eq(
             'event_id', registration.event_id
         ).eq('user_id', registration.user_id).execute()
         
-        if existing.data and len(existing.data) > 0:
-            return {
-                "success": True,
-                "message": "Already registered for this event",
-                "already_registered": True,
-                "registration": existing.data[0]
-            }
-        
-        # Create registration
-        registration_data = {
-            "event_id": registration.event_id,
-            "user_id": registration.user_id
-        }
-        
-        response = supabase.table('event_registrations').insert(registration_data).execute()
-        
         return {
             "success": True,
-            "message": "Successfully registered for event!",
-            "registration": response.data[0] if response.data else None
+            "message": "Already registered for this event",
+            "already_registered": True,
+            "registration": existing.data[0] if existing.data else None
         }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error registering for event: {str(e)}"
-        )
+    
+    invalidate_event_caches(registration.event_id)
+    
+    return {
+        "success": True,
+        "message": "Successfully registered for event!",
+        "registration": response.data[0] if response.data else None
+    }
 
 
 @router.delete("/register/{event_id}/{user_id}")
-def unregister_from_event(event_id: str, user_id: str):
+async def unregister_from_event(event_id: str, user_id: str, supabase: AsyncClient = Depends(get_db)):
     """
     Unregister a user from an event
     """
-    try:
-        supabase = get_supabase_client()
-        
-        # Check if registration exists
-        existing = supabase.table('event_registrations').select('*').eq(
-            'event_id', event_id
-        ).eq('user_id', user_id).execute()
-        
-        if not existing.data or len(existing.data) == 0:
-            raise HTTPException(status_code=404, detail="Registration not found")
-        
-        # Delete registration
-        response = supabase.table('event_registrations').delete().eq(
-            'event_id', event_id
-        ).eq('user_id', user_id).execute()
-        
-        return {
-            "success": True,
-            "message": "Successfully unregistered from event",
-            "event_id": event_id,
-            "user_id": user_id
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error unregistering from event: {str(e)}"
-        )
+    # Delete registration - an empty result means the user wasn't registered
+    response = await supabase.table('event_registrations').delete().eq(
+        'event_id', event_id
+    ).eq('user_id', user_id).execute()
+    
+    if not response.data:
+        raise HTTPException(status_code=404, detail="Registration not found")
+    
+    invalidate_event_caches(event_id)
+    
+    return {
+        "success": True,
+        "message": "Successfully unregistered from event",
+        "event_id": event_id,
+        "user_id": user_id
+    }
 
 
-@router.get("/{event_id}/participants")
-def get_event_participants(event_id: str):
+# Rows fetched per round-trip when streaming participants from Postgres
+PARTICIPANTS_STREAM_BATCH = 500
+
+
+async def stream_participants_pg(pool, event_id: str) -> StreamingResponse:
     """
-    Get list of participants registered for an event
+    Stream registrations for an event straight from Postgres
+    
+    Rows are read through a server-side cursor and written out batch by
+    batch, so memory stays flat for popular events. The first batch is
+    read up front so a missing event can still be reported as a 404.
     """
+    event_uuid = uuid.UUID(event_id)
+    conn = await pool.acquire()
+    transaction = conn.transaction()
     try:
-        supabase = get_supabase_client()
-        
-        # Check if event exists
-        event = supabase.table('events').select('*').eq('id', event_id).execute()
-        if not event.data or len(event.data) == 0:
+        await transaction.start()
+        cursor = await conn.cursor(
+            "SELECT id, event_id, user_id, registered_at FROM event_registrations WHERE event_id = $1",
+            event_uuid
+        )
+        batch = await cursor.fetch(PARTICIPANTS_STREAM_BATCH)
+        if not batch and not await conn.fetchval("SELECT EXISTS(SELECT 1 FROM events WHERE id = $1)", event_uuid):
             raise HTTPException(status_code=404, detail="Event not found")
-        
-        # Get registrations
-        response = supabase.table('event_registrations').select(
-            '*'
-        ).eq('event_id', event_id).execute()
-        
-        return {
-            "success": True,
-            "event_id": event_id,
-            "participants": response.data,
-            "count": len(response.data)
-        }
-        
-    except HTTPException:
+    except BaseException:
+        await transaction.rollback()
+        await pool.release(conn)
         raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error fetching participants: {str(e)}"
-        )
+    
+    async def body():
+        # Same shape as the buffered response - count goes last since
+        # it's only known once every row has been sent
+        try:
+            yield b'{"success":true,"event_id":' + orjson.dumps(event_id) + b',"participants":['
+            count = 0
+            current = batch
+            while current:
+                chunk = b",".join(orjson.dumps(record_to_dict(record)) for record in current)
+                yield (b"," + chunk) if count else chunk
+                count += len(current)
+                if len(current) < PARTICIPANTS_STREAM_BATCH:
+                    break
+                current = await cursor.fetch(PARTICIPANTS_STREAM_BATCH)
+            yield b'],"count":' + str(count).encode() + b'}'
+        finally:
+            await transaction.rollback()
+            await pool.release(conn)
+    
+    return StreamingResponse(body(), media_type="application/json")
+
 
+@router.get("/{event_id}/participants")
+async def get_event_participants(event_id: str, supabase: AsyncClient = Depends(get_db)):
+    """
+    Get list of participants registered for an event
+    """
+    pool = get_pg_pool()
+    if pool is not None:
+        return await stream_participants_pg(pool, event_id)
+    
+    # Get registrations
+    response = await supabase.table('event_registrations').select(
+        REGISTRATION_COLUMNS
+    ).eq('event_id', event_id).execute()
+    participants = response.data
+    
+    # No registrations - only now pay for a HEAD check to tell an
+    # empty event apart from a missing one
+    if not participants and not await event_exists(supabase, event_id):
+        raise HTTPException(status_code=404, detail="Event not found")
+    
+    return {
+        "success": True,
+        "event_id": event_id,
+        "participants": participants,
+        "count": len(participants)
+    }
@@ -5,18 +5,42 @@ Multi-agent system for community engagement platform
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+import anyio.to_thread
+import asyncio
+import logging
+import os
 import uvicorn
 
 # Import Supabase connection
-from app.shared.supabase import get_supabase_client, test_connection
+from app.shared.supabase import (
+    get_async_supabase_client,
+    close_async_supabase_client,
+    test_connection,
+    warm_connection_pool,
+)
+from app.shared.postgres import create_pg_pool, close_pg_pool
+from app.shared.http import get_http_client, close_http_client
 
 # Import all module routers
 from app.wellness.routes import router as wellness_router
 from app.safety.simple_routes import router as safety_router
-from app.orchestrator.routes import router as orchestrator_router
+from app.orchestrator.routes import (
+    router as orchestrator_router,
+    close_sea_lion_client,
+    save_semantic_cache,
+    start_translation_batcher,
+    translation_batcher,
+    init_groq_client,
+    warm_openai_client,
+)
 from app.events.routes import router as events_router
 
+# LOG_LEVEL (default WARNING) - set DEBUG to see per-request event matching
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -28,17 +52,51 @@ async def lifespan(app: FastAPI):
     print("🚀 Starting SC Backend API...")
     print("="*60)
     
-    # Test Supabase connection
-    try:
-        test_connection()
-        print("✅ All systems ready!")
-    except Exception as e:
-        print(f"⚠️ Warning: Database connection issue: {e}")
-        print("   Continue anyway, but some features may not work.")
+    # Cap the threadpool used by any remaining sync handlers (Twilio, etc.)
+    # Async routes run on the event loop and don't consume these tokens
+    thread_limiter = anyio.to_thread.current_default_thread_limiter()
+    thread_limiter.total_tokens = int(os.getenv("THREADPOOL_MAX_WORKERS", "40"))
+    
+    # Supabase setup, the optional Postgres pool and the OpenAI connection
+    # are independent, so set them up concurrently
+    async def start_supabase():
+        # Create the shared Supabase client once and test the connection
+        try:
+            app.state.supabase = await get_async_supabase_client()
+            if await test_connection():
+                await warm_connection_pool()
+            print("✅ All systems ready!")
+        except Exception as e:
+            print(f"⚠️ Warning: Database connection issue: {e}")
+            print("   Continue anyway, but some features may not work.")
+    
+    async def start_pg_pool():
+        # Optional direct Postgres pool for heavy reads (needs DATABASE_URL)
+        try:
+            await create_pg_pool()
+        except Exception as e:
+            print(f"⚠️ Warning: Postgres pool unavailable, using Supabase client: {e}")
+    
+    await asyncio.gather(start_supabase(), start_pg_pool(), warm_openai_client())
+    
+    # LLM clients are reused by every request - build them before serving
+    init_groq_client()
+    
+    # Pooled HTTP client for internal API calls (orchestrator -> events/safety)
+    app.state.http = get_http_client()
+    
+    # Optional micro-batching of Singlish translations
+    start_translation_batcher()
     
     yield
     
     print("\n👋 Shutting down SC Backend...")
+    await close_async_supabase_client()
+    await close_pg_pool()
+    await close_http_client()
+    await close_sea_lion_client()
+    await translation_batcher.stop()
+    save_semantic_cache()
 
 
 # Create FastAPI application
@@ -47,6 +105,7 @@ app = FastAPI(
     description="Backend API for community engagement and social platform with events management",
     version="2.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson serializes large event lists much faster
     docs_url="/docs",
     redoc_url="/redoc"
 )
@@ -54,9 +113,7 @@ app = FastAPI(
 
 # Configure CORS - Allow frontend to make requests
 # Note: When allow_credentials=True, you cannot use "*" for allow_origins
-# You must specify exact origins or use allow_origin_regex
-import os
-import re
+# You must specify exact origins or match them by hostname suffix (below)
 
 # Get allowed origins from environment or use defaults
 allowed_origins_env = os.getenv("ALLOWED_ORIGINS", "")
@@ -72,14 +129,39 @@ else:
         "http://127.0.0.1:3001",
     ]
 
-# Use regex pattern to allow all subdomains for common hosting platforms
+# Allow all HTTPS subdomains of common hosting platforms
 # This allows any Vercel, Netlify, or Render frontend
-allowed_origin_regex = r"https://.*\.(vercel\.app|netlify\.app|onrender\.com)$"
+ALLOWED_ORIGIN_SUFFIXES = (".vercel.app", ".netlify.app", ".onrender.com")
+
+
+ALLOWED_ORIGINS_SET = frozenset(allowed_origins)
+
+
+def is_allowed_origin(origin: str) -> bool:
+    """
+    Exact origin set lookup, then an https + hostname suffix check
+    Runs on every request, so it avoids a regex match
+    """
+    if origin in ALLOWED_ORIGINS_SET:
+        return True
+    
+    parts = urlsplit(origin)
+    return (
+        parts.scheme == "https"
+        and parts.hostname is not None
+        and parts.hostname.endswith(ALLOWED_ORIGIN_SUFFIXES)
+    )
+
+
+class SuffixCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that matches hosting-platform origins by hostname suffix"""
+    def is_allowed_origin(self, origin: str) -> bool:
+        return self.allow_all_origins or is_allowed_origin(origin)
+
 
 app.add_middleware(
-    CORSMiddleware,
+    SuffixCORSMiddleware,
     allow_origins=allowed_origins,
-    allow_origin_regex=allowed_origin_regex,
     allow_credentials=True,  # Set to False if you don't need cookies/auth headers
     allow_methods=["*"],  # Allow all HTTP methods
     allow_headers=["*"],  # Allow all headers
@@ -110,11 +192,11 @@ def root():
 
 
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint"""
     try:
         # Test database connection
-        get_supabase_client()
+        await get_async_supabase_client()
         db_status = "connected"
     except Exception as e:
         db_status = f"disconnected: {str(e)}"
@@ -176,15 +258,32 @@ async def not_found_handler(request, exc):
     )
 
 
-@app.exception_handler(500)
+@app.exception_handler(Exception)
 async def internal_error_handler(request, exc):
-    """Handle 500 errors"""
+    """
+    Handle unexpected errors from any route
+    Routes raise HTTPException for expected failures and let everything
+    else propagate here, so they don't each need a try/except wrapper
+    """
+    # This handler runs outside CORSMiddleware, so add the CORS headers
+    # ourselves or browsers would hide the error body
+    headers = {}
+    origin = request.headers.get("origin")
+    if origin and ("*" in ALLOWED_ORIGINS_SET or is_allowed_origin(origin)):
+        headers = {
+            "Access-Control-Allow-Origin": origin,
+            "Access-Control-Allow-Credentials": "true",
+            "Vary": "Origin"
+        }
+    
     return JSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
-            "message": "Something went wrong. Please try again later or contact support."
-        }
+            "message": "Something went wrong. Please try again later or contact support.",
+            "detail": str(exc)
+        },
+        headers=headers
     )
 
 
@@ -0,0 +1,200 @@
+"""
+Orchestrator Caches
+Response caches for the Singlish translation pipeline and internal API reads
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+import orjson
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional - the semantic cache is disabled without it
+    np = None
+
+SEMANTIC_CACHE_AVAILABLE = np is not None
+
+log = logging.getLogger(__name__)
+
+
+class ExactCache:
+    """
+    Bounded LRU cache keyed on a SHA-256 digest of the input
+    O(1) lookups, checked before any network call
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key(data: bytes) -> bytes:
+        return hashlib.sha256(data).digest()
+
+    def get(self, key: bytes) -> Optional[Any]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: bytes, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class SemanticCache:
+    """
+    Embedding-similarity cache for LLM results
+
+    Embeddings are L2-normalised and stored as rows of one float32 matrix,
+    so a lookup is a single matrix-vector product (cosine similarity).
+    Entries are evicted least-recently-used; an evicted row is zeroed and
+    reused for the next insert.
+    """
+
+    def __init__(self, threshold: float = 0.87, max_entries: int = 10000, dim: int = 1536):
+        if np is None:
+            raise RuntimeError("SemanticCache requires numpy")
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.dim = dim
+        self._matrix = np.zeros((64, dim), dtype=np.float32)
+        self._size = 0  # rows in use (including zeroed, evicted ones)
+        self._free_rows = []
+        # row index -> cached value, oldest first
+        self._entries: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def normalize(vector) -> "np.ndarray":
+        v = np.asarray(vector, dtype=np.float32)
+        norm = np.linalg.norm(v)
+        return v / norm if norm else v
+
+    def lookup(self, vector: "np.ndarray") -> Optional[Dict[str, Any]]:
+        """Best cached value with cosine similarity >= threshold, or None"""
+        if not self._entries:
+            return None
+        scores = self._matrix[:self._size] @ vector
+        row = int(scores.argmax())
+        if scores[row] < self.threshold or row not in self._entries:
+            return None
+        self._entries.move_to_end(row)
+        return self._entries[row]
+
+    def add(self, vector: "np.ndarray", value: Dict[str, Any]) -> None:
+        if len(self._entries) >= self.max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._matrix[evicted] = 0
+            self._free_rows.append(evicted)
+
+        if self._free_rows:
+            row = self._free_rows.pop()
+        else:
+            if self._size == len(self._matrix):
+                # Grow geometrically so inserts stay amortised O(1)
+                grown = np.zeros((len(self._matrix) * 2, self.dim), dtype=np.float32)
+                grown[:self._size] = self._matrix[:self._size]
+                self._matrix = grown
+            row = self._size
+            self._size += 1
+
+        self._matrix[row] = vector
+        self._entries[row] = value
+
+    def clear(self) -> None:
+        self._matrix = np.zeros((64, self.dim), dtype=np.float32)
+        self._size = 0
+        self._free_rows = []
+        self._entries.clear()
+
+    def save(self, path: str) -> None:
+        """Persist to <path>.npy (embeddings) and <path>.json (values)"""
+        rows = list(self._entries.keys())
+        np.save(f"{path}.npy", self._matrix[rows] if rows else np.zeros((0, self.dim), dtype=np.float32))
+        with open(f"{path}.json", "wb") as f:
+            f.write(orjson.dumps(list(self._entries.values())))
+
+    def load(self, path: str) -> None:
+        """Restore a cache written by save(); missing files are ignored"""
+        if not (os.path.exists(f"{path}.npy") and os.path.exists(f"{path}.json")):
+            return
+        vectors = np.load(f"{path}.npy")
+        with open(f"{path}.json", "rb") as f:
+            values = orjson.loads(f.read())
+        self.clear()
+        for vector, value in zip(vectors, values):
+            self.add(vector, value)
+
+
+class StaleWhileRevalidateCache:
+    """
+    Single-value cache in front of a slow async fetch()
+
+    Fresh for ttl seconds. Until stale seconds the old value is still served
+    while one background refresh runs; after that callers wait for the refresh.
+    A failed background refresh keeps the old value until it goes stale.
+    """
+
+    def __init__(self, fetch: Callable[[], Awaitable[Any]], ttl: float = 30.0, stale: float = 300.0):
+        self._fetch = fetch
+        self.ttl = ttl
+        self.stale = stale
+        self._value: Any = None
+        self._fetched_at: Optional[float] = None
+        self._lock = asyncio.Lock()
+        self._refreshing: Set[asyncio.Task] = set()
+
+    async def get(self) -> Any:
+        age = self.age()
+        if age is not None and age < self.ttl:
+            return self._value
+        if age is not None and age < self.stale:
+            if not self._refreshing:
+                task = asyncio.create_task(self._background_refresh())
+                self._refreshing.add(task)
+                task.add_done_callback(self._refreshing.discard)
+            return self._value
+        return await self.refresh()
+
+    def age(self) -> Optional[float]:
+        """Seconds since the value was fetched, or None if never fetched"""
+        if self._fetched_at is None:
+            return None
+        return time.monotonic() - self._fetched_at
+
+    async def refresh(self) -> Any:
+        """Fetch now; concurrent callers share one fetch"""
+        started = time.monotonic()
+        async with self._lock:
+            # Another caller refreshed while we waited for the lock
+            if self._fetched_at is not None and self._fetched_at >= started:
+                return self._value
+            self._value = await self._fetch()
+            self._fetched_at = time.monotonic()
+            return self._value
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as e:
+            log.warning("Background cache refresh failed: %s", e)
+
+    def invalidate(self) -> None:
+        self._fetched_at = None
@@ -4,22 +4,64 @@ Main coordinator and request routing
 Includes Singlish-to-English translation with sentiment analysis
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Literal, Tuple, get_args
+from datetime import datetime, timedelta
+import asyncio
 import base64
+import functools
+import hashlib
 import httpx
-import json
+import logging
+import orjson
 import os
 import re
-import tempfile
-from app.shared.supabase import get_supabase_client
+import string
+import sys
+import time
+from cachetools import TTLCache
+from dotenv import load_dotenv
+from app.shared.http import get_http_client, post_json, response_error_detail, response_json
+from app.orchestrator.cache import ExactCache, SemanticCache, StaleWhileRevalidateCache, SEMANTIC_CACHE_AVAILABLE
+from app.orchestrator.batcher import MicroBatcher, RequestCoalescer
+from app.orchestrator.sentiment import SentimentClassifier, classify_tone, LOCAL_SENTIMENT_AVAILABLE
+from app.orchestrator.vad import is_wav, trim_silence, VAD_AVAILABLE
+from app.safety.routes import reverse_geocode, find_nearest_mrt
 
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:  # rapidfuzz is optional - event names are scored in pure Python without it
+    fuzz = None
 
+# Try to import zoneinfo for timezone handling
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:
+    try:
+        from backports.zoneinfo import ZoneInfo
+    except ImportError:
+        ZoneInfo = None
+
+# Load environment variables (read at import below, e.g. ORCHESTRATOR_INFO)
+load_dotenv()
+
+# Per-request debug output (event matching) - enable with LOG_LEVEL=DEBUG
+log = logging.getLogger(__name__)
+
+
+# API keys, read once - env vars don't change while the process runs
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+
+
+@functools.lru_cache(maxsize=1)
 def get_api_base_url() -> str:
     """
     Get the API base URL for internal service calls.
     Tries to auto-detect from environment or use sensible defaults.
+    Resolved once per process (see reset_env_cache).
     """
     # First, check if explicitly set
     api_url = os.getenv("API_BASE_URL")
@@ -69,48 +111,158 @@ def get_api_base_url() -> str:
     return "http://localhost:8000"
 
 
+def reset_env_cache() -> None:
+    """Re-read the cached environment settings (e.g. after a test changes them)"""
+    global OPENAI_API_KEY, GROQ_API_KEY, ORCHESTRATOR_INFO_JSON
+    global _async_openai_client, _groq_client
+    
+    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+    GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+    # Clients hold the old keys - the getters rebuild them on next use
+    _async_openai_client = _groq_client = None
+    # A different key may have access to other models
+    unavailable_models.clear()
+    get_api_base_url.cache_clear()
+    ORCHESTRATOR_INFO["audio_transcription_available"] = bool(OPENAI_API_KEY)
+    ORCHESTRATOR_INFO["intent_detection_available"] = bool(GROQ_API_KEY)
+    ORCHESTRATOR_INFO_JSON = orjson.dumps(ORCHESTRATOR_INFO)
+
+
 router = APIRouter()
 
 # Initialize OpenAI client lazily (only when needed)
-def get_openai_client():
-    """Get OpenAI client, initializing if needed"""
-    try:
-        from openai import OpenAI
-    except ImportError:
-        # Return 400 instead of 500 to avoid triggering frontend error detection
-        raise HTTPException(
-            status_code=400,
-            detail="Audio transcription requires OpenAI package. Please provide 'transcript' field instead (use frontend speech-to-text)."
-        )
+# Connection pool shared by every OpenAI request - idle connections are kept
+# for 5 minutes so bursty traffic reuses warm TLS sessions, and HTTP/2
+# multiplexes concurrent calls over one connection
+OPENAI_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100, keepalive_expiry=300.0)
+OPENAI_HTTP_TIMEOUT = httpx.Timeout(
+    float(os.getenv("OPENAI_TIMEOUT", "30")),
+    connect=float(os.getenv("OPENAI_CONNECT_TIMEOUT", "5"))
+)
+# The SDK retries connection errors, 429s and 5xx responses with exponential
+# backoff, so transient failures don't reach the user
+OPENAI_MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "3"))
+
+_async_openai_client = None
+
+
+def get_async_openai_client():
+    """
+    Get the shared AsyncOpenAI client, creating it on first use
+    Awaiting its calls keeps Whisper/GPT requests off the event loop
+    """
+    global _async_openai_client
     
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        # Return 400 instead of 500 to avoid triggering frontend error detection
-        raise HTTPException(
-            status_code=400,
-            detail="Audio transcription requires OPENAI_API_KEY. Please provide 'transcript' field instead (use frontend speech-to-text)."
+    if _async_openai_client is None:
+        try:
+            from openai import AsyncOpenAI
+        except ImportError:
+            # Return 400 instead of 500 to avoid triggering frontend error detection
+            raise HTTPException(
+                status_code=400,
+                detail="Audio transcription requires OpenAI package. Please provide 'transcript' field instead (use frontend speech-to-text)."
+            )
+        
+        api_key = OPENAI_API_KEY
+        if not api_key:
+            # Return 400 instead of 500 to avoid triggering frontend error detection
+            raise HTTPException(
+                status_code=400,
+                detail="Audio transcription requires OPENAI_API_KEY. Please provide 'transcript' field instead (use frontend speech-to-text)."
+            )
+        _async_openai_client = AsyncOpenAI(
+            api_key=api_key,
+            max_retries=OPENAI_MAX_RETRIES,
+            http_client=httpx.AsyncClient(limits=OPENAI_HTTP_LIMITS, timeout=OPENAI_HTTP_TIMEOUT, http2=True)
         )
-    return OpenAI(api_key=api_key)
+    
+    return _async_openai_client
+
+
+OPENAI_WARMUP_TIMEOUT = float(os.getenv("OPENAI_WARMUP_TIMEOUT", "5"))
+
+
+async def warm_openai_client() -> None:
+    """
+    Open a pooled connection to OpenAI at startup (DNS, TCP, TLS, HTTP/2)
+    so the first Whisper/GPT request doesn't pay for it. Never raises.
+    """
+    if not OPENAI_API_KEY:
+        return
+    try:
+        client = get_async_openai_client()
+        await asyncio.wait_for(client.models.list(), OPENAI_WARMUP_TIMEOUT)
+        log.info("OpenAI connection warmed")
+    except Exception as e:
+        log.warning("OpenAI warm-up failed: %s", e)
+
+
+def openai_error_status(exc: BaseException) -> Optional[int]:
+    """
+    HTTP status for an OpenAI failure anywhere in the exception chain
+    (the helpers wrap SDK errors), or None if OpenAI wasn't the cause
+    
+    Unavailable (connection errors, rate limits after retries) -> 503,
+    other API errors -> the status OpenAI returned
+    """
+    # openai is imported lazily by the client getters - if it was never
+    # loaded, no OpenAI call can have failed
+    openai = sys.modules.get("openai")
+    if openai is None:
+        return None
+    while exc is not None:
+        if isinstance(exc, (openai.APIConnectionError, openai.RateLimitError)):
+            return 503
+        if isinstance(exc, openai.APIStatusError):
+            return exc.status_code
+        exc = exc.__cause__ or exc.__context__
+    return None
 
 
 # Initialize GROQ client lazily (only when needed)
+_groq_client = None
+
+
 def get_groq_client():
-    """Get GROQ client for fast intent detection"""
+    """
+    Get the async GROQ client for fast intent detection
+    Created on first use and reused, so its connection pool stays warm;
+    awaiting its calls keeps intent detection off the event loop
+    """
+    global _groq_client
+    
+    if _groq_client is not None:
+        return _groq_client
+    
     try:
-        from groq import Groq
+        from groq import AsyncGroq
     except ImportError:
         raise HTTPException(
             status_code=400,
             detail="Intent detection requires GROQ package. Install with: pip install groq"
         )
     
-    api_key = os.getenv("GROQ_API_KEY")
+    api_key = GROQ_API_KEY
     if not api_key:
         raise HTTPException(
             status_code=400,
             detail="Intent detection requires GROQ_API_KEY environment variable."
         )
-    return Groq(api_key=api_key)
+    _groq_client = AsyncGroq(api_key=api_key)
+    return _groq_client
+
+
+def init_groq_client() -> None:
+    """
+    Create the GROQ client at startup so the first message doesn't pay for
+    importing the SDK and building its HTTP pool. Never raises.
+    """
+    if not GROQ_API_KEY:
+        return
+    try:
+        get_groq_client()
+    except HTTPException as e:
+        log.warning("GROQ client unavailable: %s", e.detail)
 
 
 # ==================== REQUEST MODELS ====================
@@ -139,81 +291,106 @@ class SinglishProcessRequest(BaseModel):
     transcript: Optional[str] = None  # Direct text transcript
 
 
+class SinglishBatchRequest(BaseModel):
+    """Transcripts to translate offline through the OpenAI Batch API"""
+    user_id: str
+    transcripts: List[str]
+
+
+# Fixed label sets the translation prompts ask for ("unknown" marks an
+# unparseable LLM reply). Other labels from the LLM are mapped to the default.
+Sentiment = Literal["positive", "negative", "neutral", "happy", "excited", "surprised", "frustrated", "angry", "sad", "unknown"]
+Tone = Literal["casual", "informal", "polite", "formal", "urgent", "annoyed", "sarcastic", "aggressive", "unknown"]
+SENTIMENT_LABELS = frozenset(get_args(Sentiment))
+TONE_LABELS = frozenset(get_args(Tone))
+
+
+class SinglishProcessResponse(BaseModel):
+    """Result of Singlish processing"""
+    success: bool
+    user_id: str
+    singlish_raw: str
+    clean_english: str
+    sentiment: Sentiment
+    tone: Tone
+
+
 # ==================== ENDPOINTS ====================
 
+# Static module info, serialized once at import - env vars are loaded by then
+ORCHESTRATOR_INFO = {
+    "module": "Orchestrator",
+    "description": "Main coordinator and request routing agent",
+    "capabilities": [
+        "Natural language understanding",
+        "Intent classification (GROQ-powered for speed)",
+        "Request routing to specialized modules",
+        "Conversation management",
+        "Voice message processing",
+        "Automatic action execution"
+    ],
+    "endpoints": {
+        "message": "/api/orchestrator/message",
+        "voice": "/api/orchestrator/voice",
+        "voice_upload": "/api/orchestrator/voice/upload",
+        "process_singlish": "/api/orchestrator/process-singlish",
+        "process_singlish_stream": "/api/orchestrator/process-singlish/stream",
+        "process_singlish_upload": "/api/orchestrator/process-singlish/upload",
+        "history": "/api/orchestrator/history/{user_id}"
+    },
+    "status": "ready",
+    "voice_processing_available": True,  # Always available with transcript-based processing
+    "audio_transcription_available": bool(OPENAI_API_KEY),  # Requires OPENAI_API_KEY
+    "intent_detection_available": bool(GROQ_API_KEY),  # Requires GROQ_API_KEY
+    "intent_detection_note": "Intent detection uses GROQ (Llama 3.1) for ultra-fast inference. Requires GROQ_API_KEY.",
+    "voice_processing_note": "Voice processing works with transcripts (frontend speech-to-text). Audio transcription requires OPENAI_API_KEY."
+}
+ORCHESTRATOR_INFO_JSON = orjson.dumps(ORCHESTRATOR_INFO)
+
+
 @router.get("/")
-def orchestrator_info():
+async def orchestrator_info():
     """Get information about the Orchestrator module"""
-    # Voice processing is always available with transcripts (frontend speech-to-text)
-    # Audio transcription (backend Whisper) requires OPENAI_API_KEY
-    audio_transcription_available = False
-    intent_detection_available = False
-    try:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if api_key:
-            audio_transcription_available = True
-    except:
-        pass
-    
-    try:
-        groq_key = os.getenv("GROQ_API_KEY")
-        if groq_key:
-            intent_detection_available = True
-    except:
-        pass
-    
-    return {
-        "module": "Orchestrator",
-        "description": "Main coordinator and request routing agent",
-        "capabilities": [
-            "Natural language understanding",
-            "Intent classification (GROQ-powered for speed)",
-            "Request routing to specialized modules",
-            "Conversation management",
-            "Voice message processing",
-            "Automatic action execution"
-        ],
-        "endpoints": {
-            "message": "/api/orchestrator/message",
-            "voice": "/api/orchestrator/voice",
-            "process_singlish": "/api/orchestrator/process-singlish",
-            "history": "/api/orchestrator/history/{user_id}"
-        },
-        "status": "ready",
-        "voice_processing_available": True,  # Always available with transcript-based processing
-        "audio_transcription_available": audio_transcription_available,  # Requires OPENAI_API_KEY
-        "intent_detection_available": intent_detection_available,  # Requires GROQ_API_KEY
-        "intent_detection_note": "Intent detection uses GROQ (Llama 3.1) for ultra-fast inference. Requires GROQ_API_KEY.",
-        "voice_processing_note": "Voice processing works with transcripts (frontend speech-to-text). Audio transcription requires OPENAI_API_KEY."
-    }
+    return Response(content=ORCHESTRATOR_INFO_JSON, media_type="application/json")
+
 
+def keyword_pattern(keywords: List[str]) -> "re.Pattern":
+    """
+    Compile keywords into one alternation regex - a single C-level pass over
+    the message instead of one substring scan per keyword
+    """
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+# Strong emergency keywords (always emergency)
+EMERGENCY_KEYWORDS_RE = keyword_pattern([
+    "emergency", "sos", "urgent", "danger", "accident",
+    "injured", "hurt", "pain", "rescue", "ambulance",
+    "hospital", "911", "999", "need assistance"
+])
+# "help" next to one of these is about events, not an emergency
+EVENT_OPERATION_RE = keyword_pattern([
+    "event", "register", "cancel", "remove", "book", "unregister",
+    "join", "leave", "withdraw", "delete", "update", "change", "booking"
+])
 
-def detect_emergency_intent(text: str) -> bool:
+
+def detect_emergency_intent(text: str, message_lower: Optional[str] = None) -> bool:
     """
     Detect if message contains emergency intent keywords
     "help" is emergency UNLESS it's about events/booking
+    Pass message_lower if the caller already has text.lower()
     """
-    message_lower = text.lower()
-    
-    # Strong emergency keywords (always emergency)
-    strong_emergency_keywords = [
-        "emergency", "sos", "urgent", "danger", "accident",
-        "injured", "hurt", "pain", "rescue", "ambulance", 
-        "hospital", "911", "999", "need assistance"
-    ]
+    if message_lower is None:
+        message_lower = text.lower()
     
     # Check for strong emergency keywords first
-    if any(keyword in message_lower for keyword in strong_emergency_keywords):
+    if EMERGENCY_KEYWORDS_RE.search(message_lower):
         return True
     
     # Check if "help" appears with event-related words (not emergency)
-    event_operation_words = [
-        "event", "register", "cancel", "remove", "book", "unregister",
-        "join", "leave", "withdraw", "delete", "update", "change", "booking"
-    ]
-    
     has_help = "help" in message_lower
-    has_event_operation = any(word in message_lower for word in event_operation_words)
+    has_event_operation = has_help and EVENT_OPERATION_RE.search(message_lower) is not None
     
     # If "help" appears with event operations, it's NOT an emergency
     if has_help and has_event_operation:
@@ -223,6 +400,63 @@ def detect_emergency_intent(text: str) -> bool:
     return has_help
 
 
+# Unambiguous emergency words, matched as whole words - the only messages
+# that skip GROQ (a bare "help" or "pain" in "painting" must not)
+OBVIOUS_EMERGENCY_RE = re.compile(r"\b(sos|ambulance|emergency|911|999)\b")
+
+
+def is_obvious_emergency(message_lower: str) -> bool:
+    """
+    Whether a lowercased message is an SOS without asking GROQ
+    Narrower than the keyword fallback: whole-word emergency terms only,
+    and never alongside an event operation ("cancel the emergency first aid event")
+    """
+    return (
+        OBVIOUS_EMERGENCY_RE.search(message_lower) is not None
+        and EVENT_OPERATION_RE.search(message_lower) is None
+    )
+
+
+def keyword_intent(message_lower: str) -> Dict[str, Any]:
+    """
+    Simple keyword intent detection on the lowercased message
+    IMPORTANT: Checks cancel/book/list BEFORE emergency to avoid false positives
+    ("cancel my painting class" is never an SOS)
+    """
+    # Check for cancel/unregister FIRST (before emergency check)
+    if CANCEL_KEYWORDS_RE.search(message_lower):
+        return {"intent": "cancel_event", "confidence": 0.7}
+    elif BOOK_KEYWORDS_RE.search(message_lower):
+        return {"intent": "book_event", "confidence": 0.7}
+    elif LIST_KEYWORDS_RE.search(message_lower):
+        return {"intent": "list_events", "confidence": 0.7}
+    elif detect_emergency_intent(message_lower, message_lower):
+        # Only check emergency after we've ruled out event operations
+        return {"intent": "emergency", "confidence": 0.8}
+    else:
+        return {"intent": "general", "confidence": 0.5}
+
+
+HEX_CHARS = frozenset("0123456789abcdefABCDEF")
+
+# Event name normalization, built once: one str.translate pass turns dashes
+# and '_' into spaces and drops other punctuation, then a plain split()
+WORD_SEPARATORS = "-_–—"
+NORMALIZE_TABLE = str.maketrans({
+    **{c: None for c in string.punctuation + "‘’“”…•·"},
+    **{c: " " for c in WORD_SEPARATORS}
+})
+LEADING_ARTICLES = frozenset({'the', 'a', 'an', 'my'})
+LEADING_ARTICLE_RE = re.compile(r'^(the|a|an|my)\s+', re.IGNORECASE)
+# Words in the user's phrase that usually aren't part of the event title
+EVENT_WORDS = frozenset({'event', 'class', 'session', 'activity', 'lesson', 'workshop', 'meeting', 'gathering', 'registration'})
+EVENT_WORDS_RE = re.compile(r'\b(' + '|'.join(sorted(EVENT_WORDS)) + r')\b', re.IGNORECASE)
+STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'my'})
+
+# "Ang Mo Kio MRT" etc. in a free-text location
+MRT_NAME_RE = re.compile(r'([A-Za-z\s]+MRT)', re.IGNORECASE)
+
+
 def validate_and_get_uuid(value: Any) -> Optional[str]:
     """
     Safely validate and return a UUID string, or None if invalid.
@@ -232,19 +466,42 @@ def validate_and_get_uuid(value: Any) -> Optional[str]:
         return None
     
     value_str = str(value).strip()
-    uuid_pattern = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
     
-    # Strict validation: must be exactly 36 chars with 4 hyphens
-    if (uuid_pattern.match(value_str) and 
-        len(value_str) == 36 and 
-        value_str.count('-') == 4):
+    # Strict validation: canonical 8-4-4-4-12 hex form only
+    # (uuid.UUID is laxer - it takes braces, "urn:uuid:", "+" and "_")
+    if (len(value_str) == 36 and
+            value_str[8] == value_str[13] == value_str[18] == value_str[23] == '-' and
+            value_str.count('-') == 4 and
+            HEX_CHARS.issuperset(value_str.replace('-', ''))):
         return value_str
     
     # Reject anything that's not a valid UUID (including "1", numbers, etc.)
     return None
 
 
-def find_event_by_name_or_id(events: list, event_name: Optional[str] = None, event_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+# Minimum rapidfuzz token_set_ratio for a confident event-name match - 100
+# when every search word is a title word, so near-misses go to the scoring below
+EVENT_MATCH_CUTOFF = 90
+
+
+def normalize_words(text: str) -> List[str]:
+    """Lowercase words of text with punctuation removed (dashes and '_' split words)"""
+    return text.lower().translate(NORMALIZE_TABLE).split()
+
+
+def normalize_title(title: str) -> Tuple[str, Tuple[str, ...]]:
+    """Normalized event title (lowercase, single spaces, no punctuation) and its words"""
+    words = normalize_words(title)
+    return " ".join(words), tuple(words)
+
+
+def find_event_by_name_or_id(
+    events: list,
+    event_name: Optional[str] = None,
+    event_id: Optional[str] = None,
+    title_norms: Optional[Dict[str, Tuple[str, Tuple[str, ...]]]] = None,
+    by_id: Optional[Dict[str, Dict[str, Any]]] = None
+) -> Optional[Dict[str, Any]]:
     """
     Find an event by name or ID with improved matching logic.
     Returns the best matching event or None.
@@ -253,6 +510,9 @@ def find_event_by_name_or_id(events: list, event_name: Optional[str] = None, eve
         events: List of event dictionaries
         event_name: Event name to search for (case-insensitive, partial matching)
         event_id: Event ID (UUID) to search for
+        title_norms: Precomputed normalize_title() results by event ID
+            (titles missing from it are normalized on the fly)
+        by_id: Precomputed events by ID (events are scanned without it)
     
     Returns:
         Event dictionary if found, None otherwise
@@ -263,7 +523,11 @@ def find_event_by_name_or_id(events: list, event_name: Optional[str] = None, eve
     # First, try to find by ID if provided and valid
     if event_id:
         validated_id = validate_and_get_uuid(event_id)
-        if validated_id:
+        if validated_id and by_id is not None:
+            event = by_id.get(validated_id)
+            if event is not None:
+                return event
+        elif validated_id:
             for event in events:
                 event_uuid = validate_and_get_uuid(event.get("id"))
                 if event_uuid and event_uuid == validated_id:
@@ -274,23 +538,25 @@ def find_event_by_name_or_id(events: list, event_name: Optional[str] = None, eve
         return None
     
     # Normalize search name (remove extra spaces, lowercase, remove punctuation)
-    normalized_search = re.sub(r'[\s\-_]+', ' ', event_name.lower().strip())
-    normalized_search = re.sub(r'[^\w\s]', '', normalized_search)
+    words = normalize_words(event_name)
     # Remove common articles and prepositions at the start
-    normalized_search = re.sub(r'^(the|a|an|my)\s+', '', normalized_search, flags=re.IGNORECASE).strip()
+    if words and words[0] in LEADING_ARTICLES:
+        words = words[1:]
     # Remove common event-related words that aren't part of the actual event name
     # These words might appear in user's phrase but not in event titles
-    normalized_search = re.sub(r'\b(event|class|session|activity|lesson|workshop|meeting|gathering|registration)\b', '', normalized_search, flags=re.IGNORECASE).strip()
+    words = [w for w in words if w not in EVENT_WORDS]
+    normalized_search = " ".join(words)
     # Filter out short words and common stop words
-    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'my'}
-    search_words = [w for w in normalized_search.split() if len(w) > 2 and w not in stop_words]
+    search_words = [w for w in words if len(w) > 2 and w not in STOP_WORDS]
     
     if not search_words:
         return None
     
-    best_match = None
-    best_score = 0.0
+    if title_norms is None:
+        title_norms = {}
     
+    # Normalized titles of the candidates with a valid UUID and a title
+    candidates = []
     for event in events:
         # Validate event has valid UUID
         event_uuid = validate_and_get_uuid(event.get("id"))
@@ -301,11 +567,26 @@ def find_event_by_name_or_id(events: list, event_name: Optional[str] = None, eve
         if not event_title:
             continue
         
-        # Normalize event title
-        normalized_title = re.sub(r'[\s\-_]+', ' ', event_title.lower().strip())
-        normalized_title = re.sub(r'[^\w\s]', '', normalized_title)
-        title_words = normalized_title.split()
-        
+        normalized_title, title_words = title_norms.get(event_uuid) or normalize_title(event_title)
+        candidates.append((event, normalized_title, title_words))
+    
+    # Fast path: score every title in one C call; only uncertain names fall
+    # through to the word-by-word scoring
+    if fuzz is not None and candidates:
+        match = fuzz_process.extractOne(
+            normalized_search,
+            [normalized_title for _, normalized_title, _ in candidates],
+            scorer=fuzz.token_set_ratio,
+            processor=None,
+            score_cutoff=EVENT_MATCH_CUTOFF
+        )
+        if match:
+            return candidates[match[2]][0]
+    
+    best_match = None
+    best_score = 0.0
+    
+    for event, normalized_title, title_words in candidates:
         # Calculate match score
         score = 0.0
         
@@ -345,16 +626,7 @@ def find_event_by_name_or_id(events: list, event_name: Optional[str] = None, eve
     # If no match above threshold, try a more lenient match: check if any search word is in the title
     # This handles cases like "swimming class" → "Swimming" where "swimming" matches
     if search_words and not best_match:
-        for event in events:
-            event_uuid = validate_and_get_uuid(event.get("id"))
-            if not event_uuid:
-                continue
-            
-            event_title = event.get("title", "").strip()
-            if not event_title:
-                continue
-            
-            normalized_title = event_title.lower()
+        for event, normalized_title, _ in candidates:
             # Check if any search word is in the title (simple substring match)
             for search_word in search_words:
                 if search_word in normalized_title:
@@ -364,50 +636,156 @@ def find_event_by_name_or_id(events: list, event_name: Optional[str] = None, eve
     return None
 
 
-async def detect_intent_and_extract_info(user_message: str, user_id: str) -> Dict[str, Any]:
+# Minimum rapidfuzz token_set_ratio for an event title to be suggested
+EVENT_SUGGESTION_CUTOFF = 60
+
+
+def suggest_event_titles(
+    events: list,
+    event_name: Optional[str],
+    title_norms: Optional[Dict[str, Tuple[str, Tuple[str, ...]]]] = None,
+    limit: int = 3
+) -> List[str]:
     """
-    Use GROQ (Llama 3.1) to intelligently detect user intent and extract relevant information
-    Returns intent type and extracted parameters
-    Falls back to simple keyword detection if GROQ is not available
+    Titles of up to limit events resembling event_name, best first
+    
+    Uses rapidfuzz token-set scoring over all events when installed,
+    otherwise titles among the first 5 events sharing a word (4+ letters)
+    """
+    words = normalize_words(event_name or "")
+    if not words:
+        return []
+    if title_norms is None:
+        title_norms = {}
+    
+    def title_norm(event: Dict[str, Any]) -> Tuple[str, Tuple[str, ...]]:
+        return title_norms.get(str(event.get("id", "")).strip()) or normalize_title(event.get("title") or "")
+    
+    if fuzz is not None:
+        matches = fuzz_process.extract(
+            " ".join(words),
+            [title_norm(event)[0] for event in events],
+            scorer=fuzz.token_set_ratio,
+            processor=None,
+            limit=limit,
+            score_cutoff=EVENT_SUGGESTION_CUTOFF
+        )
+        return [events[index].get("title") for _, _, index in matches]
+    
+    tokens = {word for word in words if len(word) > 3}
+    suggestions = []
+    for event in events[:5]:
+        if not tokens.isdisjoint(title_norm(event)[1]):
+            suggestions.append(event.get("title"))
+    return suggestions[:limit]
+
+
+# Keyword fallback for intent detection (substring matches on the lowercased message)
+CANCEL_KEYWORDS_RE = keyword_pattern(["cancel", "unregister", "remove", "leave", "withdraw", "delete"])
+BOOK_KEYWORDS_RE = keyword_pattern(["book", "register", "join", "sign up", "enroll"])
+LIST_KEYWORDS_RE = keyword_pattern(["list", "show", "find", "what events", "available"])
+
+
+# ==================== EVENTS LIST CACHE ====================
+
+# One internal /api/events/list call serves intent detection and every event
+# action; callers slice what they need. Event lists change over minutes, so
+# a 30s-old list is fine and up to 5 minutes is served while refreshing.
+EVENTS_CACHE_LIMIT = 50
+EVENTS_CACHE_TTL = 30.0
+EVENTS_CACHE_STALE = 300.0
+
+
+# normalize_title() of each cached event by ID, rebuilt with the list so
+# find_event_by_name_or_id doesn't re-normalize titles on every message
+event_title_norms: Dict[str, Tuple[str, Tuple[str, ...]]] = {}
+# The cached events by ID, for direct event_id lookups
+events_by_id: Dict[str, Dict[str, Any]] = {}
+# ETag of the last fetched list and the list itself - refreshes send it as
+# If-None-Match, and a 304 reuses the list without transferring or decoding it
+events_list_etag: Optional[str] = None
+events_list_last: list = []
+
+
+async def fetch_events_list() -> list:
+    global event_title_norms, events_by_id, events_list_etag, events_list_last
+    
+    base_url = get_api_base_url()
+    headers = {"If-None-Match": events_list_etag} if events_list_etag else None
+    response = await get_http_client().get(
+        f"{base_url}/api/events/list?limit={EVENTS_CACHE_LIMIT}",
+        headers=headers,
+        timeout=10.0
+    )
+    if response.status_code == 304:
+        return events_list_last
+    response.raise_for_status()
+    # Drop events with invalid IDs once here rather than in every caller
+    events = [event for event in response_json(response).get("events", []) if validate_and_get_uuid(event.get("id"))]
+    events_by_id = {event["id"].strip(): event for event in events}
+    event_title_norms = {
+        event_id: normalize_title(event.get("title") or "")
+        for event_id, event in events_by_id.items()
+    }
+    events_list_etag = response.headers.get("etag")
+    events_list_last = events
+    return events
+
+
+events_cache = StaleWhileRevalidateCache(fetch_events_list, ttl=EVENTS_CACHE_TTL, stale=EVENTS_CACHE_STALE)
+
+
+async def get_events_cached() -> Optional[list]:
+    """
+    Events list (up to EVENTS_CACHE_LIMIT, date order) from the stale-while-revalidate cache
+    Returns None if it can't be fetched and nothing usable is cached
     """
     try:
-        # Try to get GROQ client - if not available, fall back to keyword detection
-        try:
-            client = get_groq_client()
-        except HTTPException:
-            # GROQ not available - fall through to keyword detection
-            raise Exception("GROQ not available - using fallback")
-        
-        # Get available events to help GPT understand context
-        available_events = []
-        try:
-            base_url = get_api_base_url()
-            async with httpx.AsyncClient(timeout=10.0) as http_client:
-                events_response = await http_client.get(f"{base_url}/api/events/list?limit=10")
-                if events_response.status_code == 200:
-                    events_data = events_response.json()
-                    available_events = events_data.get("events", [])
-        except (httpx.ConnectError, httpx.ConnectTimeout, ValueError) as e:
-            # Connection failed - log but continue without events context
-            print(f"Warning: Could not fetch events for context: {str(e)}")
-            pass  # Continue without events if fetch fails
-        except Exception as e:
-            # Other errors - also continue
-            print(f"Warning: Error fetching events: {str(e)}")
-            pass
-        
-        events_context = ""
-        if available_events:
-            events_list = "\n".join([
-                f"- ID: {e.get('id')}, Title: {e.get('title')}, Date: {e.get('date')}"
-                for e in available_events[:10]
-            ])
-            events_context = f"\n\nAvailable Events:\n{events_list}"
-        
-        prompt = f"""You are an intelligent assistant that understands user requests and extracts actionable information.
+        return await events_cache.get()
+    except (httpx.HTTPError, ValueError) as e:
+        log.warning("Could not fetch events list: %s", e)
+        return None
+
+
+# event_id -> event from /api/events/{id}, for the get_event details
+event_details_cache: TTLCache = TTLCache(maxsize=256, ttl=EVENTS_CACHE_TTL)
+
 
-User message: "{user_message}"
-User ID: {user_id}{events_context}
+async def get_event_details_cached(event_id: str) -> Optional[Dict[str, Any]]:
+    """Full event details, or None if the event can't be fetched"""
+    event = event_details_cache.get(event_id)
+    if event is not None:
+        return event
+    
+    try:
+        response = await get_http_client().get(f"{get_api_base_url()}/api/events/{event_id}")
+        if response.status_code != 200:
+            return None
+        event = response_json(response).get("event")
+    except (httpx.HTTPError, ValueError) as e:
+        log.warning("Could not fetch event %s: %s", event_id, e)
+        return None
+    if event:
+        event_details_cache[event_id] = event
+    return event
+
+
+def invalidate_events_cache(event_id: Optional[str] = None) -> None:
+    """Drop the cached events list (and the given event) after a registration change"""
+    events_cache.invalidate()
+    if event_id:
+        event_details_cache.pop(event_id, None)
+
+
+# Events in the intent prompt are identified by this many leading UUID characters
+EVENT_ID_PREFIX = 8
+
+# Static intent-detection instructions - sent as the system message so the
+# identical prefix is reused across requests; only the user's message and a
+# compact events list change per call
+INTENT_SYSTEM_PROMPT = """You are an intent detection expert that understands user requests and extracts actionable information. Always respond with valid JSON only, no markdown.
+
+The user turn gives the user's message and the available events as a JSON list of [id, title, date].
 
 Analyze the user's intent and extract relevant information. Possible intents:
 1. "emergency" - User needs emergency help/SOS (CRITICAL: Only use this for actual emergencies)
@@ -434,14 +812,14 @@ CRITICAL RULES for event-related intents (book_event, get_event, cancel_event, u
    - REMOVE generic words: "event", "class", "session", "activity", "lesson", "workshop" unless they're part of the actual event name
    - REMOVE articles: "the", "a", "an", "my"
    - Extract the CORE event name - the unique identifier word(s)
-3. event_id: ONLY use the exact UUID from the available events list if you can MATCH the event_name to a specific event in the list. Otherwise use null.
+3. event_id: ONLY use the exact id from the events list if you can MATCH the event_name to a specific event in the list. Otherwise use null.
 4. Match event names intelligently:
    - "pickleball" should match "Pickleball Tournament"
    - "yoga" should match "Yoga Class" or "Yoga"
    - "swimming" should match "Swimming" (even if user says "swimming class")
    - "workout" should match "Workout" or "Morning Workout Session"
    - Use partial matching - if user says part of the event name, extract that part
-5. DO NOT make up UUIDs or use numbers like "1" - only use actual UUIDs from the events list
+5. DO NOT make up ids or use numbers like "1" - only use actual ids from the events list
 6. If user mentions multiple events or is unclear, set event_id to null but still extract event_name
 7. IMPORTANT: When extracting event_name, remove leading articles ("the", "a", "an", "my") and generic event words ("event", "class", "session")
 
@@ -450,87 +828,148 @@ For "general" intent:
 - Use for general conversation that doesn't match other intents
 
 Respond ONLY with valid JSON (no markdown):
-{{
+{
     "intent": "intent_type",
-    "event_id": "exact-uuid-from-events-list-or-null",
+    "event_id": "exact-id-from-events-list-or-null",
     "event_name": "extracted-event-name-or-null",
     "event_date": "YYYY-MM-DD-or-null",
     "confidence": 0.0-1.0
-}}"""
+}"""
+
+
+# Intent detection tries the fast model first and only escalates when needed
+INTENT_MODEL = "llama-3.1-8b-instant"
+INTENT_ESCALATION_MODEL = "llama-3.1-70b-versatile"
+INTENT_MIN_CONFIDENCE = 0.7
+EVENT_INTENTS = frozenset({"book_event", "register_event", "get_event", "cancel_event", "unregister_event"})
+
+
+async def request_intent(client, model: str, user_content: str, id_by_prefix: Dict[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    Ask a GROQ model for the intent JSON
+    Returns the parsed object (event_id mapped back from its short prefix to
+    the full UUID), or None if the reply isn't a JSON object
+    """
+    response = await client.chat.completions.create(
+        model=model,
+        messages=[
+            {
+                "role": "system",
+                "content": INTENT_SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": user_content
+            }
+        ],
+        temperature=0.3,
+        max_tokens=300,
+        response_format={"type": "json_object"}  # Force JSON output for better reliability
+    )
+    # response_format=json_object guarantees bare JSON - anything else is a failed reply
+    try:
+        result = orjson.loads(response.choices[0].message.content)
+    except orjson.JSONDecodeError:
+        return None
+    if not isinstance(result, dict):
+        return None
+    
+    # Unknown IDs become None rather than a made-up UUID
+    if isinstance(result.get("event_id"), str):
+        result["event_id"] = id_by_prefix.get(result["event_id"].strip()[:EVENT_ID_PREFIX])
+    return result
+
+
+def needs_escalation(result: Optional[Dict[str, Any]], has_events: bool) -> bool:
+    """Whether the small model's intent should be redone with the larger one"""
+    if result is None:
+        return True
+    try:
+        confidence = float(result.get("confidence", 0))
+    except (TypeError, ValueError):
+        confidence = 0.0
+    if confidence < INTENT_MIN_CONFIDENCE:
+        return True
+    # An event intent without an ID when there were events to pick from
+    return has_events and result.get("intent") in EVENT_INTENTS and not result.get("event_id")
 
+
+async def detect_intent_and_extract_info(
+    user_message: str,
+    user_id: str,
+    message_lower: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Use GROQ (Llama 3.1) to intelligently detect user intent and extract relevant information
+    Returns intent type and extracted parameters
+    Falls back to simple keyword detection if GROQ is not available
+    Pass message_lower if the caller already has user_message.lower()
+    """
+    if message_lower is None:
+        message_lower = user_message.lower()
+    
+    # Obvious emergencies skip the events fetch and GROQ round-trip entirely
+    if is_obvious_emergency(message_lower):
+        return {"intent": "emergency", "confidence": 0.95}
+    
+    try:
+        # Try to get GROQ client - if not available, fall back to keyword detection
         try:
-            # Use Llama 3.1 70B for intent detection (fast and accurate)
-            model = "llama-3.1-70b-versatile"
-            response = client.chat.completions.create(
-                model=model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an intent detection expert. Always respond with valid JSON only, no markdown."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.3,
-                max_tokens=300,
-                response_format={"type": "json_object"}  # Force JSON output for better reliability
-            )
-        except Exception as e:
-            # Fallback to Llama 3.1 8B if 70B is unavailable
-            try:
-                model = "llama-3.1-8b-instant"
-                response = client.chat.completions.create(
-                    model=model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an intent detection expert. Always respond with valid JSON only, no markdown."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    temperature=0.3,
-                    max_tokens=300,
-                    response_format={"type": "json_object"}
-                )
-            except Exception as e2:
-                # If both fail, raise the original error
-                raise e
+            client = get_groq_client()
+        except HTTPException:
+            # GROQ not available - fall through to keyword detection
+            raise Exception("GROQ not available - using fallback")
         
-        result_text = response.choices[0].message.content.strip()
+        # Get available events to help GPT understand context
+        # (continue without events if the fetch fails)
+        # One pass builds the prompt lines and a lowercase title index for
+        # matching the extracted event_name afterwards
+        # Events go in as [short id, title, date] - the 8-character ID prefix
+        # costs a fraction of a UUID's tokens and is mapped back afterwards
+        context_events = []
+        title_index = {}
+        id_by_prefix = {}
+        for e in (await get_events_cached() or [])[:10]:
+            event_id = e.get("id")
+            context_events.append((event_id[:EVENT_ID_PREFIX], e.get("title"), e.get("date")))
+            title_index.setdefault((e.get("title") or "").lower(), e)
+            id_by_prefix.setdefault(event_id[:EVENT_ID_PREFIX], event_id)
+        events_json = orjson.dumps(context_events).decode()
         
-        # Remove markdown if present (shouldn't happen with response_format, but handle it anyway)
-        if result_text.startswith("```"):
-            result_text = result_text.split("```")[1]
-            if result_text.startswith("json"):
-                result_text = result_text[4:]
-            result_text = result_text.strip()
+        user_content = f'User message: "{user_message}"\nEvents: {events_json}'
         
-        # Parse JSON response (GROQ with response_format should return clean JSON)
+        # The small model handles most messages; escalate to 70B when it
+        # fails, is unsure, or names an event it couldn't pin to the list
+        result = None
         try:
-            result = json.loads(result_text)
-        except json.JSONDecodeError:
-            # If JSON parsing fails, try to extract JSON from text
-            # This handles cases where the model adds extra text
-            import re
-            json_match = re.search(r'\{[^{}]*\}', result_text, re.DOTALL)
-            if json_match:
-                result = json.loads(json_match.group())
-            else:
-                raise ValueError(f"Could not parse JSON from GROQ response: {result_text}")
+            result = await request_intent(client, INTENT_MODEL, user_content, id_by_prefix)
+        except Exception as e:
+            log.warning("GROQ %s failed: %s, escalating to %s", INTENT_MODEL, e, INTENT_ESCALATION_MODEL)
+        
+        if needs_escalation(result, has_events=bool(context_events)):
+            try:
+                escalated = await request_intent(client, INTENT_ESCALATION_MODEL, user_content, id_by_prefix)
+                if escalated is not None:
+                    result = escalated
+            except Exception:
+                # Keep the small model's answer if there is one
+                if result is None:
+                    raise
+        
+        if result is None:
+            # Goes straight to the keyword fallback below
+            raise ValueError("Could not parse JSON from GROQ response")
         
         # If event_id not found but event_name is, try to match with available events
-        if result.get("intent") in ["book_event", "register_event", "get_event", "cancel_event", "unregister_event"]:
-            if not result.get("event_id") and result.get("event_name") and available_events:
+        if result.get("intent") in EVENT_INTENTS:
+            if not result.get("event_id") and result.get("event_name") and title_index:
                 event_name_lower = result.get("event_name", "").lower()
-                for event in available_events:
-                    if event_name_lower in event.get("title", "").lower():
-                        result["event_id"] = event.get("id")
-                        break
+                # Exact title first, then the first title containing the name
+                event = title_index.get(event_name_lower) or next(
+                    (e for title, e in title_index.items() if event_name_lower in title), None
+                )
+                if event:
+                    result["event_id"] = event.get("id")
         
         return result
         
@@ -544,29 +983,57 @@ Respond ONLY with valid JSON (no markdown):
         pass
     
     # Fallback to simple keyword detection (used when GROQ is not available or fails)
-    # IMPORTANT: Check cancel_event BEFORE emergency to avoid false positives
-    message_lower = user_message.lower()
-    
-    # Check for cancel/unregister FIRST (before emergency check)
-    if any(word in message_lower for word in ["cancel", "unregister", "remove", "leave", "withdraw", "delete"]):
-        return {"intent": "cancel_event", "confidence": 0.7}
-    elif any(word in message_lower for word in ["book", "register", "join", "sign up", "enroll"]):
-        return {"intent": "book_event", "confidence": 0.7}
-    elif any(word in message_lower for word in ["list", "show", "find", "what events", "available"]):
-        return {"intent": "list_events", "confidence": 0.7}
-    elif detect_emergency_intent(user_message):
-        # Only check emergency after we've ruled out event operations
-        return {"intent": "emergency", "confidence": 0.8}
-    else:
-        return {"intent": "general", "confidence": 0.5}
+    return keyword_intent(message_lower)
 
 
-@router.post("/message")
-async def process_message(request: TextMessage):
+def event_not_found_message(event_name: str, events: list, no_suggestions: Optional[str] = None) -> str:
     """
-    Process a text message from the user
-    Routes to appropriate module based on intent
-    Automatically executes actions like SOS calls, event booking, etc.
+    Reply for an event name that matched nothing: similar titles if any,
+    otherwise no_suggestions (default: the first few available events)
+    """
+    not_found = f"I couldn't find an event matching '{event_name}'."
+    suggestions = suggest_event_titles(events, event_name, event_title_norms)
+    if suggestions:
+        suggestions_text = "\n".join(f"- {title}" for title in suggestions[:3])
+        return f"{not_found} Did you mean one of these?\n{suggestions_text}"
+    if no_suggestions:
+        return f"{not_found} {no_suggestions}"
+    event_list = "\n".join(f"- {e.get('title')}" for e in events[:3])
+    return f"{not_found} Available events:\n{event_list}"
+
+
+def format_event_details(event: Dict[str, Any]) -> str:
+    """Detailed event message for the get_event intent"""
+    parts = [
+        f"📅 {event.get('title', 'Event')}\n\n",
+        f"Date: {event.get('date', 'TBA')} at {event.get('time', 'TBA')}\n",
+        f"Location: {event.get('location', 'TBA')}\n"
+    ]
+    if event.get('max_participants'):
+        parts.append(f"Max Participants: {event['max_participants']}\n")
+    parts.append(f"\nDescription: {event.get('description', 'No description available')}")
+    return "".join(parts)
+
+
+# A slow geocoding service must not hold up an emergency call
+SOS_LOOKUP_TIMEOUT = 5.0
+
+
+async def bounded_lookup(coro, timeout: float = SOS_LOOKUP_TIMEOUT) -> Optional[str]:
+    """Await a location lookup with a deadline; None if it times out or fails"""
+    try:
+        return await asyncio.wait_for(coro, timeout)
+    except Exception as e:
+        log.warning("Location lookup failed: %r", e)
+        return None
+
+
+@router.post("/message")
+async def process_message(request: TextMessage):
+    """
+    Process a text message from the user
+    Routes to appropriate module based on intent
+    Automatically executes actions like SOS calls, event booking, etc.
     """
     action_executed = False
     action_result = None
@@ -587,9 +1054,12 @@ async def process_message(request: TextMessage):
             "error": str(e)
         }
     
+    # Lowercased once for every keyword check below
+    message_lower = request.message.lower()
+    
     # Use GPT to detect intent and extract information
     try:
-        intent_data = await detect_intent_and_extract_info(request.message, request.user_id)
+        intent_data = await detect_intent_and_extract_info(request.message, request.user_id, message_lower)
         intent = intent_data.get("intent", "general")
     except HTTPException:
         # Re-raise HTTPExceptions (they're already properly formatted)
@@ -598,7 +1068,7 @@ async def process_message(request: TextMessage):
         # Fallback to simple detection if GPT fails
         error_msg = str(e)
         print(f"Warning: Intent detection failed, using fallback: {error_msg}")
-        if detect_emergency_intent(request.message):
+        if detect_emergency_intent(request.message, message_lower):
             intent = "emergency"
         else:
             intent = "general"
@@ -606,557 +1076,493 @@ async def process_message(request: TextMessage):
     
     # Execute actions based on intent
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            if intent == "emergency":
-                # Automatically trigger SOS call with same logic as SOS button
-                import os
-                from twilio.rest import Client as TwilioClient
-                
-                # Use same emergency call logic as SOS button
-                emergency_number = "+6598631975"
-                from_number = os.getenv("TWILIO_PHONE_NUMBER")
-                
-                if from_number:
-                    try:
-                        account_sid = os.getenv("TWILIO_ACCOUNT_SID")
-                        auth_token = os.getenv("TWILIO_AUTH_TOKEN")
+        client = get_http_client()
+        if intent == "emergency":
+            # Automatically trigger SOS call with same logic as SOS button
+            from twilio.rest import Client as TwilioClient
+            
+            # Use same emergency call logic as SOS button
+            emergency_number = "+6598631975"
+            from_number = os.getenv("TWILIO_PHONE_NUMBER")
+            
+            if from_number:
+                try:
+                    account_sid = os.getenv("TWILIO_ACCOUNT_SID")
+                    auth_token = os.getenv("TWILIO_AUTH_TOKEN")
+                    
+                    if account_sid and auth_token:
+                        twilio_client = TwilioClient(account_sid, auth_token)
                         
-                        if account_sid and auth_token:
-                            twilio_client = TwilioClient(account_sid, auth_token)
-                            
-                            # Build message in required format: "the location is at xxx, the nearest mrt is xxxxx the timing of this is xxxx"
-                            from datetime import datetime
-                            try:
-                                from zoneinfo import ZoneInfo
-                            except ImportError:
-                                try:
-                                    from backports.zoneinfo import ZoneInfo
-                                except ImportError:
-                                    ZoneInfo = None
-                            
-                            # Import reverse geocoding and MRT finding functions
-                            from app.safety.routes import reverse_geocode, find_nearest_mrt
-                            
-                            # Format current time in Singapore timezone (SGT - UTC+8)
-                            if ZoneInfo:
-                                singapore_tz = ZoneInfo("Asia/Singapore")
-                                current_time = datetime.now(singapore_tz)
-                                time_str = current_time.strftime("%B %d, %Y at %I:%M %p SGT")
-                            else:
-                                from datetime import timedelta
-                                current_time = datetime.utcnow() + timedelta(hours=8)
-                                time_str = current_time.strftime("%B %d, %Y at %I:%M %p SGT")
-                            
-                            # Get location address - use FULL address for emergency calls
-                            location_address = "Unknown location"
-                            coordinates_str = ""
+                        # Build message in required format: "the location is at xxx, the nearest mrt is xxxxx the timing of this is xxxx"
+                        # Format current time in Singapore timezone (SGT - UTC+8)
+                        if ZoneInfo:
+                            singapore_tz = ZoneInfo("Asia/Singapore")
+                            current_time = datetime.now(singapore_tz)
+                            time_str = current_time.strftime("%B %d, %Y at %I:%M %p SGT")
+                        else:
+                            current_time = datetime.utcnow() + timedelta(hours=8)
+                            time_str = current_time.strftime("%B %d, %Y at %I:%M %p SGT")
+                        
+                        # Get location address - use FULL address for emergency calls
+                        location_address = "Unknown location"
+                        coordinates_str = ""
+                        
+                        if request.latitude and request.longitude:
+                            # Reverse geocode from coordinates to get FULL address and
+                            # find the nearest MRT station at the same time
+                            geocoded_address, mrt_station = await asyncio.gather(
+                                bounded_lookup(reverse_geocode(request.latitude, request.longitude, full_address=True)),
+                                bounded_lookup(find_nearest_mrt(request.latitude, request.longitude))
+                            )
+                            if geocoded_address:
+                                location_address = geocoded_address
+                            # Also include coordinates in the message
+                            coordinates_str = f"Coordinates: {request.latitude}, {request.longitude}"
                             
-                            if request.latitude and request.longitude:
-                                # Reverse geocode from coordinates to get FULL address
-                                geocoded_address = await reverse_geocode(request.latitude, request.longitude, full_address=True)
-                                if geocoded_address:
-                                    location_address = geocoded_address
-                                # Also include coordinates in the message
-                                coordinates_str = f"Coordinates: {request.latitude}, {request.longitude}"
-                                
-                                # Find nearest MRT station
-                                mrt_station = await find_nearest_mrt(request.latitude, request.longitude)
-                                if mrt_station:
-                                    nearest_mrt = mrt_station
-                                else:
-                                    nearest_mrt = "Unknown MRT"
+                            if mrt_station:
+                                nearest_mrt = mrt_station
                             else:
-                                # Use location string if provided
-                                if request.location:
-                                    location_address = request.location
-                                
-                                # Try to extract MRT from location string if it mentions MRT
                                 nearest_mrt = "Unknown MRT"
-                                if request.location and "mrt" in request.location.lower():
-                                    import re
-                                    mrt_match = re.search(r'([A-Za-z\s]+MRT)', request.location, re.IGNORECASE)
-                                    if mrt_match:
-                                        nearest_mrt = mrt_match.group(1).strip()
-                            
-                            # Combine location address and coordinates
-                            location_info = location_address
-                            if coordinates_str:
-                                location_info = f"{location_address}, {coordinates_str}"
+                        else:
+                            # Use location string if provided
+                            if request.location:
+                                location_address = request.location
                             
-                            # Build message in required format
-                            if request.message:
-                                # Check if message already has required format
-                                if ("location is at" in request.message.lower() and 
-                                    "nearest mrt" in request.message.lower() and
-                                    "timing" in request.message.lower()):
-                                    emergency_message = request.message
-                                else:
-                                    # Build message with required format including full address and coordinates
-                                    emergency_message = f"the location is at {location_info}, the nearest mrt is {nearest_mrt} the timing of this is {time_str}"
+                            # Try to extract MRT from location string if it mentions MRT
+                            nearest_mrt = "Unknown MRT"
+                            if request.location and "mrt" in request.location.lower():
+                                mrt_match = MRT_NAME_RE.search(request.location)
+                                if mrt_match:
+                                    nearest_mrt = mrt_match.group(1).strip()
+                        
+                        # Combine location address and coordinates
+                        location_info = location_address
+                        if coordinates_str:
+                            location_info = f"{location_address}, {coordinates_str}"
+                        
+                        # Build message in required format
+                        if request.message:
+                            # Check if message already has required format
+                            if ("location is at" in request.message.lower() and 
+                                "nearest mrt" in request.message.lower() and
+                                "timing" in request.message.lower()):
+                                emergency_message = request.message
                             else:
-                                # Build message in required format with full address and coordinates
+                                # Build message with required format including full address and coordinates
                                 emergency_message = f"the location is at {location_info}, the nearest mrt is {nearest_mrt} the timing of this is {time_str}"
-                            
-                            call = twilio_client.calls.create(
-                                twiml=f'<Response><Say voice="alice">{emergency_message}</Say></Response>',
-                                to=emergency_number,
-                                from_=from_number
-                            )
-                            
-                            message = "Emergency SOS call has been triggered automatically. Help is on the way!"
-                            action_result = {
-                                "success": True,
-                                "call_sid": call.sid,
-                                "call_status": "Emergency call initiated"
-                            }
-                            sos_triggered = True
-                            action_executed = True
                         else:
-                            message = "Emergency detected, but Twilio not configured"
-                            action_result = {"error": "Twilio credentials missing"}
-                    except Exception as e:
-                        message = f"Emergency detected, but call failed: {str(e)}"
-                        action_result = {"error": str(e)}
-                else:
-                    message = "Emergency detected, but phone number not configured"
-                    action_result = {"error": "Twilio phone number missing"}
-                
-                # Fallback to API call if direct Twilio fails
-                if not action_executed:
-                    sos_response = await client.post(
-                        f"{base_url}/api/safety/sos",
-                        json={
-                            "user_id": request.user_id,
-                            "location": request.location,
-                            "message": request.message
-                        }
-                    )
-                    if sos_response.status_code == 200:
-                        action_result = sos_response.json()
-                        sos_triggered = action_result.get("call_successful", False)
+                            # Build message in required format with full address and coordinates
+                            emergency_message = f"the location is at {location_info}, the nearest mrt is {nearest_mrt} the timing of this is {time_str}"
+                        
+                        # The Twilio SDK is blocking - run it off the event loop
+                        call = await asyncio.to_thread(
+                            twilio_client.calls.create,
+                            twiml=f'<Response><Say voice="alice">{emergency_message}</Say></Response>',
+                            to=emergency_number,
+                            from_=from_number
+                        )
+                        
                         message = "Emergency SOS call has been triggered automatically. Help is on the way!"
+                        action_result = {
+                            "success": True,
+                            "call_sid": call.sid,
+                            "call_status": "Emergency call initiated"
+                        }
+                        sos_triggered = True
                         action_executed = True
                     else:
-                        message = f"Emergency detected, but SOS call failed (HTTP {sos_response.status_code})"
-                        action_result = {"error": f"HTTP {sos_response.status_code}"}
+                        message = "Emergency detected, but Twilio not configured"
+                        action_result = {"error": "Twilio credentials missing"}
+                except Exception as e:
+                    message = f"Emergency detected, but call failed: {str(e)}"
+                    action_result = {"error": str(e)}
+            else:
+                message = "Emergency detected, but phone number not configured"
+                action_result = {"error": "Twilio phone number missing"}
             
-            elif intent in ["book_event", "register_event"]:
-                # Register for event
-                event_name = intent_data.get("event_name", "").strip() if intent_data.get("event_name") else ""
-                potential_event_id = intent_data.get("event_id")
-                
-                # Debug logging
-                print(f"DEBUG: Intent detection extracted - event_name: '{event_name}', event_id: '{potential_event_id}'")
-                
-                # Clean up event_name: remove common articles and extra words
-                if event_name:
-                    # Remove common articles and prepositions at the start
-                    event_name_cleaned = re.sub(r'^(the|a|an)\s+', '', event_name, flags=re.IGNORECASE).strip()
-                    if event_name_cleaned and event_name_cleaned != event_name:
-                        print(f"DEBUG: Cleaned event_name from '{event_name}' to '{event_name_cleaned}'")
-                        event_name = event_name_cleaned
-                
-                # Get available events to search through
-                events_resp = await client.get(f"{base_url}/api/events/list?limit=50")
-                if events_resp.status_code == 200:
-                    events_raw = events_resp.json().get("events", [])
-                    # Filter out any events with invalid IDs (safety check)
-                    uuid_pattern_filter = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+            # Fallback to API call if direct Twilio fails
+            if not action_executed:
+                sos_response = await post_json(
+                    f"{base_url}/api/safety/sos",
+                    {
+                        "user_id": request.user_id,
+                        "location": request.location,
+                        "message": request.message
+                    }
+                )
+                if sos_response.status_code == 200:
+                    action_result = response_json(sos_response)
+                    sos_triggered = action_result.get("call_successful", False)
+                    message = "Emergency SOS call has been triggered automatically. Help is on the way!"
+                    action_executed = True
+                else:
+                    message = f"Emergency detected, but SOS call failed (HTTP {sos_response.status_code})"
+                    action_result = {"error": f"HTTP {sos_response.status_code}"}
+        
+        elif intent in ["book_event", "register_event"]:
+            # Register for event
+            event_name = intent_data.get("event_name", "").strip() if intent_data.get("event_name") else ""
+            potential_event_id = intent_data.get("event_id")
+            
+            # Debug logging
+            log.debug("Intent detection extracted - event_name: %r, event_id: %r", event_name, potential_event_id)
+            
+            # Clean up event_name: remove common articles and extra words
+            if event_name:
+                # Remove common articles and prepositions at the start
+                event_name_cleaned = LEADING_ARTICLE_RE.sub('', event_name).strip()
+                if event_name_cleaned and event_name_cleaned != event_name:
+                    log.debug("Cleaned event_name from %r to %r", event_name, event_name_cleaned)
+                    event_name = event_name_cleaned
+            
+            # A valid event_id comes from the events context the LLM was shown,
+            # so register straight away while the events list (for the
+            # confirmation details) loads
+            register_resp = None
+            registered_event_id = validate_and_get_uuid(potential_event_id)
+            if registered_event_id:
+                register_resp, events = await asyncio.gather(
+                    post_json(
+                        f"{base_url}/api/events/register",
+                        {
+                            "event_id": registered_event_id,
+                            "user_id": request.user_id
+                        }
+                    ),
+                    get_events_cached()
+                )
+                if register_resp.status_code == 404:
+                    # Unknown event ID - fall back to matching by name
+                    register_resp = None
+                    potential_event_id = None
+                elif events is None:
                     events = []
-                    for event in events_raw:
-                        event_id_check = event.get("id")
-                        if event_id_check and uuid_pattern_filter.match(str(event_id_check)) and len(str(event_id_check)) == 36:
-                            events.append(event)
-                    
-                    print(f"DEBUG: Found {len(events)} valid events in database")
-                    if events:
-                        print(f"DEBUG: Event titles: {[e.get('title') for e in events[:5]]}")
-                    
+            else:
+                # Get available events to search through
+                events = await get_events_cached()
+            
+            if events is not None:
+                log.debug("Found %d valid events in database", len(events))
+                if events and log.isEnabledFor(logging.DEBUG):
+                    log.debug("Event titles: %s", [e.get('title') for e in events[:5]])
+                
+                if register_resp is not None:
+                    # Already registered by ID - the list only supplies the details
+                    matched_event = find_event_by_name_or_id(
+                        events=events,
+                        event_id=registered_event_id,
+                        by_id=events_by_id
+                    ) or {"id": registered_event_id}
+                else:
                     # Use improved matching function to find the specific event
                     matched_event = find_event_by_name_or_id(
                         events=events,
                         event_name=event_name if event_name else None,
-                        event_id=potential_event_id if potential_event_id else None
+                        event_id=potential_event_id if potential_event_id else None,
+                        title_norms=event_title_norms,
+                        by_id=events_by_id
                     )
-                    
-                    if matched_event:
-                        print(f"DEBUG: Matched event: '{matched_event.get('title')}' (ID: {matched_event.get('id')[:8]}...)")
+                
+                if matched_event:
+                    log.debug("Matched event: %r (ID: %.8s...)", matched_event.get('title'), matched_event.get('id'))
+                else:
+                    log.debug("No event matched for event_name=%r, event_id=%r", event_name, potential_event_id)
+                
+                # If no match and user didn't specify an event name, show available events
+                if not matched_event and not event_name:
+                    if events:
+                        # List available events for user to choose
+                        event_list = "\n".join([
+                            f"{i+1}. {e.get('title')} - {e.get('date')}"
+                            for i, e in enumerate(events[:5])
+                        ])
+                        message = f"I found {len(events)} events. Please specify which one you'd like to join:\n{event_list}"
+                        if len(events) > 5:
+                            message += f"\n... and {len(events) - 5} more events."
+                        action_result = {"events": events[:10], "count": len(events)}
+                        action_executed = True
                     else:
-                        print(f"DEBUG: No event matched for event_name='{event_name}', event_id='{potential_event_id}'")
-                    
-                    # If no match and user didn't specify an event name, show available events
-                    if not matched_event and not event_name:
-                        if events:
-                            # List available events for user to choose
-                            event_list = "\n".join([
-                                f"{i+1}. {e.get('title')} - {e.get('date')}"
-                                for i, e in enumerate(events[:5])
-                            ])
-                            message = f"I found {len(events)} events. Please specify which one you'd like to join:\n{event_list}"
-                            if len(events) > 5:
-                                message += f"\n... and {len(events) - 5} more events."
-                            action_result = {"events": events[:10], "count": len(events)}
-                            action_executed = True
-                        else:
-                            message = "No events available to register for."
-                    elif not matched_event:
-                        # Event name mentioned but not found - provide helpful suggestions
-                        if events:
-                            # Find similar event names
-                            suggestions = []
-                            search_lower = event_name.lower() if event_name else ""
-                            for event in events[:5]:
-                                title_lower = event.get("title", "").lower()
-                                if any(word in title_lower for word in search_lower.split() if len(word) > 3):
-                                    suggestions.append(event.get("title"))
-                            
-                            if suggestions:
-                                suggestions_text = "\n".join([f"- {s}" for s in suggestions[:3]])
-                                message = f"I couldn't find an event matching '{event_name}'. Did you mean one of these?\n{suggestions_text}"
-                            else:
-                                event_list = "\n".join([f"- {e.get('title')}" for e in events[:3]])
-                                message = f"I couldn't find an event matching '{event_name}'. Available events:\n{event_list}"
-                        else:
-                            message = f"I couldn't find an event matching '{event_name}'. No events are currently available."
+                        message = "No events available to register for."
+                elif not matched_event:
+                    # Event name mentioned but not found - provide helpful suggestions
+                    if events:
+                        message = event_not_found_message(event_name, events)
                     else:
-                        # Found the event - register user
-                        event_id_str = validate_and_get_uuid(matched_event.get("id"))
-                        if not event_id_str:
-                            message = "System error: Invalid event ID. Please try again."
-                            action_result = {"error": "Invalid event ID format"}
-                        else:
-                            # Register user for the event
-                            register_resp = await client.post(
+                        message = f"I couldn't find an event matching '{event_name}'. No events are currently available."
+                else:
+                    # Found the event - register user
+                    event_id_str = validate_and_get_uuid(matched_event.get("id"))
+                    if not event_id_str:
+                        message = "System error: Invalid event ID. Please try again."
+                        action_result = {"error": "Invalid event ID format"}
+                    else:
+                        # Register user for the event (unless done up front by ID)
+                        if register_resp is None:
+                            register_resp = await post_json(
                                 f"{base_url}/api/events/register",
-                                json={
+                                {
                                     "event_id": event_id_str,
                                     "user_id": request.user_id
                                 }
                             )
-                            if register_resp.status_code == 200:
-                                action_result = register_resp.json()
-                                event_title = matched_event.get("title", "the event")
-                                message = f"Successfully registered you for '{event_title}'! Registration confirmed."
-                                
-                                # Add navigation and confirmation data for frontend
-                                action_result["navigation"] = {
-                                    "action": "navigate_to_booking_confirmation",
-                                    "route": "/events/booking/confirmation",
-                                    "event_id": event_id_str,
-                                    "should_navigate": True
-                                }
-                                action_result["event_details"] = matched_event
-                                action_result["confirmation_message"] = f"You're all set! You're registered for '{event_title}' on {matched_event.get('date', 'TBA')} at {matched_event.get('time', 'TBA')}."
-                                action_result["booking_confirmed"] = True
-                                
-                                action_executed = True
+                        if register_resp.status_code == 200:
+                            # Participant counts changed
+                            invalidate_events_cache(event_id_str)
+                            action_result = response_json(register_resp)
+                            event_title = matched_event.get("title", "the event")
+                            message = f"Successfully registered you for '{event_title}'! Registration confirmed."
+                            
+                            # Add navigation and confirmation data for frontend
+                            action_result["navigation"] = {
+                                "action": "navigate_to_booking_confirmation",
+                                "route": "/events/booking/confirmation",
+                                "event_id": event_id_str,
+                                "should_navigate": True
+                            }
+                            action_result["event_details"] = matched_event
+                            action_result["confirmation_message"] = f"You're all set! You're registered for '{event_title}' on {matched_event.get('date', 'TBA')} at {matched_event.get('time', 'TBA')}."
+                            action_result["booking_confirmed"] = True
+                            
+                            action_executed = True
+                        else:
+                            error_detail = response_error_detail(register_resp)
+                            if "already registered" in error_detail.lower():
+                                message = f"You're already registered for '{matched_event.get('title', 'this event')}'."
                             else:
-                                error_detail = register_resp.json().get("detail", register_resp.text) if register_resp.headers.get("content-type", "").startswith("application/json") else register_resp.text
-                                if "already registered" in error_detail.lower():
-                                    message = f"You're already registered for '{matched_event.get('title', 'this event')}'."
-                                else:
-                                    message = f"Could not register for event. {error_detail}"
-                                action_result = {"error": error_detail}
-                else:
-                    message = "Could not retrieve events list. Please try again later."
-            
-            elif intent == "list_events":
-                # List available events
-                events_resp = await client.get(f"{base_url}/api/events/list?limit=10")
-                if events_resp.status_code == 200:
-                    action_result = events_resp.json()
-                    events = action_result.get("events", [])
-                    if events:
-                        event_list = "\n".join([
-                            f"• {e.get('title')} - {e.get('date')} at {e.get('time')}"
-                            for e in events[:5]
-                        ])
-                        message = f"Here are the available events:\n{event_list}"
-                        if len(events) > 5:
-                            message += f"\n... and {len(events) - 5} more events."
-                    else:
-                        message = "No events available at the moment."
-                    action_executed = True
+                                message = f"Could not register for event. {error_detail}"
+                            action_result = {"error": error_detail}
+            else:
+                message = "Could not retrieve events list. Please try again later."
+        
+        elif intent == "list_events":
+            # List available events
+            events = await get_events_cached()
+            if events is not None:
+                events = events[:10]
+                action_result = {"success": True, "events": events, "count": len(events)}
+                if events:
+                    event_list = "\n".join([
+                        f"• {e.get('title')} - {e.get('date')} at {e.get('time')}"
+                        for e in events[:5]
+                    ])
+                    message = f"Here are the available events:\n{event_list}"
+                    if len(events) > 5:
+                        message += f"\n... and {len(events) - 5} more events."
                 else:
-                    message = "Could not retrieve events list."
+                    message = "No events available at the moment."
+                action_executed = True
+            else:
+                message = "Could not retrieve events list."
+        
+        elif intent == "get_event":
+            # Get specific event details
+            event_name = intent_data.get("event_name", "").strip() if intent_data.get("event_name") else ""
+            potential_event_id = intent_data.get("event_id")
             
-            elif intent == "get_event":
-                # Get specific event details
-                event_name = intent_data.get("event_name", "").strip() if intent_data.get("event_name") else ""
-                potential_event_id = intent_data.get("event_id")
-                
-                # Get events to search
-                events_resp = await client.get(f"{base_url}/api/events/list?limit=50")
-                if events_resp.status_code == 200:
-                    events_raw = events_resp.json().get("events", [])
-                    # Filter out any events with invalid IDs
-                    uuid_pattern_filter = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+            # Get events to search - a valid event_id is looked up directly
+            # at the same time, and a hit skips the name matching
+            direct_event = None
+            direct_event_id = validate_and_get_uuid(potential_event_id)
+            if direct_event_id:
+                events, direct_event = await asyncio.gather(
+                    get_events_cached(),
+                    get_event_details_cached(direct_event_id)
+                )
+                if direct_event is not None and events is None:
                     events = []
-                    for event in events_raw:
-                        event_id_check = event.get("id")
-                        if event_id_check and uuid_pattern_filter.match(str(event_id_check)) and len(str(event_id_check)) == 36:
-                            events.append(event)
-                    
+            else:
+                events = await get_events_cached()
+            
+            if events is not None:
+                if direct_event is not None:
+                    matched_event = direct_event
+                else:
                     # Use improved matching function to find the specific event
                     matched_event = find_event_by_name_or_id(
                         events=events,
                         event_name=event_name if event_name else None,
-                        event_id=potential_event_id if potential_event_id else None
+                        event_id=potential_event_id if potential_event_id else None,
+                        title_norms=event_title_norms,
+                        by_id=events_by_id
                     )
-                    
-                    if matched_event:
-                        event_id_str = validate_and_get_uuid(matched_event.get("id"))
-                        if event_id_str:
-                            # Get full event details
-                            event_resp = await client.get(f"{base_url}/api/events/{event_id_str}")
-                            if event_resp.status_code == 200:
-                                event_data = event_resp.json().get("event", matched_event)
-                                action_result = {"event": event_data}
-                                
-                                # Format detailed message
-                                title = event_data.get('title', 'Event')
-                                date = event_data.get('date', 'TBA')
-                                time = event_data.get('time', 'TBA')
-                                location = event_data.get('location', 'TBA')
-                                description = event_data.get('description', 'No description available')
-                                max_participants = event_data.get('max_participants')
-                                
-                                message = f"📅 {title}\n\n"
-                                message += f"Date: {date} at {time}\n"
-                                message += f"Location: {location}\n"
-                                if max_participants:
-                                    message += f"Max Participants: {max_participants}\n"
-                                message += f"\nDescription: {description}"
-                                
-                                action_executed = True
-                            else:
-                                # Fallback to matched event data
-                                event_data = matched_event
-                                title = event_data.get('title', 'Event')
-                                date = event_data.get('date', 'TBA')
-                                time = event_data.get('time', 'TBA')
-                                location = event_data.get('location', 'TBA')
-                                description = event_data.get('description', 'No description available')
-                                
-                                message = f"📅 {title}\n\n"
-                                message += f"Date: {date} at {time}\n"
-                                message += f"Location: {location}\n"
-                                message += f"\nDescription: {description}"
-                                
-                                action_result = {"event": event_data}
-                                action_executed = True
-                        else:
-                            message = "System error: Invalid event ID. Please try again."
+                
+                if matched_event:
+                    event_id_str = validate_and_get_uuid(matched_event.get("id"))
+                    if event_id_str:
+                        # Get full event details (fall back to the listed event)
+                        event_data = await get_event_details_cached(event_id_str) or matched_event
+                        action_result = {"event": event_data}
+                        message = format_event_details(event_data)
+                        action_executed = True
                     else:
-                        # Event not found - provide helpful suggestions
-                        if event_name and events:
-                            # Find similar event names
-                            suggestions = []
-                            search_lower = event_name.lower()
-                            for event in events[:5]:
-                                title_lower = event.get("title", "").lower()
-                                if any(word in title_lower for word in search_lower.split() if len(word) > 3):
-                                    suggestions.append(event.get("title"))
-                            
-                            if suggestions:
-                                suggestions_text = "\n".join([f"- {s}" for s in suggestions[:3]])
-                                message = f"I couldn't find an event matching '{event_name}'. Did you mean one of these?\n{suggestions_text}"
-                            else:
-                                event_list = "\n".join([f"- {e.get('title')}" for e in events[:3]])
-                                message = f"I couldn't find an event matching '{event_name}'. Available events:\n{event_list}"
-                        elif not event_name:
-                            if events:
-                                event_list = "\n".join([f"- {e.get('title')} ({e.get('date')})" for e in events[:5]])
-                                message = f"Please specify which event you'd like details about. Available events:\n{event_list}"
-                            else:
-                                message = "No events available at the moment."
-                        else:
-                            message = f"I couldn't find that event. Please specify the event name."
+                        message = "System error: Invalid event ID. Please try again."
                 else:
-                    message = "Could not retrieve events list. Please try again later."
+                    # Event not found - provide helpful suggestions
+                    if event_name and events:
+                        message = event_not_found_message(event_name, events)
+                    elif not event_name:
+                        if events:
+                            event_list = "\n".join([f"- {e.get('title')} ({e.get('date')})" for e in events[:5]])
+                            message = f"Please specify which event you'd like details about. Available events:\n{event_list}"
+                        else:
+                            message = "No events available at the moment."
+                    else:
+                        message = "I couldn't find that event. Please specify the event name."
+            else:
+                message = "Could not retrieve events list. Please try again later."
+        
+        elif intent in ["cancel_event", "unregister_event"]:
+            # Unregister from event
+            event_name = intent_data.get("event_name", "").strip() if intent_data.get("event_name") else ""
+            potential_event_id = intent_data.get("event_id")
             
-            elif intent in ["cancel_event", "unregister_event"]:
-                # Unregister from event
-                event_name = intent_data.get("event_name", "").strip() if intent_data.get("event_name") else ""
-                potential_event_id = intent_data.get("event_id")
-                
-                # Debug logging
-                print(f"DEBUG [CANCEL]: Intent detection extracted - event_name: '{event_name}', event_id: '{potential_event_id}'")
-                
-                # Clean up event_name: remove common event-related words that aren't part of the actual event name
-                if event_name:
-                    # Remove common event-related words that might be in user's phrase but not in event title
-                    event_name_cleaned = re.sub(r'\b(event|class|session|activity|lesson|workshop|meeting|gathering)\b', '', event_name, flags=re.IGNORECASE).strip()
-                    # Remove articles
-                    event_name_cleaned = re.sub(r'^(the|a|an|my)\s+', '', event_name_cleaned, flags=re.IGNORECASE).strip()
-                    if event_name_cleaned and event_name_cleaned != event_name:
-                        print(f"DEBUG [CANCEL]: Cleaned event_name from '{event_name}' to '{event_name_cleaned}'")
-                        event_name = event_name_cleaned
-                
-                # Get events to search (we'll check if user is registered)
-                events_resp = await client.get(f"{base_url}/api/events/list?limit=50")
-                if events_resp.status_code == 200:
-                    events_raw = events_resp.json().get("events", [])
-                    # Filter out any events with invalid IDs
-                    uuid_pattern_filter = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+            # Debug logging
+            log.debug("[CANCEL] Intent detection extracted - event_name: %r, event_id: %r", event_name, potential_event_id)
+            
+            # Clean up event_name: remove common event-related words that aren't part of the actual event name
+            if event_name:
+                # Remove common event-related words that might be in user's phrase but not in event title
+                event_name_cleaned = EVENT_WORDS_RE.sub('', event_name).strip()
+                # Remove articles
+                event_name_cleaned = LEADING_ARTICLE_RE.sub('', event_name_cleaned).strip()
+                if event_name_cleaned and event_name_cleaned != event_name:
+                    log.debug("[CANCEL] Cleaned event_name from %r to %r", event_name, event_name_cleaned)
+                    event_name = event_name_cleaned
+            
+            # A valid event_id is unregistered straight away while the events
+            # list (for the event title) loads; the DELETE decides whether it
+            # exists, so the list is only searched when matching by name
+            unregister_resp = None
+            unregistered_event_id = validate_and_get_uuid(potential_event_id)
+            if unregistered_event_id:
+                unregister_resp, events = await asyncio.gather(
+                    client.delete(
+                        f"{base_url}/api/events/register/{unregistered_event_id}/{request.user_id}"
+                    ),
+                    get_events_cached()
+                )
+                if events is None:
                     events = []
-                    for event in events_raw:
-                        event_id_check = event.get("id")
-                        if event_id_check and uuid_pattern_filter.match(str(event_id_check)) and len(str(event_id_check)) == 36:
-                            events.append(event)
-                    
-                    print(f"DEBUG [CANCEL]: Found {len(events)} valid events in database")
-                    if events:
-                        print(f"DEBUG [CANCEL]: Event titles: {[e.get('title') for e in events[:5]]}")
-                    
+                if unregister_resp.status_code == 404 and not find_event_by_name_or_id(
+                    events=events,
+                    event_id=unregistered_event_id,
+                    by_id=events_by_id
+                ):
+                    # Unknown event ID - fall back to matching by name
+                    unregister_resp = None
+                    potential_event_id = None
+            else:
+                # Get events to search (we'll check if user is registered)
+                events = await get_events_cached()
+            
+            if events is not None:
+                log.debug("[CANCEL] Found %d valid events in database", len(events))
+                if events and log.isEnabledFor(logging.DEBUG):
+                    log.debug("[CANCEL] Event titles: %s", [e.get('title') for e in events[:5]])
+                
+                if unregister_resp is not None:
+                    # Already unregistered by ID - the list only supplies the title
+                    matched_event = find_event_by_name_or_id(
+                        events=events,
+                        event_id=unregistered_event_id,
+                        by_id=events_by_id
+                    ) or {"id": unregistered_event_id}
+                else:
                     # Use improved matching function to find the specific event
                     matched_event = find_event_by_name_or_id(
                         events=events,
                         event_name=event_name if event_name else None,
-                        event_id=potential_event_id if potential_event_id else None
+                        event_id=potential_event_id if potential_event_id else None,
+                        title_norms=event_title_norms,
+                        by_id=events_by_id
                     )
-                    
-                    if matched_event:
-                        print(f"DEBUG [CANCEL]: Matched event: '{matched_event.get('title')}' (ID: {matched_event.get('id')[:8]}...)")
-                    else:
-                        print(f"DEBUG [CANCEL]: No event matched for event_name='{event_name}', event_id='{potential_event_id}'")
-                    
-                    if matched_event:
-                        event_id_str = validate_and_get_uuid(matched_event.get("id"))
-                        if event_id_str:
-                            # Unregister user from the event
+                
+                if matched_event:
+                    log.debug("[CANCEL] Matched event: %r (ID: %.8s...)", matched_event.get('title'), matched_event.get('id'))
+                else:
+                    log.debug("[CANCEL] No event matched for event_name=%r, event_id=%r", event_name, potential_event_id)
+                
+                if matched_event:
+                    event_id_str = validate_and_get_uuid(matched_event.get("id"))
+                    if event_id_str:
+                        # Unregister user from the event (unless done up front by ID)
+                        if unregister_resp is None:
                             unregister_resp = await client.delete(
                                 f"{base_url}/api/events/register/{event_id_str}/{request.user_id}"
                             )
-                            if unregister_resp.status_code == 200:
-                                action_result = unregister_resp.json()
-                                event_title = matched_event.get("title", "the event")
-                                message = f"Successfully unregistered you from '{event_title}'."
-                                action_executed = True
-                            else:
-                                error_detail = unregister_resp.json().get("detail", unregister_resp.text) if unregister_resp.headers.get("content-type", "").startswith("application/json") else unregister_resp.text
-                                if "not found" in error_detail.lower() or "not registered" in error_detail.lower():
-                                    event_title = matched_event.get("title", "this event")
-                                    message = f"You're not currently registered for '{event_title}'."
-                                else:
-                                    message = f"Could not unregister. {error_detail}"
-                                action_result = {"error": error_detail}
+                        if unregister_resp.status_code == 200:
+                            # Participant counts changed
+                            invalidate_events_cache(event_id_str)
+                            action_result = response_json(unregister_resp)
+                            event_title = matched_event.get("title", "the event")
+                            message = f"Successfully unregistered you from '{event_title}'."
+                            action_executed = True
                         else:
-                            message = "System error: Invalid event ID. Please try again."
-                    else:
-                        # Event not found - provide helpful suggestions
-                        if event_name and events:
-                            # Find similar event names
-                            suggestions = []
-                            search_lower = event_name.lower()
-                            for event in events[:5]:
-                                title_lower = event.get("title", "").lower()
-                                if any(word in title_lower for word in search_lower.split() if len(word) > 3):
-                                    suggestions.append(event.get("title"))
-                            
-                            if suggestions:
-                                suggestions_text = "\n".join([f"- {s}" for s in suggestions[:3]])
-                                message = f"I couldn't find an event matching '{event_name}'. Did you mean one of these?\n{suggestions_text}"
+                            error_detail = response_error_detail(unregister_resp)
+                            if "not found" in error_detail.lower() or "not registered" in error_detail.lower():
+                                event_title = matched_event.get("title", "this event")
+                                message = f"You're not currently registered for '{event_title}'."
                             else:
-                                message = f"I couldn't find an event matching '{event_name}'. Please specify the exact event name you want to cancel."
-                        elif not event_name:
-                            if events:
-                                event_list = "\n".join([f"- {e.get('title')}" for e in events[:5]])
-                                message = f"Please specify which event you'd like to cancel. Available events:\n{event_list}"
-                            else:
-                                message = "No events available to cancel."
-                        else:
-                            message = "I couldn't find the event you want to cancel. Please specify the event name."
+                                message = f"Could not unregister. {error_detail}"
+                            action_result = {"error": error_detail}
+                    else:
+                        message = "System error: Invalid event ID. Please try again."
                 else:
-                    message = "Could not retrieve events list. Please try again later."
-            
+                    # Event not found - provide helpful suggestions
+                    if event_name and events:
+                        message = event_not_found_message(
+                            event_name, events, "Please specify the exact event name you want to cancel."
+                        )
+                    elif not event_name:
+                        if events:
+                            event_list = "\n".join([f"- {e.get('title')}" for e in events[:5]])
+                            message = f"Please specify which event you'd like to cancel. Available events:\n{event_list}"
+                        else:
+                            message = "No events available to cancel."
+                    else:
+                        message = "I couldn't find the event you want to cancel. Please specify the event name."
             else:
-                # General intent - use GPT to answer questions intelligently
+                message = "Could not retrieve events list. Please try again later."
+        
+        else:
+            # General intent - use GPT to answer questions intelligently
+            try:
+                # Try to get OpenAI client for general question answering
                 try:
-                    # Try to get OpenAI client for general question answering
-                    try:
-                        gpt_client = get_openai_client()
-                        
-                        # Get available events for context
-                        available_events = []
-                        try:
-                            events_resp = await client.get(f"{base_url}/api/events/list?limit=5")
-                            if events_resp.status_code == 200:
-                                available_events = events_resp.json().get("events", [])
-                        except:
-                            pass
-                        
-                        events_context = ""
-                        if available_events:
-                            events_list = "\n".join([
-                                f"- {e.get('title')} on {e.get('date')}"
-                                for e in available_events[:5]
-                            ])
-                            events_context = f"\n\nAvailable Events:\n{events_list}"
-                        
-                        # Create prompt for general question answering
-                        general_prompt = f"""You are a helpful assistant for a community engagement platform. Answer the user's question in a friendly, concise way.
-
-User question: "{request.message}"
-{events_context}
-
-Context about this platform:
-- Users can book/register for events
-- Users can view event details
-- Users can cancel event registrations
-- Users can trigger emergency SOS calls
-- The platform helps connect community members
-
-Answer the user's question helpfully. If they're asking about how to use the platform, provide clear instructions. If they're asking about events, reference the available events above if relevant. Keep your response concise (2-3 sentences max) and friendly."""
-                        
-                        try:
-                            gpt_response = gpt_client.chat.completions.create(
-                                model="gpt-4",
-                                messages=[
-                                    {
-                                        "role": "system",
-                                        "content": "You are a helpful community platform assistant. Answer questions concisely and friendly."
-                                    },
-                                    {
-                                        "role": "user",
-                                        "content": general_prompt
-                                    }
-                                ],
-                                temperature=0.7,
-                                max_tokens=200
-                            )
-                            message = gpt_response.choices[0].message.content.strip()
-                            action_executed = True
-                        except:
-                            # Fallback to gpt-3.5-turbo
-                            gpt_response = gpt_client.chat.completions.create(
-                                model="gpt-3.5-turbo",
-                                messages=[
-                                    {
-                                        "role": "system",
-                                        "content": "You are a helpful community platform assistant. Answer questions concisely and friendly."
-                                    },
-                                    {
-                                        "role": "user",
-                                        "content": general_prompt
-                                    }
-                                ],
-                                temperature=0.7,
-                                max_tokens=200
-                            )
-                            message = gpt_response.choices[0].message.content.strip()
-                            action_executed = True
-                    except HTTPException:
-                        # OpenAI not available - use default message
-                        message = "I can help you with:\n• Booking events (say 'book event' or 'register for event')\n• Viewing events (say 'show events' or 'list events')\n• Getting event details (say 'tell me about [event name]')\n• Canceling events (say 'cancel [event name]')\n• Emergency help (say 'help' or 'emergency')\n• And more! What would you like to do?"
-                    except Exception as e:
-                        # Error with GPT - use default message
-                        print(f"Error in general question answering: {e}")
-                        message = "I can help you with:\n• Booking events (say 'book event' or 'register for event')\n• Viewing events (say 'show events' or 'list events')\n• Getting event details (say 'tell me about [event name]')\n• Canceling events (say 'cancel [event name]')\n• Emergency help (say 'help' or 'emergency')\n• And more! What would you like to do?"
+                    gpt_client = get_async_openai_client()
+                    
+                    # Get available events for context (only for event-related questions)
+                    available_events = []
+                    if not GENERAL_EVENT_KEYWORDS.isdisjoint(normalize_words(message_lower)):
+                        available_events = (await get_events_cached() or [])[:5]
+                    
+                    events_context = ""
+                    if available_events:
+                        events_list = "\n".join([
+                            f"- {e.get('title')} on {e.get('date')}"
+                            for e in available_events[:5]
+                        ])
+                        events_context = f"\n\nAvailable Events:\n{events_list}"
+                    
+                    # Create prompt for general question answering
+                    general_prompt = GENERAL_PROMPT_TEMPLATE.format(
+                        question=request.message,
+                        events_context=events_context
+                    )
+                    
+                    message = await answer_general_question(gpt_client, general_prompt)
+                    action_executed = True
+                except HTTPException:
+                    # OpenAI not available - use default message
+                    message = HELP_MESSAGE
                 except Exception as e:
-                    # Fallback to default message
-                    message = "I can help you with:\n• Booking events (say 'book event' or 'register for event')\n• Viewing events (say 'show events' or 'list events')\n• Getting event details (say 'tell me about [event name]')\n• Canceling events (say 'cancel [event name]')\n• Emergency help (say 'help' or 'emergency')\n• And more! What would you like to do?"
-    
+                    # Error with GPT - use default message
+                    print(f"Error in general question answering: {e}")
+                    message = HELP_MESSAGE
+            except Exception:
+                # Fallback to default message
+                message = HELP_MESSAGE
+
     except (httpx.ConnectError, httpx.ConnectTimeout) as e:
         # Connection error - API_BASE_URL likely not set correctly
         error_msg = str(e)
@@ -1169,10 +1575,7 @@ Answer the user's question helpfully. If they're asking about how to use the pla
     except Exception as e:
         # Catch any other errors and return a proper response instead of crashing
         error_msg = str(e)
-        import traceback
-        error_traceback = traceback.format_exc()
-        print(f"Error in process_message action execution: {error_msg}")
-        print(f"Traceback: {error_traceback}")
+        log.exception("Error in process_message action execution: %s", error_msg)
         message = f"Error processing your request: {error_msg}"
         action_result = {"error": error_msg}
     
@@ -1216,8 +1619,7 @@ async def process_voice_message(request: VoiceMessage):
         # If no transcript but audio is provided, transcribe it using Whisper
         if (not transcript or not transcript.strip()) and request.audio:
             # Check if OpenAI is available before attempting transcription
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
+            if not OPENAI_API_KEY:
                 # Return 400 (Bad Request) instead of 500 to avoid triggering frontend's "voice unavailable" message
                 raise HTTPException(
                     status_code=400,
@@ -1263,11 +1665,8 @@ async def process_voice_message(request: VoiceMessage):
             raise
         except Exception as e:
             # Catch any errors from process_message and return a proper error
-            import traceback
             error_msg = str(e)
-            error_traceback = traceback.format_exc()
-            print(f"Error in process_message: {error_msg}")
-            print(f"Traceback: {error_traceback}")
+            log.exception("Error in process_message: %s", error_msg)
             raise HTTPException(
                 status_code=500,
                 detail=f"Failed to process message: {error_msg}"
@@ -1321,19 +1720,46 @@ async def process_voice_message(request: VoiceMessage):
         raise
     except Exception as e:
         # Catch any other unexpected errors and return a proper error response
-        import traceback
         error_msg = str(e)
-        error_traceback = traceback.format_exc()
-        print(f"Unexpected error in process_voice_message: {error_msg}")
-        print(f"Traceback: {error_traceback}")
+        log.exception("Unexpected error in process_voice_message: %s", error_msg)
         raise HTTPException(
             status_code=500,
             detail=f"Backend server error: {error_msg}. Please try again later or contact support."
         )
 
 
+@router.post("/voice/upload")
+async def process_voice_upload(
+    user_id: str = Form(...),
+    location: Optional[str] = Form(None),
+    audio: UploadFile = File(..., description="Audio recording (webm, mp3, wav, m4a, ...)")
+):
+    """
+    /voice for a multipart audio upload - preferred over base64 'audio'
+    
+    The recording is sent as a file (a third smaller on the wire, no decode
+    step) and streamed to Whisper; the transcript is then handled exactly
+    like /voice.
+    """
+    if not OPENAI_API_KEY:
+        raise HTTPException(
+            status_code=400,
+            detail="Audio transcription requires OPENAI_API_KEY. Please send 'transcript' to /voice instead (use frontend speech-to-text)."
+        )
+    
+    try:
+        transcript = await transcribe_upload(audio)
+    except Exception as e:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Failed to transcribe audio: {str(e)}. Please send 'transcript' to /voice instead."
+        )
+    
+    return await process_voice_message(VoiceMessage(user_id=user_id, transcript=transcript, location=location))
+
+
 @router.get("/history/{user_id}")
-def get_history(user_id: str, limit: int = 20):
+async def get_history(user_id: str, limit: int = 20):
     """Get conversation history for a user"""
     return {
         "success": True,
@@ -1347,7 +1773,7 @@ def get_history(user_id: str, limit: int = 20):
 # ==================== SINGLISH PROCESSING ====================
 
 @router.get("/test-route")
-def test_route():
+async def test_route():
     """Simple test endpoint to verify route registration"""
     return {
         "success": True,
@@ -1357,25 +1783,17 @@ def test_route():
 
 
 @router.get("/voice-status")
-def voice_status():
+async def voice_status():
     """Check if voice processing is available - simple endpoint for frontend checks"""
-    audio_transcription_available = False
-    try:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if api_key:
-            audio_transcription_available = True
-    except:
-        pass
-    
     return {
         "success": True,
         "voice_processing_available": True,  # Always available with transcripts
-        "audio_transcription_available": audio_transcription_available,
+        "audio_transcription_available": bool(OPENAI_API_KEY),
         "message": "Voice processing is available. Send transcripts via /voice endpoint."
     }
 
 
-@router.post("/process-singlish")
+@router.post("/process-singlish", response_model=SinglishProcessResponse)
 async def process_singlish(request: SinglishProcessRequest):
     """
     Process Singlish audio or text input:
@@ -1402,11 +1820,24 @@ async def process_singlish(request: SinglishProcessRequest):
             )
         
         # Step 1: Get transcript (from audio or direct input)
-        transcript = None
+        if request.audio and SINGLISH_AUDIO_MODEL:
+            # Transcribe and translate in one audio-in call (if enabled and
+            # the format is supported), otherwise fall through to Whisper
+            result = await translate_audio_with_llm(request.audio)
+            if result is not None:
+                return {
+                    "success": True,
+                    "user_id": request.user_id,
+                    **result
+                }
         
         if request.audio:
-            # Decode base64 audio and process with Whisper
-            transcript = await process_audio_with_whisper(request.audio)
+            # Decode base64 audio and process with Whisper, preparing the
+            # translation stage while the transcription is in flight
+            transcript, _ = await asyncio.gather(
+                process_audio_with_whisper(request.audio),
+                prepare_translation()
+            )
         else:
             # Use provided transcript
             transcript = request.transcript
@@ -1430,95 +1861,608 @@ async def process_singlish(request: SinglishProcessRequest):
         raise
     except Exception as e:
         raise HTTPException(
-            status_code=500,
+            status_code=openai_error_status(e) or 500,
             detail=f"Error processing Singlish: {str(e)}"
         )
 
 
-# ==================== HELPER FUNCTIONS ====================
-
-async def process_audio_with_whisper(audio_base64: str) -> str:
+@router.post("/process-singlish/stream")
+async def process_singlish_stream(request: SinglishProcessRequest):
     """
-    Convert base64 audio to transcript using OpenAI Whisper
-    
-    Args:
-        audio_base64: Base64 encoded audio string
+    Streaming version of /process-singlish using Server-Sent Events
     
-    Returns:
-        Transcribed text
+    Events (each data line is JSON):
+    - transcript: {"singlish_raw": ...} once the transcript is known
+    - clean_english: {"delta": ...} pieces of the translation as they're generated
+    - result: the same fields /process-singlish returns
+    - error: {"detail": ...} if processing fails after the stream started
     """
-    try:
-        # Decode base64 audio
-        audio_bytes = base64.b64decode(audio_base64)
-        
-        # Create temporary file for audio
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".webm") as temp_audio:
-            temp_audio.write(audio_bytes)
-            temp_audio_path = temp_audio.name
-        
-        try:
-            # Call Whisper API
-            client = get_openai_client()
-            with open(temp_audio_path, "rb") as audio_file:
-                transcription = client.audio.transcriptions.create(
-                    model="whisper-1",
-                    file=audio_file,
-                    language="en"  # Singlish is primarily English-based
-                )
-            
-            return transcription.text
-        
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_audio_path):
-                os.unlink(temp_audio_path)
+    if not request.audio and not request.transcript:
+        raise HTTPException(
+            status_code=400,
+            detail="Either 'audio' or 'transcript' must be provided"
+        )
     
-    except Exception as e:
-        raise Exception(f"Whisper STT failed: {str(e)}")
+    async def get_transcript() -> str:
+        if request.audio:
+            transcript, _ = await asyncio.gather(
+                process_audio_with_whisper(request.audio),
+                prepare_translation()
+            )
+            return transcript
+        return request.transcript
+    
+    return singlish_event_stream(get_transcript)
 
 
-async def translate_singlish_to_english(transcript: str) -> Dict[str, str]:
+@router.post("/process-singlish/upload")
+async def process_singlish_upload(
+    user_id: str = Form(...),
+    audio: UploadFile = File(..., description="Audio recording (webm, mp3, wav, m4a, ...)")
+):
     """
-    Translate Singlish to clean English and analyze sentiment/tone
-    Tries SEA-LION/Merlion first (if configured), falls back to OpenAI
+    Streaming Singlish processing for a multipart audio upload
     
-    Args:
+    Sends the recording as a file instead of base64 JSON (a third smaller
+    on the wire, no decode step). Responds with the same Server-Sent
+    Events as /process-singlish/stream.
+    """
+    # The upload is closed once this handler returns, so transcribe it here
+    # and stream the translation afterwards
+    try:
+        transcript, _ = await asyncio.gather(
+            transcribe_upload(audio),
+            prepare_translation()
+        )
+        error = None
+    except Exception as e:
+        transcript, error = None, e
+    
+    async def get_transcript() -> str:
+        if error is not None:
+            raise error
+        return transcript
+    
+    return singlish_event_stream(get_transcript)
+
+
+@router.post("/process-singlish/batch")
+async def submit_singlish_batch(request: SinglishBatchRequest):
+    """
+    Queue transcripts for offline translation with the OpenAI Batch API
+    
+    For callers that don't need an immediate answer (bulk imports, analysis):
+    batch requests cost half as much and use a separate rate limit, but may
+    take up to 24 hours. Poll /process-singlish/batch/{batch_id} for results.
+    """
+    if not request.transcripts or not all(t and t.strip() for t in request.transcripts):
+        raise HTTPException(
+            status_code=400,
+            detail="'transcripts' must be a non-empty list of non-empty strings"
+        )
+    
+    try:
+        batch = await submit_translation_batch(request.transcripts)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=openai_error_status(e) or 500,
+            detail=f"Error submitting Singlish batch: {str(e)}"
+        )
+    
+    return {
+        "success": True,
+        "user_id": request.user_id,
+        "batch_id": batch.id,
+        "status": batch.status,
+        "count": len(request.transcripts)
+    }
+
+
+@router.get("/process-singlish/batch/{batch_id}")
+async def get_singlish_batch(batch_id: str):
+    """
+    Status of a translation batch, with the results once it has completed
+    
+    Results are in submission order: {"index", "clean_english", "sentiment",
+    "tone"}, or {"index", "error"} for a transcript that failed.
+    """
+    try:
+        client = get_async_openai_client()
+        batch = await client.batches.retrieve(batch_id)
+        response = {
+            "success": True,
+            "batch_id": batch.id,
+            "status": batch.status
+        }
+        if batch.status == "completed" and batch.output_file_id:
+            response["results"] = await translation_batch_results(batch.output_file_id)
+        return response
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=openai_error_status(e) or 500,
+            detail=f"Error retrieving Singlish batch: {str(e)}"
+        )
+
+
+def singlish_event_stream(get_transcript) -> StreamingResponse:
+    """SSE response: transcript, clean_english deltas, then the result"""
+    async def events():
+        try:
+            transcript = await get_transcript()
+            
+            if not transcript or not transcript.strip():
+                yield sse_event("error", {"detail": "Could not extract transcript from audio or transcript is empty"})
+                return
+            
+            yield sse_event("transcript", {"singlish_raw": transcript})
+            async for event in stream_translation(transcript):
+                yield event
+        except HTTPException as e:
+            yield sse_event("error", {"detail": e.detail})
+        except Exception as e:
+            yield sse_event("error", {"detail": f"Error processing Singlish: {str(e)}"})
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+# ==================== HELPER FUNCTIONS ====================
+
+# Voice activity detection before Whisper (opt-in, 16-bit PCM WAV input only)
+VAD_ENABLED = os.getenv("VAD_ENABLED", "false").lower() == "true" and VAD_AVAILABLE
+VAD_THRESHOLD = float(os.getenv("VAD_THRESHOLD", "0.01"))  # RMS level, 0-1 of full scale
+VAD_MIN_SILENCE_MS = int(os.getenv("VAD_MIN_SILENCE_MS", "500"))
+
+
+async def process_audio_with_whisper(audio_base64: str) -> str:
+    """
+    Convert base64 audio to transcript using OpenAI Whisper
+    
+    Args:
+        audio_base64: Base64 encoded audio string
+    
+    Returns:
+        Transcribed text
+    """
+    try:
+        # Decode base64 audio
+        audio_bytes = base64.b64decode(audio_base64)
+        
+        # Identical audio (e.g. a client retry) - reuse the transcript
+        audio_key = ExactCache.key(audio_bytes)
+        cached = transcription_cache.get(audio_key)
+        if cached is not None:
+            return cached
+        
+        # Drop silence (WAV only) - Whisper is billed per second of audio,
+        # and a clip with no speech needn't be sent at all
+        if VAD_ENABLED:
+            trimmed = await asyncio.to_thread(
+                trim_silence, audio_bytes, VAD_THRESHOLD, VAD_MIN_SILENCE_MS
+            )
+            if trimmed == b"":
+                return ""
+            if trimmed is not None:
+                audio_bytes = trimmed
+        
+        # Call Whisper API - the decoded bytes are sent straight from memory
+        client = get_async_openai_client()
+        filename = "audio.wav" if is_wav(audio_bytes) else "audio.webm"
+        transcription = await client.audio.transcriptions.create(
+            model="whisper-1",
+            file=(filename, audio_bytes),
+            language="en"  # Singlish is primarily English-based
+        )
+        
+        transcription_cache.set(audio_key, transcription.text)
+        return transcription.text
+    
+    except Exception as e:
+        raise Exception(f"Whisper STT failed: {str(e)}")
+
+
+# Uploads are read in chunks of this size (UploadFile.read runs in a worker
+# thread once the upload has spilled to disk, so bigger chunks mean fewer hops)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+async def hash_upload(audio: UploadFile) -> bytes:
+    """SHA-256 digest of an upload, read in chunks and rewound afterwards"""
+    digest = hashlib.sha256()
+    while chunk := await audio.read(UPLOAD_CHUNK_SIZE):
+        digest.update(chunk)
+    await audio.seek(0)
+    return digest.digest()
+
+
+async def transcribe_upload(audio: UploadFile) -> str:
+    """
+    Transcribe an uploaded file with Whisper, answering repeated recordings
+    from the transcription cache
+    
+    The bytes are read with UploadFile.read(), which runs the blocking
+    temp-file read in a thread - the async SDK would otherwise read the
+    spooled file synchronously on the event loop
+    """
+    audio_key = await hash_upload(audio)
+    cached = transcription_cache.get(audio_key)
+    if cached is not None:
+        return cached
+    
+    audio_bytes = await audio.read()
+    try:
+        client = get_async_openai_client()
+        transcription = await client.audio.transcriptions.create(
+            model="whisper-1",
+            file=(audio.filename or "audio.webm", audio_bytes),
+            language="en"  # Singlish is primarily English-based
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise Exception(f"Whisper STT failed: {str(e)}")
+    
+    transcription_cache.set(audio_key, transcription.text)
+    return transcription.text
+
+
+# ==================== TRANSLATION CACHE ====================
+
+# Exact-match caches, keyed on SHA-256 of the input - checked first since a
+# hit avoids every network call (including the embedding lookup below)
+EXACT_CACHE_MAX_ENTRIES = int(os.getenv("EXACT_CACHE_MAX_ENTRIES", "4096"))
+# transcript digest -> {clean_english, sentiment, tone}
+translation_cache = ExactCache(EXACT_CACHE_MAX_ENTRIES)
+# audio bytes digest -> Whisper transcript
+transcription_cache = ExactCache(EXACT_CACHE_MAX_ENTRIES)
+# Concurrent translations of the same transcript share one LLM call
+translation_coalescer = RequestCoalescer()
+
+
+def translation_key(transcript: str) -> bytes:
+    """translation_cache key - case and whitespace variants share an entry"""
+    return ExactCache.key(" ".join(transcript.lower().split()).encode("utf-8"))
+
+# Semantic cache: reuse a translation when a new transcript's embedding is
+# close enough to a previous one (e.g. repeated Singlish phrases).
+# Opt-in, since every miss costs an extra embeddings round-trip.
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.87"))
+SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "10000"))
+SEMANTIC_CACHE_PATH = os.getenv("SEMANTIC_CACHE_PATH")  # Optional, e.g. /var/data/singlish_cache
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+_semantic_cache: Optional[SemanticCache] = None
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """Get the semantic cache (loading it from disk once), or None if disabled"""
+    global _semantic_cache
+    if not SEMANTIC_CACHE_ENABLED or not SEMANTIC_CACHE_AVAILABLE:
+        return None
+    
+    if _semantic_cache is None:
+        _semantic_cache = SemanticCache(
+            threshold=SEMANTIC_CACHE_THRESHOLD,
+            max_entries=SEMANTIC_CACHE_MAX_ENTRIES
+        )
+        if SEMANTIC_CACHE_PATH:
+            _semantic_cache.load(SEMANTIC_CACHE_PATH)
+    return _semantic_cache
+
+
+async def prepare_translation() -> None:
+    """
+    Set up the translation stage ahead of time, e.g. while Whisper runs
+    Loads the semantic cache (disk read + numpy) off the event loop so the
+    first lookup doesn't pay for it. Never raises.
+    """
+    if _semantic_cache is not None or not SEMANTIC_CACHE_ENABLED:
+        return
+    try:
+        await asyncio.to_thread(get_semantic_cache)
+    except Exception as e:
+        log.warning("Could not load semantic cache: %s", e)
+
+
+def save_semantic_cache() -> None:
+    """Write the semantic cache to SEMANTIC_CACHE_PATH (called on shutdown)"""
+    if _semantic_cache is not None and SEMANTIC_CACHE_PATH:
+        _semantic_cache.save(SEMANTIC_CACHE_PATH)
+
+
+async def embed_transcript(transcript: str):
+    """L2-normalised embedding of a transcript for the semantic cache"""
+    client = get_async_openai_client()
+    response = await client.embeddings.create(model=EMBEDDING_MODEL, input=transcript)
+    return SemanticCache.normalize(response.data[0].embedding)
+
+
+async def lookup_translation(transcript: str):
+    """
+    Cached translation fields for a transcript (exact match first, then the
+    semantic cache when enabled)
+    
+    Returns:
+        (fields or None, embedding vector or None) - the vector is reused
+        to add the fresh result to the semantic cache on a miss
+    """
+    cached = translation_cache.get(translation_key(transcript))
+    if cached is not None:
+        return cached, None
+    
+    cache = get_semantic_cache()
+    vector = None
+    if cache is not None:
+        try:
+            vector = await embed_transcript(transcript)
+            cached = cache.lookup(vector)
+            if cached is not None:
+                # Entries may come from a cache file saved by an older version
+                return translation_fields(cached), vector
+        except Exception as e:
+            # The cache is only an optimisation - translate normally
+            log.warning("Semantic cache lookup failed: %s", e)
+    return None, vector
+
+
+def store_translation(transcript: str, vector, result: Dict[str, str]) -> None:
+    """Cache a fresh translation under its exact key (and vector, if any)"""
+    # Don't cache the placeholder returned for unparseable LLM output
+    if result.get("sentiment") == "unknown":
+        return
+    entry = {
+        "clean_english": result["clean_english"],
+        "sentiment": result["sentiment"],
+        "tone": result["tone"]
+    }
+    translation_cache.set(translation_key(transcript), entry)
+    cache = get_semantic_cache()
+    if vector is not None and cache is not None:
+        cache.add(vector, entry)
+
+
+async def translate_uncached(transcript: str, vector=None) -> Dict[str, str]:
+    """Translate after a cache miss, sharing the call with concurrent duplicates"""
+    result = await translation_coalescer.run(
+        translation_key(transcript), lambda: translate_with_llm(transcript)
+    )
+    # Callers sharing the call may have sent a case/spacing variant
+    result = {**result, "singlish_raw": transcript}
+    store_translation(transcript, vector, result)
+    return result
+
+
+async def translate_singlish_to_english(transcript: str) -> Dict[str, str]:
+    """
+    Translate Singlish to clean English and analyze sentiment/tone,
+    reusing a cached result for near-identical transcripts when enabled
+    
+    Args:
         transcript: Raw Singlish transcript
     
     Returns:
         Dictionary with singlish_raw, clean_english, sentiment, tone
     """
-    try:
-        # Create prompt for LLM
-        prompt = f"""You are an expert in Singlish (Singaporean English) and standard English translation.
+    cached, vector = await lookup_translation(transcript)
+    if cached is not None:
+        return {"singlish_raw": transcript, **cached}
+    return await translate_uncached(transcript, vector)
+
+
+# Prompts are module constants with the transcript last, so every request
+# shares a byte-identical prefix (eligible for OpenAI's prompt cache)
+# Translation is near-deterministic, and the JSON reply is short: a low
+# temperature keeps answers stable (and cacheable), and a tight token cap
+# bounds generation time for a runaway reply
+TRANSLATION_TEMPERATURE = 0.2
+TRANSLATION_MAX_TOKENS = 256
+
+TRANSLATION_SYSTEM_PROMPT = "You are a Singlish translation expert. Always respond with valid JSON only."
+TRANSLATION_SYSTEM_MESSAGE = {"role": "system", "content": TRANSLATION_SYSTEM_PROMPT}
+
+# Fixed instructions with the quoted transcript appended last, so every
+# request starts with identical tokens (what OpenAI's prompt caching keys on)
+TRANSLATION_PROMPT_PREFIX = """You are an expert in Singlish (Singaporean English) and standard English translation.
 
 Your task:
-1. Translate the following Singlish transcript into clear, natural Standard English
+1. Translate the Singlish transcript below into clear, natural Standard English
 2. Preserve the original meaning and intent
 3. Interpret Singlish slang, Malay words, Hokkien phrases, and dialect expressions
 4. Do NOT preserve slang literally - translate it properly
-5. Analyze the sentiment (e.g., happy, frustrated, angry, neutral, surprised)
-6. Describe the tone (e.g., informal, casual, urgent, polite, aggressive)
+5. Classify the sentiment as exactly one of: positive, negative, neutral, happy, excited, surprised, frustrated, angry, sad
+6. Classify the tone as exactly one of: casual, informal, polite, formal, urgent, annoyed, sarcastic, aggressive
+
+Respond ONLY in this exact JSON format (no markdown, no extra text):
+{
+    "clean_english": "your translation here",
+    "sentiment": "detected sentiment",
+    "tone": "detected tone"
+}
+
+Singlish transcript: \""""
 
-Singlish transcript: "{transcript}"
+
+# Used when sentiment/tone come from the local classifier - the LLM only translates
+TRANSLATION_ONLY_PROMPT_PREFIX = """You are an expert in Singlish (Singaporean English) and standard English translation.
+
+Your task:
+1. Translate the Singlish transcript below into clear, natural Standard English
+2. Preserve the original meaning and intent
+3. Interpret Singlish slang, Malay words, Hokkien phrases, and dialect expressions
+4. Do NOT preserve slang literally - translate it properly
 
 Respond ONLY in this exact JSON format (no markdown, no extra text):
-{{
+{
+    "clean_english": "your translation here"
+}
+
+Singlish transcript: \""""
+
+
+def build_translation_prompt(transcript: str) -> str:
+    """User prompt asking for clean English (plus sentiment and tone, unless classified locally) as JSON"""
+    if sentiment_classifier is not None:
+        return f'{TRANSLATION_ONLY_PROMPT_PREFIX}{transcript}"'
+    return f'{TRANSLATION_PROMPT_PREFIX}{transcript}"'
+
+
+def translation_messages(prompt: str) -> List[Dict[str, str]]:
+    """Chat messages for a translation prompt"""
+    return [TRANSLATION_SYSTEM_MESSAGE, {"role": "user", "content": prompt}]
+
+
+# ==================== LOCAL SENTIMENT ====================
+
+# Optional on-device sentiment classifier (quantized ONNX model + its
+# tokenizer.json). When loaded, the LLM only translates and sentiment/tone
+# are labelled locally in a few ms, saving output tokens on every call.
+SENTIMENT_MODEL_PATH = os.getenv("SENTIMENT_MODEL_PATH")
+SENTIMENT_TOKENIZER_PATH = os.getenv("SENTIMENT_TOKENIZER_PATH")
+
+
+def load_sentiment_classifier() -> Optional[SentimentClassifier]:
+    """Load the local classifier if configured, else None (LLM labels sentiment)"""
+    if not (SENTIMENT_MODEL_PATH and SENTIMENT_TOKENIZER_PATH):
+        return None
+    if not LOCAL_SENTIMENT_AVAILABLE:
+        log.warning("SENTIMENT_MODEL_PATH is set but onnxruntime/tokenizers aren't installed")
+        return None
+    try:
+        classifier = SentimentClassifier(SENTIMENT_MODEL_PATH, SENTIMENT_TOKENIZER_PATH)
+        log.info("Local sentiment classifier loaded")
+        return classifier
+    except Exception as e:
+        log.warning("Could not load sentiment classifier: %s", e)
+        return None
+
+
+sentiment_classifier = load_sentiment_classifier()
+
+
+# ==================== AUDIO-IN TRANSLATION ====================
+
+# Audio-capable chat model (e.g. gpt-4o-audio-preview) that transcribes and
+# translates in one call instead of Whisper + GPT. Off unless set.
+SINGLISH_AUDIO_MODEL = os.getenv("SINGLISH_AUDIO_MODEL", "")
+
+AUDIO_TRANSLATION_PROMPT = """You are an expert in Singlish (Singaporean English) and standard English translation.
+
+Your task:
+1. Transcribe the attached Singlish audio exactly as spoken
+2. Translate the transcript into clear, natural Standard English
+3. Preserve the original meaning and intent
+4. Interpret Singlish slang, Malay words, Hokkien phrases, and dialect expressions
+5. Do NOT preserve slang literally - translate it properly
+6. Classify the sentiment as exactly one of: positive, negative, neutral, happy, excited, surprised, frustrated, angry, sad
+7. Classify the tone as exactly one of: casual, informal, polite, formal, urgent, annoyed, sarcastic, aggressive
+
+Respond ONLY in this exact JSON format (no markdown, no extra text):
+{
+    "singlish_raw": "the transcript",
     "clean_english": "your translation here",
     "sentiment": "detected sentiment",
     "tone": "detected tone"
-}}"""
+}"""
 
+
+def audio_input_format(audio_base64: str) -> Optional[str]:
+    """
+    "wav" or "mp3" if the audio is a format chat models accept as input,
+    else None (e.g. browser webm/ogg recordings)
+    Only the first few bytes are decoded to sniff the header.
+    """
+    try:
+        header = base64.b64decode(audio_base64[:16])
+    except Exception:
+        return None
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        return "wav"
+    if header[:3] == b"ID3" or (len(header) > 1 and header[0] == 0xFF and header[1] & 0xE0 == 0xE0):
+        return "mp3"
+    return None
+
+
+async def translate_audio_with_llm(audio_base64: str) -> Optional[Dict[str, str]]:
+    """
+    Transcribe and translate audio with a single audio-in chat call
+    
+    Returns None when the audio format isn't supported or the call fails,
+    so the caller can fall back to Whisper + translation
+    """
+    audio_format = audio_input_format(audio_base64)
+    if audio_format is None:
+        return None
+    
+    try:
+        client = get_async_openai_client()
+        response = await client.chat.completions.create(
+            model=SINGLISH_AUDIO_MODEL,
+            modalities=["text"],
+            messages=[
+                TRANSLATION_SYSTEM_MESSAGE,
+                {
+                    "role": "user",
+                    "content": [
+                        {"type": "text", "text": AUDIO_TRANSLATION_PROMPT},
+                        {"type": "input_audio", "input_audio": {"data": audio_base64, "format": audio_format}}
+                    ]
+                }
+            ],
+            temperature=TRANSLATION_TEMPERATURE,
+            # The reply repeats the transcript as well as translating it
+            max_tokens=2 * TRANSLATION_MAX_TOKENS
+        )
+        result = orjson.loads(strip_code_fences(response.choices[0].message.content))
+        transcript = result["singlish_raw"]
+    except Exception as e:
+        log.warning("Audio-in translation failed (%s), using Whisper", e)
+        return None
+    
+    entry = translation_fields(result)
+    translation_cache.set(translation_key(transcript), entry)
+    return {"singlish_raw": transcript, **entry}
+
+
+async def translate_with_llm(transcript: str) -> Dict[str, str]:
+    """
+    Run the translation/sentiment LLM call (uncached)
+    Tries SEA-LION/Merlion first (if configured), falls back to OpenAI
+    
+    Args:
+        transcript: Raw Singlish transcript
+    
+    Returns:
+        Dictionary with singlish_raw, clean_english, sentiment, tone
+    """
+    try:
+        # Coalesce with concurrent requests into one GPT call (if enabled)
+        if translation_batcher.running:
+            return await translation_batcher.submit(transcript)
+        
+        # Create prompt for LLM
+        prompt = build_translation_prompt(transcript)
+        
         # Try SEA-LION/Merlion first (if configured)
         sea_lion_url = os.getenv("SEA_LION_API_URL")
         sea_lion_api_key = os.getenv("SEA_LION_API_KEY")
         
-        if sea_lion_url:
+        if sea_lion_url and sea_lion_circuit_closed():
             try:
-                return await call_sea_lion_api(sea_lion_url, sea_lion_api_key, prompt, transcript)
+                result = await call_sea_lion_api(sea_lion_url, sea_lion_api_key, prompt, transcript)
+                record_sea_lion_result(True)
+                return result
             except Exception as e:
                 # Fallback to OpenAI if SEA-LION fails
-                print(f"SEA-LION API failed: {e}, falling back to OpenAI")
+                record_sea_lion_result(False)
+                log.warning("SEA-LION API failed: %s, falling back to OpenAI", e)
         
         # Fallback to OpenAI
         return await call_openai_api(prompt, transcript)
@@ -1527,6 +2471,61 @@ Respond ONLY in this exact JSON format (no markdown, no extra text):
         raise Exception(f"Translation failed: {str(e)}")
 
 
+# SEA-LION translations reuse one pooled client instead of a new TCP+TLS
+# handshake per call
+SEA_LION_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+_sea_lion_client: Optional[httpx.AsyncClient] = None
+
+
+def get_sea_lion_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client for the SEA-LION API"""
+    global _sea_lion_client
+    
+    if _sea_lion_client is None:
+        _sea_lion_client = httpx.AsyncClient(timeout=30.0, limits=SEA_LION_HTTP_LIMITS, http2=True)
+    return _sea_lion_client
+
+
+# Circuit breaker: after SEA_LION_MAX_FAILURES failures in a row SEA-LION is
+# skipped for SEA_LION_COOLDOWN seconds, so an outage doesn't add a full
+# timeout to every translation. The first call after the cooldown probes it.
+SEA_LION_MAX_FAILURES = int(os.getenv("SEA_LION_MAX_FAILURES", "3"))
+SEA_LION_COOLDOWN = float(os.getenv("SEA_LION_COOLDOWN", "60"))
+
+sea_lion_failures = 0
+sea_lion_skip_until = 0.0
+
+
+def sea_lion_circuit_closed() -> bool:
+    """False while SEA-LION is being skipped after repeated failures"""
+    return time.monotonic() >= sea_lion_skip_until
+
+
+def record_sea_lion_result(success: bool) -> None:
+    global sea_lion_failures, sea_lion_skip_until
+    
+    if success:
+        sea_lion_failures = 0
+        return
+    sea_lion_failures += 1
+    if sea_lion_failures >= SEA_LION_MAX_FAILURES:
+        sea_lion_skip_until = time.monotonic() + SEA_LION_COOLDOWN
+        log.warning(
+            "SEA-LION failed %d times in a row, using OpenAI for %.0fs",
+            sea_lion_failures, SEA_LION_COOLDOWN
+        )
+
+
+async def close_sea_lion_client() -> None:
+    """Close the SEA-LION HTTP client on shutdown"""
+    global _sea_lion_client
+    
+    if _sea_lion_client is not None:
+        await _sea_lion_client.aclose()
+        _sea_lion_client = None
+
+
 async def call_sea_lion_api(api_url: str, api_key: Optional[str], prompt: str, transcript: str) -> Dict[str, str]:
     """
     Call SEA-LION or Merlion LLM API
@@ -1540,8 +2539,6 @@ async def call_sea_lion_api(api_url: str, api_key: Optional[str], prompt: str, t
     Returns:
         Dictionary with translation results
     """
-    import httpx
-    
     headers = {
         "Content-Type": "application/json"
     }
@@ -1551,48 +2548,26 @@ async def call_sea_lion_api(api_url: str, api_key: Optional[str], prompt: str, t
     # SEA-LION API format (official API)
     payload = {
         "model": "aisingapore/Gemma-SEA-LION-v4-27B-IT",
-        "messages": [
-            {
-                "role": "system",
-                "content": "You are a Singlish translation expert. Always respond with valid JSON only."
-            },
-            {
-                "role": "user",
-                "content": prompt
-            }
-        ],
-        "temperature": 0.7,
-        "max_tokens": 500
+        "messages": translation_messages(prompt),
+        "temperature": TRANSLATION_TEMPERATURE,
+        "max_tokens": TRANSLATION_MAX_TOKENS
     }
     
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        response = await client.post(api_url, json=payload, headers=headers)
-        response.raise_for_status()
-        result = response.json()
-        
-        # Parse response (adjust based on actual API response format)
-        if "choices" in result:
-            text = result["choices"][0]["message"]["content"].strip()
-        elif "text" in result:
-            text = result["text"].strip()
-        else:
-            text = str(result).strip()
-        
-        # Remove markdown code blocks if present
-        if text.startswith("```"):
-            text = text.split("```")[1]
-            if text.startswith("json"):
-                text = text[4:]
-            text = text.strip()
-        
-        result_data = json.loads(text)
-        
-        return {
-            "singlish_raw": transcript,
-            "clean_english": result_data.get("clean_english", ""),
-            "sentiment": result_data.get("sentiment", "neutral"),
-            "tone": result_data.get("tone", "informal")
-        }
+    response = await get_sea_lion_client().post(api_url, content=orjson.dumps(payload), headers=headers)
+    response.raise_for_status()
+    result = response_json(response)
+    
+    # Parse response (adjust based on actual API response format)
+    if "choices" in result:
+        text = result["choices"][0]["message"]["content"].strip()
+    elif "text" in result:
+        text = result["text"].strip()
+    else:
+        text = str(result).strip()
+    
+    result_data = orjson.loads(strip_code_fences(text))
+    
+    return {"singlish_raw": transcript, **translation_fields(result_data)}
 
 
 async def call_openai_api(prompt: str, transcript: str) -> Dict[str, str]:
@@ -1606,68 +2581,179 @@ async def call_openai_api(prompt: str, transcript: str) -> Dict[str, str]:
     Returns:
         Dictionary with translation results
     """
-    # Call GPT API (try gpt-4, fallback to gpt-3.5-turbo)
-    client = get_openai_client()
-    try:
-        model = "gpt-4"
-        response = client.chat.completions.create(
-            model=model,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You are a Singlish translation expert. Always respond with valid JSON only."
-                },
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            temperature=0.7,
-            max_tokens=500
-        )
-    except Exception as e:
-        # Fallback to gpt-3.5-turbo if gpt-4 is not available
-        if "gpt-4" in str(e).lower() or "model" in str(e).lower():
-            model = "gpt-3.5-turbo"
-            response = client.chat.completions.create(
+    # Call GPT API (TRANSLATION_MODEL, falling back to gpt-3.5-turbo)
+    response = await create_chat_completion(
+        get_async_openai_client(),
+        TRANSLATION_MODELS,
+        json_output=True,
+        schema=translation_schema(),
+        messages=translation_messages(prompt),
+        temperature=TRANSLATION_TEMPERATURE,
+        max_tokens=TRANSLATION_MAX_TOKENS
+    )
+    
+    # Parse response
+    return parse_translation_response(response.choices[0].message.content, transcript)
+
+
+# Models that accept response_format={"type": "json_object"} (JSON mode),
+# which guarantees a parseable reply. The original gpt-4 snapshot doesn't.
+JSON_MODE_MODEL_PREFIXES = ("gpt-3.5-turbo", "gpt-4-turbo", "gpt-4-1106", "gpt-4-0125", "gpt-4o")
+
+
+# Models that also take a JSON schema (Structured Outputs), which constrains
+# the reply to exactly the requested fields and labels
+STRUCTURED_OUTPUT_MODELS = frozenset({"gpt-4o"})
+STRUCTURED_OUTPUT_MODEL_PREFIXES = ("gpt-4o-mini", "gpt-4o-2024-08-06", "gpt-4o-2024-11-20")
+
+
+def json_mode(model: str, schema: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Extra completion kwargs enabling JSON output, if the model supports it
+    Constrained to schema (a response_format json_schema object) where possible
+    """
+    if schema is not None and (model in STRUCTURED_OUTPUT_MODELS or model.startswith(STRUCTURED_OUTPUT_MODEL_PREFIXES)):
+        return {"response_format": {"type": "json_schema", "json_schema": schema}}
+    if model.startswith(JSON_MODE_MODEL_PREFIXES):
+        return {"response_format": {"type": "json_object"}}
+    return {}
+
+
+def label_schema(labels: Tuple[str, ...]) -> Dict[str, Any]:
+    return {"type": "string", "enum": [label for label in labels if label != "unknown"]}
+
+
+# Structured Outputs schemas matching the two translation prompts
+TRANSLATION_SCHEMA = {
+    "name": "singlish_translation",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "clean_english": {"type": "string"},
+            "sentiment": label_schema(get_args(Sentiment)),
+            "tone": label_schema(get_args(Tone))
+        },
+        "required": ["clean_english", "sentiment", "tone"],
+        "additionalProperties": False
+    }
+}
+TRANSLATION_ONLY_SCHEMA = {
+    "name": "singlish_translation_only",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {"clean_english": {"type": "string"}},
+        "required": ["clean_english"],
+        "additionalProperties": False
+    }
+}
+
+
+def translation_schema() -> Dict[str, Any]:
+    """Schema for the reply build_translation_prompt asks for"""
+    return TRANSLATION_ONLY_SCHEMA if sentiment_classifier is not None else TRANSLATION_SCHEMA
+
+
+# Chat models in order of preference. A model the account can't use is
+# skipped, and remembered so later calls go straight to the next one.
+CHAT_MODELS = ("gpt-4", "gpt-3.5-turbo")
+# Translation model (e.g. gpt-4o-mini for schema-constrained replies), with
+# gpt-3.5-turbo as the fallback
+TRANSLATION_MODEL = os.getenv("TRANSLATION_MODEL", "gpt-4")
+TRANSLATION_MODELS = tuple(dict.fromkeys((TRANSLATION_MODEL, "gpt-3.5-turbo")))
+unavailable_models: set = set()
+
+
+def is_model_unavailable(exc: BaseException) -> bool:
+    """
+    True if OpenAI rejected the request because the model doesn't exist or
+    isn't enabled for this key - judged by the error type/code, not its
+    message ("This model's maximum context length..." is a request problem)
+    """
+    openai = sys.modules.get("openai")
+    if openai is None:
+        return False
+    return isinstance(exc, openai.NotFoundError) or getattr(exc, "code", None) == "model_not_found"
+
+
+async def create_chat_completion(
+    client,
+    models: Tuple[str, ...],
+    json_output: bool = False,
+    schema: Optional[Dict[str, Any]] = None,
+    stream: bool = False,
+    **kwargs
+):
+    """
+    chat.completions.create with the first of models that's available
+    Other errors (timeouts, rate limits, ...) are raised without trying
+    the next model. With stream=True the chunk stream is returned (model
+    errors surface when the request is made, before any chunk).
+    """
+    candidates = [model for model in models if model not in unavailable_models] or [models[-1]]
+    for model in candidates:
+        try:
+            return await client.chat.completions.create(
                 model=model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a Singlish translation expert. Always respond with valid JSON only."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                temperature=0.7,
-                max_tokens=500
+                **(json_mode(model, schema) if json_output else {}),
+                **({"stream": True} if stream else {}),
+                **kwargs
             )
-        else:
-            raise
-        
-    # Parse response
-    result_text = response.choices[0].message.content.strip()
+        except Exception as e:
+            if model == candidates[-1] or not is_model_unavailable(e):
+                raise
+            log.warning("OpenAI model %s unavailable (%s), trying the next one", model, e)
+            unavailable_models.add(model)
+
+
+# A reply wrapped in a ```json ... ``` block (closing fence optional, in case
+# the reply was cut off at max_tokens)
+CODE_FENCE_RE = re.compile(r"\s*```(?:json)?\s*(.*?)\s*(?:```|\Z)", re.DOTALL | re.IGNORECASE)
+
+
+def strip_code_fences(text: str) -> str:
+    """Remove a ```json ... ``` markdown wrapper from an LLM reply, if present"""
+    match = CODE_FENCE_RE.match(text)
+    return match.group(1) if match else text.strip()
+
+
+def translation_fields(result: Dict[str, Any]) -> Dict[str, str]:
+    """
+    clean_english, sentiment and tone from a parsed LLM reply, with labels
+    outside the fixed sets replaced by the defaults
+    Replies without labels (translation-only prompt) are classified locally.
+    """
+    if "sentiment" not in result and sentiment_classifier is not None:
+        clean_english = result.get("clean_english", "")
+        return {
+            "clean_english": clean_english,
+            "sentiment": sentiment_classifier.classify(clean_english) if clean_english else "neutral",
+            "tone": classify_tone(clean_english)
+        }
     
-    # Remove markdown code blocks if present
-    if result_text.startswith("```"):
-        result_text = result_text.split("```")[1]
-        if result_text.startswith("json"):
-            result_text = result_text[4:]
-        result_text = result_text.strip()
+    sentiment = str(result.get("sentiment", "")).strip().lower()
+    tone = str(result.get("tone", "")).strip().lower()
+    return {
+        "clean_english": result.get("clean_english", ""),
+        "sentiment": sentiment if sentiment in SENTIMENT_LABELS else "neutral",
+        "tone": tone if tone in TONE_LABELS else "informal"
+    }
+
+
+def parse_translation_response(result_text: str, transcript: str) -> Dict[str, str]:
+    """
+    Parse the LLM's JSON reply into the translation result
+    Returns an "unknown" placeholder if the reply isn't valid JSON
+    """
+    result_text = strip_code_fences(result_text)
     
     try:
-        result = json.loads(result_text)
+        result = orjson.loads(result_text)
         
-        return {
-            "singlish_raw": transcript,
-            "clean_english": result.get("clean_english", ""),
-            "sentiment": result.get("sentiment", "neutral"),
-            "tone": result.get("tone", "informal")
-        }
-    except json.JSONDecodeError:
-        # Fallback if JSON parsing fails
+        return {"singlish_raw": transcript, **translation_fields(result)}
+    except orjson.JSONDecodeError:
+        # Fallback if JSON parsing fails (models without JSON mode)
         return {
             "singlish_raw": transcript,
             "clean_english": "Translation error - invalid response format",
@@ -1677,3 +2763,325 @@ async def call_openai_api(prompt: str, transcript: str) -> Dict[str, str]:
     except Exception as e:
         raise Exception(f"OpenAI translation failed: {str(e)}")
 
+
+# ==================== BATCHING ====================
+
+# Opt-in micro-batching: concurrent translations within TRANSLATION_BATCH_WAIT_MS
+# share one GPT call. Only used with OpenAI (not when SEA-LION is configured).
+TRANSLATION_BATCHING_ENABLED = os.getenv("TRANSLATION_BATCHING_ENABLED", "false").lower() == "true"
+TRANSLATION_BATCH_SIZE = int(os.getenv("TRANSLATION_BATCH_SIZE", "8"))
+TRANSLATION_BATCH_WAIT_MS = int(os.getenv("TRANSLATION_BATCH_WAIT_MS", "25"))
+
+
+BATCH_TRANSLATION_PROMPT_TEMPLATE = """You are an expert in Singlish (Singaporean English) and standard English translation.
+
+Your task, for EACH numbered transcript below:
+1. Translate the Singlish transcript into clear, natural Standard English
+2. Preserve the original meaning and intent
+3. Interpret Singlish slang, Malay words, Hokkien phrases, and dialect expressions
+4. Do NOT preserve slang literally - translate it properly
+5. Classify the sentiment as exactly one of: positive, negative, neutral, happy, excited, surprised, frustrated, angry, sad
+6. Classify the tone as exactly one of: casual, informal, polite, formal, urgent, annoyed, sarcastic, aggressive
+
+Respond ONLY in this exact JSON format (no markdown, no extra text), with one entry per transcript in the same order:
+{{
+    "results": [
+        {{"clean_english": "your translation here", "sentiment": "detected sentiment", "tone": "detected tone"}}
+    ]
+}}
+
+Singlish transcripts:
+{numbered}"""
+
+
+def build_batch_translation_prompt(transcripts: list) -> str:
+    """Prompt asking for one translation result per numbered transcript"""
+    numbered = "\n".join(f'{i}. "{transcript}"' for i, transcript in enumerate(transcripts, 1))
+    return BATCH_TRANSLATION_PROMPT_TEMPLATE.format(numbered=numbered)
+
+
+async def translate_batch(transcripts: list) -> list:
+    """Translate several transcripts with a single GPT call"""
+    if len(transcripts) == 1:
+        return [await call_openai_api(build_translation_prompt(transcripts[0]), transcripts[0])]
+    
+    try:
+        response = await create_chat_completion(
+            get_async_openai_client(),
+            TRANSLATION_MODELS,
+            json_output=True,
+            messages=translation_messages(build_batch_translation_prompt(transcripts)),
+            temperature=TRANSLATION_TEMPERATURE,
+            max_tokens=TRANSLATION_MAX_TOKENS * len(transcripts)
+        )
+        results = orjson.loads(strip_code_fences(response.choices[0].message.content))["results"]
+        if len(results) != len(transcripts):
+            raise ValueError(f"expected {len(transcripts)} results, got {len(results)}")
+        return [
+            {"singlish_raw": transcript, **translation_fields(result)}
+            for transcript, result in zip(transcripts, results)
+        ]
+    except Exception as e:
+        # Failed call or malformed batch reply - translate each transcript on
+        # its own, so one transcript's error doesn't fail the whole batch
+        log.warning("Batched translation failed (%s), translating individually", e)
+        return await asyncio.gather(*(
+            call_openai_api(build_translation_prompt(transcript), transcript)
+            for transcript in transcripts
+        ), return_exceptions=True)
+
+
+translation_batcher = MicroBatcher(
+    translate_batch,
+    max_batch=TRANSLATION_BATCH_SIZE,
+    max_wait=TRANSLATION_BATCH_WAIT_MS / 1000
+)
+
+
+def start_translation_batcher() -> None:
+    """Start the translation batcher if enabled (called from the app lifespan)"""
+    if TRANSLATION_BATCHING_ENABLED and not os.getenv("SEA_LION_API_URL"):
+        translation_batcher.start()
+
+
+# ==================== BATCH API ====================
+
+# Offline translations (POST /process-singlish/batch) go through the OpenAI
+# Batch API: same prompt, half the token price, separate rate limit
+BATCH_API_MODEL = TRANSLATION_MODEL
+
+
+def batch_request_line(index: int, transcript: str) -> bytes:
+    """One Batch API input line (custom_id is the transcript's position)"""
+    return orjson.dumps({
+        "custom_id": str(index),
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": {
+            "model": BATCH_API_MODEL,
+            "messages": translation_messages(build_translation_prompt(transcript)),
+            "temperature": TRANSLATION_TEMPERATURE,
+            "max_tokens": TRANSLATION_MAX_TOKENS,
+            **json_mode(BATCH_API_MODEL, translation_schema())
+        }
+    })
+
+
+async def submit_translation_batch(transcripts: List[str]):
+    """Upload the requests as JSONL and start a 24h Batch API job"""
+    client = get_async_openai_client()
+    jsonl = b"\n".join(batch_request_line(i, transcript) for i, transcript in enumerate(transcripts))
+    input_file = await client.files.create(file=("singlish_batch.jsonl", jsonl), purpose="batch")
+    return await client.batches.create(
+        input_file_id=input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h"
+    )
+
+
+async def translation_batch_results(output_file_id: str) -> List[Dict[str, Any]]:
+    """Parsed results of a completed translation batch, in submission order"""
+    client = get_async_openai_client()
+    output = await client.files.content(output_file_id)
+    
+    results = []
+    for line in output.content.splitlines():
+        if not line.strip():
+            continue
+        item = orjson.loads(line)
+        index = int(item["custom_id"])
+        body = (item.get("response") or {}).get("body") or {}
+        try:
+            text = body["choices"][0]["message"]["content"]
+            results.append({"index": index, **translation_fields(orjson.loads(strip_code_fences(text)))})
+        except (KeyError, IndexError, TypeError, ValueError):
+            error = item.get("error") or body.get("error") or "Unparseable translation"
+            results.append({"index": index, "error": error})
+    
+    results.sort(key=lambda result: result["index"])
+    return results
+
+
+# ==================== GENERAL ANSWERS ====================
+
+GENERAL_SYSTEM_PROMPT = "You are a helpful community platform assistant. Answer questions concisely and friendly."
+GENERAL_SYSTEM_MESSAGE = {"role": "system", "content": GENERAL_SYSTEM_PROMPT}
+
+# Words in a general question that make the events list worth adding to the prompt
+GENERAL_EVENT_KEYWORDS = frozenset({
+    "event", "events", "activity", "activities", "class", "classes", "session", "sessions",
+    "book", "booking", "register", "join", "cancel", "happening", "when", "where", "upcoming"
+})
+
+GENERAL_PROMPT_TEMPLATE = """You are a helpful assistant for a community engagement platform. Answer the user's question in a friendly, concise way.
+
+User question: "{question}"
+{events_context}
+
+Context about this platform:
+- Users can book/register for events
+- Users can view event details
+- Users can cancel event registrations
+- Users can trigger emergency SOS calls
+- The platform helps connect community members
+
+Answer the user's question helpfully. If they're asking about how to use the platform, provide clear instructions. If they're asking about events, reference the available events above if relevant. Keep your response concise (2-3 sentences max) and friendly."""
+
+# Shown when a general question can't be answered (GPT unavailable or failing)
+HELP_MESSAGE = (
+    "I can help you with:\n"
+    "• Booking events (say 'book event' or 'register for event')\n"
+    "• Viewing events (say 'show events' or 'list events')\n"
+    "• Getting event details (say 'tell me about [event name]')\n"
+    "• Canceling events (say 'cancel [event name]')\n"
+    "• Emergency help (say 'help' or 'emergency')\n"
+    "• And more! What would you like to do?"
+)
+
+# Concurrent users asking the same thing (e.g. "what can you do?" with the
+# same events list) share one GPT call
+general_answer_coalescer = RequestCoalescer()
+
+
+async def answer_general_question(client, prompt: str) -> str:
+    """GPT answer for a general question (gpt-4, falling back to gpt-3.5-turbo)"""
+    async def ask() -> str:
+        messages = [
+            GENERAL_SYSTEM_MESSAGE,
+            {"role": "user", "content": prompt}
+        ]
+        response = await create_chat_completion(
+            client,
+            CHAT_MODELS,
+            messages=messages,
+            temperature=0.7,
+            max_tokens=200
+        )
+        return response.choices[0].message.content.strip()
+    
+    key = hashlib.sha256(prompt.encode("utf-8")).digest()
+    return await general_answer_coalescer.run(key, ask)
+
+
+# ==================== STREAMING ====================
+
+def sse_event(event: str, data: Dict[str, Any]) -> bytes:
+    """Format one Server-Sent Event with a JSON payload"""
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+@functools.lru_cache(maxsize=None)
+def json_field_start(field: str) -> "re.Pattern":
+    """Compiled pattern for the start of a JSON string field (compiled once per field)"""
+    return re.compile(r'"' + re.escape(field) + r'"\s*:\s*"')
+
+
+class JsonStringFieldStreamer:
+    """
+    Incrementally decode one string field of a JSON object as it streams in
+    feed() returns the characters of the field's value that became
+    available since the previous call
+    """
+    _ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+    
+    def __init__(self, field: str):
+        self._start = json_field_start(field)
+        self._buffer = ""
+        self._pos: Optional[int] = None  # next unread index inside the value
+        self.done = False
+    
+    def feed(self, text: str) -> str:
+        self._buffer += text
+        if self.done:
+            return ""
+        if self._pos is None:
+            match = self._start.search(self._buffer)
+            if not match:
+                return ""
+            self._pos = match.end()
+        
+        buf, i, out = self._buffer, self._pos, []
+        while i < len(buf):
+            ch = buf[i]
+            if ch == '"':
+                self.done = True
+                break
+            if ch != "\\":
+                out.append(ch)
+                i += 1
+                continue
+            # Escape sequence - wait for the rest of it if it's split across chunks
+            if i + 1 >= len(buf):
+                break
+            if buf[i + 1] != "u":
+                out.append(self._ESCAPES.get(buf[i + 1], buf[i + 1]))
+                i += 2
+                continue
+            if i + 6 > len(buf):
+                break
+            code = int(buf[i + 2:i + 6], 16)
+            if 0xD800 <= code <= 0xDBFF:
+                # Surrogate pair (e.g. emoji) - needs the low half too
+                if i + 12 > len(buf):
+                    break
+                low = int(buf[i + 8:i + 12], 16)
+                out.append(chr(0x10000 + ((code - 0xD800) << 10) + (low - 0xDC00)))
+                i += 12
+            else:
+                out.append(chr(code))
+                i += 6
+        self._pos = i
+        return "".join(out)
+
+
+async def stream_translation(transcript: str):
+    """
+    Yield SSE events for a translation: clean_english deltas as GPT
+    generates them, then the full result
+    
+    Cache hits, SEA-LION deployments and duplicates of an in-flight
+    translation go through the non-streaming path and yield a single delta.
+    """
+    cached, vector = await lookup_translation(transcript)
+    client = None
+    if cached is None:
+        try:
+            client = get_async_openai_client()
+        except HTTPException:
+            pass
+        if (
+            client is None
+            or os.getenv("SEA_LION_API_URL")
+            or translation_key(transcript) in translation_coalescer
+        ):
+            cached = await translate_uncached(transcript, vector)
+    if cached is not None:
+        yield sse_event("clean_english", {"delta": cached["clean_english"]})
+        yield sse_event("result", {**cached, "singlish_raw": transcript})
+        return
+    
+    stream = await create_chat_completion(
+        client,
+        TRANSLATION_MODELS,
+        json_output=True,
+        schema=translation_schema(),
+        stream=True,
+        messages=translation_messages(build_translation_prompt(transcript)),
+        temperature=TRANSLATION_TEMPERATURE,
+        max_tokens=TRANSLATION_MAX_TOKENS
+    )
+    
+    streamer = JsonStringFieldStreamer("clean_english")
+    parts = []
+    async for chunk in stream:
+        if not chunk.choices or not chunk.choices[0].delta.content:
+            continue
+        text = chunk.choices[0].delta.content
+        parts.append(text)
+        delta = streamer.feed(text)
+        if delta:
+            yield sse_event("clean_english", {"delta": delta})
+    
+    result = parse_translation_response("".join(parts), transcript)
+    store_translation(transcript, vector, result)
+    yield sse_event("result", result)
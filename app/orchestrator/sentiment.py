@@ -0,0 +1,74 @@
+"""
+Local Sentiment and Tone Classification
+Optional on-device replacement for the sentiment/tone part of the Singlish
+translation LLM call - a small quantized ONNX classifier (e.g. an int8 export
+of distilbert-base-uncased-finetuned-sst-2-english) plus keyword rules for tone
+"""
+
+import re
+from typing import Tuple
+
+try:
+    import numpy as np
+    import onnxruntime
+    from tokenizers import Tokenizer
+except ImportError:  # onnxruntime/tokenizers are optional - the LLM labels sentiment without them
+    onnxruntime = None
+
+LOCAL_SENTIMENT_AVAILABLE = onnxruntime is not None
+
+# Tone keywords, checked in order (first match wins)
+TONE_PATTERNS = (
+    ("urgent", re.compile(r"\b(urgent|urgently|emergency|asap|immediately|hurry|quickly|right now|help)\b")),
+    ("polite", re.compile(r"\b(please|thank|thanks|kindly|sorry|excuse me|appreciate)\b")),
+    ("annoyed", re.compile(r"\b(annoying|annoyed|fed up|sick of|so slow|ridiculous|why is|why does)\b")),
+    ("aggressive", re.compile(r"\b(shut up|idiot|stupid|damn|hell)\b")),
+)
+
+
+def classify_tone(text: str) -> str:
+    """Tone label for English text from keyword rules (default casual)"""
+    text = text.lower()
+    for tone, pattern in TONE_PATTERNS:
+        if pattern.search(text):
+            return tone
+    return "casual"
+
+
+class SentimentClassifier:
+    """
+    Binary (negative/positive) sentiment classifier run with onnxruntime on CPU
+
+    Predictions below min_confidence are reported as neutral.
+    """
+
+    def __init__(self, model_path: str, tokenizer_path: str, min_confidence: float = 0.75, max_length: int = 128):
+        if onnxruntime is None:
+            raise RuntimeError("SentimentClassifier requires onnxruntime and tokenizers")
+        self.min_confidence = min_confidence
+        self._session = onnxruntime.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+        self._input_names = {i.name for i in self._session.get_inputs()}
+        self._tokenizer = Tokenizer.from_file(tokenizer_path)
+        self._tokenizer.enable_truncation(max_length)
+
+    def predict(self, text: str) -> Tuple[str, float]:
+        """(label, confidence) for one text"""
+        encoding = self._tokenizer.encode(text)
+        inputs = {
+            "input_ids": np.array([encoding.ids], dtype=np.int64),
+            "attention_mask": np.array([encoding.attention_mask], dtype=np.int64)
+        }
+        if "token_type_ids" in self._input_names:
+            inputs["token_type_ids"] = np.array([encoding.type_ids], dtype=np.int64)
+
+        logits = self._session.run(None, inputs)[0][0]
+        probs = np.exp(logits - logits.max())
+        probs /= probs.sum()
+        index = int(probs.argmax())
+        confidence = float(probs[index])
+        if confidence < self.min_confidence:
+            return "neutral", confidence
+        return ("negative", "positive")[index], confidence
+
+    def classify(self, text: str) -> str:
+        return self.predict(text)[0]
@@ -0,0 +1,108 @@
+"""
+Voice Activity Detection
+Energy-based silence trimming for PCM WAV audio before it is sent to Whisper
+(billed and processed per second of audio)
+"""
+
+import io
+import wave
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional - audio is sent to Whisper untrimmed without it
+    np = None
+
+VAD_AVAILABLE = np is not None
+
+FRAME_MS = 30
+
+
+def is_wav(audio_bytes: bytes) -> bool:
+    return audio_bytes[:4] == b"RIFF" and audio_bytes[8:12] == b"WAVE"
+
+
+def speech_segments(
+    samples: "np.ndarray",
+    sample_rate: int,
+    threshold: float,
+    min_silence_ms: int,
+    padding_ms: int
+) -> List[Tuple[int, int]]:
+    """
+    (start, end) sample ranges containing speech
+
+    A frame is speech when its RMS level (relative to full scale) is at least
+    threshold. Silences shorter than min_silence_ms are kept, and each segment
+    is padded by padding_ms so word onsets aren't clipped.
+    """
+    frame = max(1, sample_rate * FRAME_MS // 1000)
+    count = len(samples) // frame
+    if count == 0:
+        return []
+
+    frames = samples[:count * frame].reshape(count, frame)
+    rms = np.sqrt(np.mean(np.square(frames), axis=1))
+    voiced = np.flatnonzero(rms >= threshold)
+    if len(voiced) == 0:
+        return []
+
+    max_gap = max(1, min_silence_ms // FRAME_MS)
+    pad = padding_ms * sample_rate // 1000
+    segments = []
+    start = prev = int(voiced[0])
+    for index in voiced[1:]:
+        index = int(index)
+        if index - prev > max_gap:
+            segments.append((start, prev))
+            start = index
+        prev = index
+    segments.append((start, prev))
+
+    return [
+        (max(0, first * frame - pad), min(len(samples), (last + 1) * frame + pad))
+        for first, last in segments
+    ]
+
+
+def trim_silence(
+    audio_bytes: bytes,
+    threshold: float = 0.01,
+    min_silence_ms: int = 500,
+    padding_ms: int = 200
+) -> Optional[bytes]:
+    """
+    Remove silence from 16-bit PCM WAV audio
+
+    Returns the trimmed WAV, b"" if the clip has no speech, or None if the
+    audio can't be analysed (not 16-bit PCM WAV, or numpy missing) and should
+    be sent as-is.
+    """
+    if np is None or not is_wav(audio_bytes):
+        return None
+    try:
+        with wave.open(io.BytesIO(audio_bytes), "rb") as wav:
+            params = wav.getparams()
+            if params.sampwidth != 2:
+                return None
+            pcm = np.frombuffer(wav.readframes(params.nframes), dtype="<i2")
+    except (wave.Error, EOFError):
+        return None
+
+    # Analyse the first channel, splice all channels
+    frames = pcm.reshape(-1, params.nchannels)
+    samples = frames[:, 0].astype(np.float32) / 32768.0
+    segments = speech_segments(samples, params.framerate, threshold, min_silence_ms, padding_ms)
+    if not segments:
+        return b""
+    if len(segments) == 1 and segments[0] == (0, len(samples)):
+        return audio_bytes
+
+    speech = np.concatenate([frames[start:end] for start, end in segments])
+    out = io.BytesIO()
+    with wave.open(out, "wb") as wav:
+        wav.setnchannels(params.nchannels)
+        wav.setsampwidth(2)
+        wav.setframerate(params.framerate)
+        wav.writeframes(speech.astype("<i2").tobytes())
+    return out.getvalue()
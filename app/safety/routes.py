@@ -7,6 +7,7 @@ from twilio.rest import Client
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
+from app.shared.http import response_json
 from app.shared.supabase import get_supabase_client
 
 # Try to import zoneinfo for timezone handling
@@ -52,7 +53,7 @@ async def reverse_geocode(latitude: float, longitude: float, full_address: bool
         async with httpx.AsyncClient(timeout=5.0) as client:
             response = await client.get(url, params=params, headers=headers)
             if response.status_code == 200:
-                data = response.json()
+                data = response_json(response)
                 address = data.get("address", {})
                 display_name = data.get("display_name", "")
                 
@@ -0,0 +1,64 @@
+"""
+Shared HTTP Client
+One pooled httpx client for internal API calls (orchestrator -> events/safety)
+"""
+
+from typing import Any, Optional
+import httpx
+import orjson
+
+# Kept alive across requests so internal calls reuse warm connections
+# instead of a new TCP (+TLS) handshake per incoming request. Over https
+# (API_BASE_URL in production) HTTP/2 multiplexes the 2-3 calls one user
+# request makes over a single connection; plain-http localhost stays HTTP/1.1
+INTERNAL_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=200)
+# Connecting to our own API should be near-instant - fail fast if it isn't
+INTERNAL_HTTP_TIMEOUT = httpx.Timeout(30.0, connect=3.0)
+
+JSON_HEADERS = {"content-type": "application/json"}
+
+http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared async HTTP client
+    Created in the app lifespan; pass timeout= per call to override the default
+    """
+    global http_client
+
+    if http_client is None:
+        http_client = httpx.AsyncClient(timeout=INTERNAL_HTTP_TIMEOUT, limits=INTERNAL_HTTP_LIMITS, http2=True)
+
+    return http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client on shutdown"""
+    global http_client
+
+    if http_client is not None:
+        await http_client.aclose()
+        http_client = None
+
+
+async def post_json(url: str, payload: Any, **kwargs) -> httpx.Response:
+    """POST payload as JSON on the shared client, encoded with orjson"""
+    return await get_http_client().post(url, content=orjson.dumps(payload), headers=JSON_HEADERS, **kwargs)
+
+
+def response_json(response: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson (raises ValueError if invalid)"""
+    return orjson.loads(response.content)
+
+
+def response_error_detail(response: httpx.Response) -> str:
+    """FastAPI-style "detail" of an error response, or its body text"""
+    if response.headers.get("content-type", "").startswith("application/json"):
+        try:
+            body = response_json(response)
+        except ValueError:
+            body = None
+        if isinstance(body, dict) and body.get("detail"):
+            return str(body["detail"])
+    return response.text
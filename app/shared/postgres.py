@@ -0,0 +1,99 @@
+"""
+Direct Postgres Connection Pool
+Optional asyncpg pool for hot read endpoints, routed through Supabase's
+Supavisor/PgBouncer transaction pooler so many workers share a few backends
+"""
+
+import datetime
+import os
+import uuid
+from urllib.parse import urlsplit
+from typing import Any, Dict, Optional
+from dotenv import load_dotenv
+
+try:
+    import asyncpg
+except ImportError:  # asyncpg is optional - reads fall back to supabase-py
+    asyncpg = None
+
+# Load environment variables
+load_dotenv()
+
+# Pooled connection string, e.g. the Supavisor transaction-mode endpoint:
+# postgresql://postgres.<project>:<password>@aws-0-<region>.pooler.supabase.com:6543/postgres
+DATABASE_URL = os.getenv("DATABASE_URL")
+
+PG_POOL_MIN_SIZE = int(os.getenv("PG_POOL_MIN_SIZE", "5"))
+PG_POOL_MAX_SIZE = int(os.getenv("PG_POOL_MAX_SIZE", "20"))
+PG_COMMAND_TIMEOUT = float(os.getenv("PG_COMMAND_TIMEOUT", "5"))
+
+# Supabase's pooler listens on 6543 in transaction mode and 5432 in session mode
+PG_TRANSACTION_POOLER_PORT = 6543
+
+pg_pool: Optional["asyncpg.Pool"] = None
+
+
+def statement_cache_size() -> int:
+    """
+    Size of asyncpg's per-connection prepared statement cache
+    
+    Hot queries (e.g. event by id) are parsed and planned once per connection
+    and then reused. Transaction pooling can hand each query a different
+    backend, where the prepared statement doesn't exist, so caching is off there.
+    PG_STATEMENT_CACHE_SIZE overrides the choice.
+    """
+    override = os.getenv("PG_STATEMENT_CACHE_SIZE")
+    if override is not None:
+        return int(override)
+    if DATABASE_URL and urlsplit(DATABASE_URL).port == PG_TRANSACTION_POOLER_PORT:
+        return 0
+    return 100
+
+
+async def create_pg_pool() -> Optional["asyncpg.Pool"]:
+    """
+    Create the asyncpg pool if DATABASE_URL is set and asyncpg is installed
+    Returns None otherwise, and callers use the Supabase client instead
+    """
+    global pg_pool
+
+    if pg_pool is None and DATABASE_URL and asyncpg is not None:
+        pg_pool = await asyncpg.create_pool(
+            DATABASE_URL,
+            min_size=PG_POOL_MIN_SIZE,
+            max_size=PG_POOL_MAX_SIZE,
+            statement_cache_size=statement_cache_size(),
+            command_timeout=PG_COMMAND_TIMEOUT
+        )
+        print("✅ Connected to Postgres pooler (asyncpg)")
+
+    return pg_pool
+
+
+def get_pg_pool() -> Optional["asyncpg.Pool"]:
+    """The asyncpg pool, or None if direct Postgres access isn't configured"""
+    return pg_pool
+
+
+async def close_pg_pool() -> None:
+    """Close the asyncpg pool on shutdown"""
+    global pg_pool
+
+    if pg_pool is not None:
+        await pg_pool.close()
+        pg_pool = None
+
+
+def record_to_dict(record) -> Dict[str, Any]:
+    """
+    Convert an asyncpg Record to the same JSON-ready shape PostgREST returns
+    (UUIDs and dates/times as strings)
+    """
+    row = {}
+    for key, value in record.items():
+        if isinstance(value, uuid.UUID):
+            value = str(value)
+        elif isinstance(value, (datetime.date, datetime.time)):
+            value = value.isoformat()
+        row[key] = value
+    return row
@@ -3,9 +3,12 @@ Supabase Connection and Configuration
 Shared database connection for all modules
 """
 
+import asyncio
 import os
 from typing import Dict, Any, Optional
-from supabase import create_client, Client
+import httpx
+from fastapi import Request
+from supabase import create_client, acreate_client, Client, AsyncClient
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -15,8 +18,16 @@ load_dotenv()
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 
-# Initialize Supabase client
+# Connection pool for the async PostgREST session - kept alive across requests
+# so each query reuses a warm TCP/TLS connection instead of a new handshake
+SUPABASE_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100)
+SUPABASE_HTTP_TIMEOUT = httpx.Timeout(5.0, connect=2.0)
+# Number of concurrent queries fired at startup to open pooled connections
+SUPABASE_WARM_CONNECTIONS = int(os.getenv("SUPABASE_WARM_CONNECTIONS", "8"))
+
+# Initialize Supabase clients
 supabase: Optional[Client] = None
+async_supabase: Optional[AsyncClient] = None
 
 
 def get_supabase_client() -> Client:
@@ -38,14 +49,71 @@ def get_supabase_client() -> Client:
     return supabase
 
 
-def test_connection() -> bool:
+async def get_async_supabase_client() -> AsyncClient:
+    """
+    Get or create the async Supabase client instance
+    Used by async route handlers so queries don't tie up the threadpool
+    """
+    global async_supabase
+    
+    if async_supabase is None:
+        if not SUPABASE_URL or not SUPABASE_KEY:
+            raise ValueError(
+                "Supabase credentials not found. "
+                "Please set SUPABASE_URL and SUPABASE_KEY in your .env file"
+            )
+        
+        client = await acreate_client(SUPABASE_URL, SUPABASE_KEY)
+        
+        # Swap PostgREST's default session for a pooled HTTP/2 one,
+        # keeping its base URL and auth/schema headers
+        default_session = client.postgrest.session
+        client.postgrest.session = httpx.AsyncClient(
+            base_url=default_session.base_url,
+            headers=default_session.headers,
+            timeout=SUPABASE_HTTP_TIMEOUT,
+            limits=SUPABASE_HTTP_LIMITS,
+            http2=True,
+            follow_redirects=True
+        )
+        await default_session.aclose()
+        
+        async_supabase = client
+        print("✅ Connected to Supabase (async)")
+    
+    return async_supabase
+
+
+async def close_async_supabase_client() -> None:
+    """Close the pooled PostgREST session on shutdown"""
+    global async_supabase
+    
+    if async_supabase is not None:
+        await async_supabase.postgrest.aclose()
+        async_supabase = None
+
+
+async def get_db(request: Request) -> AsyncClient:
+    """
+    FastAPI dependency returning the shared async Supabase client
+    The client is created once in the app lifespan and stored on app.state
+    """
+    client = getattr(request.app.state, "supabase", None)
+    if client is None:
+        # Startup couldn't connect (e.g. missing credentials) - try again now
+        client = await get_async_supabase_client()
+        request.app.state.supabase = client
+    return client
+
+
+async def test_connection() -> bool:
     """
     Test the Supabase connection
     """
     try:
-        client = get_supabase_client()
-        # Try a simple query to test connection
-        response = client.table('events').select("count", count='exact').limit(0).execute()
+        client = await get_async_supabase_client()
+        # HEAD count query - returns only a Content-Range header, no rows
+        await client.table('events').select('id', count='exact', head=True).limit(1).execute()
         print("✅ Supabase connection test successful")
         return True
     except Exception as e:
@@ -53,6 +121,20 @@ def test_connection() -> bool:
         return False
 
 
+async def warm_connection_pool(connections: int = SUPABASE_WARM_CONNECTIONS) -> None:
+    """
+    Open pooled connections at startup so the first requests after a
+    deploy don't pay the TCP/TLS handshake
+    """
+    client = await get_async_supabase_client()
+    results = await asyncio.gather(
+        *(client.table('events').select('id').limit(1).execute() for _ in range(connections)),
+        return_exceptions=True
+    )
+    warmed = sum(not isinstance(result, Exception) for result in results)
+    print(f"✅ Warmed Supabase connection pool ({warmed}/{connections} queries)")
+
+
 # Helper function to handle Supabase responses
 def handle_supabase_response(response) -> Dict[str, Any]:
     """
@@ -49,6 +49,8 @@ END $$;
 
 -- Create indexes for better query performance
 CREATE INDEX IF NOT EXISTS idx_events_date ON events(date);
+-- Matches the /list sort order so keyset pagination is an index range scan
+CREATE INDEX IF NOT EXISTS idx_events_date_time_id ON events(date, time, id);
 CREATE INDEX IF NOT EXISTS idx_events_created_by ON events(created_by);
 CREATE INDEX IF NOT EXISTS idx_event_registrations_event_id ON event_registrations(event_id);
 CREATE INDEX IF NOT EXISTS idx_event_registrations_user_id ON event_registrations(user_id);
@@ -0,0 +1,37 @@
+"""
+Route table checks for the FastAPI app
+Runs offline - imports the app without starting a server
+
+Run with: python -m pytest test/test_app_routes.py
+"""
+import collections
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.main import app
+
+
+def test_each_route_mounted_once():
+    """Every router is included exactly once - no duplicate method/path pairs"""
+    seen = collections.Counter(
+        (method, route.path)
+        for route in app.routes
+        for method in (getattr(route, "methods", None) or ())
+    )
+    duplicates = [key for key, count in seen.items() if count > 1]
+    assert duplicates == []
+
+
+def test_module_prefixes_mounted():
+    paths = [route.path for route in app.routes]
+    for prefix in ("/api/events", "/api/wellness", "/api/safety", "/api/orchestrator"):
+        assert any(path.startswith(f"{prefix}/") for path in paths)
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"✅ {name}")
@@ -0,0 +1,188 @@
+"""
+Query-count tests for the Events routes
+Runs offline against a fake Supabase client - no server or database needed
+
+Run with: python -m pytest test/test_events_queries.py
+"""
+import asyncio
+import datetime
+import sys
+import os
+import uuid
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import app.events.routes as events_routes
+from fastapi import HTTPException, Response
+
+
+EVENT_ID = "11111111-2222-3333-4444-555555555555"
+USER_ID = "66666666-7777-8888-9999-000000000000"
+
+
+class FakeResponse:
+    """Mimics a postgrest APIResponse"""
+    def __init__(self, data):
+        self.data = data
+        self.count = len(data)
+
+
+class FakeRequest:
+    """Just enough of a Starlette Request for the conditional GET checks"""
+    def __init__(self, headers=None):
+        self.headers = {k.lower(): v for k, v in (headers or {}).items()}
+
+
+class FakeQuery:
+    """Records builder calls and counts execute() round-trips"""
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.head = False
+
+    def select(self, *columns, head=False, **kwargs):
+        self.head = head
+        return self
+
+    def __getattr__(self, name):
+        def builder(*args, **kwargs):
+            return self
+        return builder
+
+    async def execute(self):
+        self.client.executes.append((self.table, self.head))
+        if self.client.empty:
+            return FakeResponse([])
+        return FakeResponse([{"id": EVENT_ID, "event_id": EVENT_ID, "user_id": USER_ID,
+                             "title": "Yoga", "date": "2025-12-15", "time": "09:00:00",
+                             "updated_at": "2025-12-10T08:30:00.123456+00:00"}])
+
+
+class FakeSupabase:
+    def __init__(self, empty=False):
+        self.executes = []
+        self.empty = empty
+
+    def table(self, name):
+        return FakeQuery(self, name)
+
+
+def run_with_fake(handler, *args):
+    """Run a route handler against a fresh fake client, return execute() count"""
+    fake = FakeSupabase()
+    events_routes.invalidate_event_caches()
+    events_routes.event_cache.clear()
+    asyncio.run(handler(*args, supabase=fake))
+    return len(fake.executes)
+
+
+def test_list_events_single_query():
+    """Participant counts are embedded - listing is one query"""
+    assert run_with_fake(events_routes.get_events, FakeRequest(), Response(), None, 50, 0) == 1
+
+
+def test_list_events_keyset_cursor():
+    """Keyset pages are one query and hand back the last row as the cursor"""
+    fake = FakeSupabase()
+    events_routes.invalidate_event_caches()
+    result = asyncio.run(events_routes.get_events(
+        FakeRequest(), Response(), None, 1, 0,
+        datetime.date(2025, 12, 15), datetime.time(9, 0), uuid.UUID(EVENT_ID),
+        supabase=fake
+    ))
+    assert len(fake.executes) == 1
+    assert result["next_cursor"] == {"after_date": "2025-12-15", "after_time": "09:00:00", "after_id": EVENT_ID}
+
+
+def test_list_events_rejects_impossible_date():
+    """A well-shaped but invalid date is a 400, not a database error"""
+    fake = FakeSupabase()
+    events_routes.invalidate_event_caches()
+    try:
+        asyncio.run(events_routes.get_events(FakeRequest(), Response(), "2025-13-45", 50, 0, supabase=fake))
+    except HTTPException as e:
+        assert e.status_code == 400
+    else:
+        raise AssertionError("expected HTTPException")
+    assert fake.executes == []
+
+
+def test_get_event_single_query():
+    assert run_with_fake(events_routes.get_event, EVENT_ID, FakeRequest(), Response()) == 1
+
+
+def test_list_events_etag_304():
+    """A matching If-None-Match gets a bodiless 304"""
+    events_routes.invalidate_event_caches()
+    first = Response()
+    asyncio.run(events_routes.get_events(FakeRequest(), first, None, 50, 0, supabase=FakeSupabase()))
+    etag = first.headers["etag"]
+    
+    result = asyncio.run(events_routes.get_events(
+        FakeRequest({"If-None-Match": etag}), Response(), None, 50, 0, supabase=FakeSupabase()
+    ))
+    assert result.status_code == 304
+    assert result.headers["etag"] == etag
+
+
+def test_get_event_last_modified_304():
+    events_routes.event_cache.clear()
+    first = Response()
+    asyncio.run(events_routes.get_event(EVENT_ID, FakeRequest(), first, supabase=FakeSupabase()))
+    assert first.headers["last-modified"] == "Wed, 10 Dec 2025 08:30:00 GMT"
+    
+    result = asyncio.run(events_routes.get_event(
+        EVENT_ID, FakeRequest({"If-Modified-Since": "Wed, 10 Dec 2025 08:30:00 GMT"}), Response(),
+        supabase=FakeSupabase()
+    ))
+    assert result.status_code == 304
+
+
+def test_update_event_single_query():
+    update = events_routes.EventUpdate(title="Morning Yoga")
+    assert run_with_fake(events_routes.update_event, EVENT_ID, update) == 1
+
+
+def test_delete_event_single_query():
+    assert run_with_fake(events_routes.delete_event, EVENT_ID) == 1
+
+
+def test_register_single_query():
+    registration = events_routes.EventRegistration(event_id=EVENT_ID, user_id=USER_ID)
+    assert run_with_fake(events_routes.register_for_event, registration) == 1
+
+
+def test_unregister_single_query():
+    assert run_with_fake(events_routes.unregister_from_event, EVENT_ID, USER_ID) == 1
+
+
+def test_participants_single_query():
+    assert run_with_fake(events_routes.get_event_participants, EVENT_ID) == 1
+
+
+def test_participants_missing_event_uses_head_check():
+    """An empty participant list falls back to a HEAD count on events"""
+    fake = FakeSupabase(empty=True)
+    try:
+        asyncio.run(events_routes.get_event_participants(EVENT_ID, supabase=fake))
+    except events_routes.HTTPException as e:
+        assert e.status_code == 404
+    else:
+        raise AssertionError("expected 404 for a missing event")
+    assert fake.executes == [("event_registrations", False), ("events", True)]
+
+
+def test_no_select_star():
+    """Queries must list their columns explicitly"""
+    routes_path = os.path.join(os.path.dirname(__file__), "..", "app", "events", "routes.py")
+    with open(routes_path, encoding="utf-8") as f:
+        source = f.read()
+    assert "select('*')" not in source
+    assert 'select("*")' not in source
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"✅ {name}")
@@ -0,0 +1,86 @@
+"""
+Intent routing checks for the orchestrator
+Runs offline - GROQ and the events fetch are replaced with fakes
+
+Run with: python -m pytest test/test_orchestrator_intent.py
+"""
+import asyncio
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import app.orchestrator.routes as orchestrator_routes
+
+
+BENIGN_MESSAGES = [
+    "Tell me about the painting workshop",
+    "what time is the Spain food night",
+    "hi there, can you help?",
+    "Can you help me understand how this app works?",
+]
+
+
+def detect_with_fake_groq(message):
+    """Run intent detection with a GROQ stub, return (result, GROQ calls)"""
+    calls = []
+    
+    async def fake_request_intent(client, model, user_content, id_by_prefix):
+        calls.append(model)
+        return {"intent": "general", "confidence": 0.9}
+    
+    async def fake_get_events_cached():
+        return []
+    
+    originals = (
+        orchestrator_routes.get_groq_client,
+        orchestrator_routes.request_intent,
+        orchestrator_routes.get_events_cached,
+    )
+    orchestrator_routes.get_groq_client = lambda: object()
+    orchestrator_routes.request_intent = fake_request_intent
+    orchestrator_routes.get_events_cached = fake_get_events_cached
+    try:
+        result = asyncio.run(orchestrator_routes.detect_intent_and_extract_info(message, "user"))
+    finally:
+        (
+            orchestrator_routes.get_groq_client,
+            orchestrator_routes.request_intent,
+            orchestrator_routes.get_events_cached,
+        ) = originals
+    return result, calls
+
+
+def test_benign_messages_go_to_groq():
+    """Substring matches ("pain" in "painting") and a bare "help" are not an SOS"""
+    for message in BENIGN_MESSAGES:
+        result, calls = detect_with_fake_groq(message)
+        assert calls, message
+        assert result["intent"] == "general", message
+
+
+def test_obvious_emergency_skips_groq():
+    for message in ("SOS", "please call ambulance", "This is an emergency!", "call 999 now"):
+        result, calls = detect_with_fake_groq(message)
+        assert calls == [], message
+        assert result["intent"] == "emergency", message
+
+
+def test_obvious_emergency_is_word_bounded():
+    assert not orchestrator_routes.is_obvious_emergency("sosaties night")
+    assert not orchestrator_routes.is_obvious_emergency("cancel the emergency first aid event")
+
+
+def test_keyword_fallback_is_separate_from_short_circuit():
+    """The broad keyword matcher still answers when GROQ is down, but never skips it"""
+    message = "hi there, can you help?"
+    assert orchestrator_routes.keyword_intent(message)["intent"] == "emergency"
+    assert not orchestrator_routes.is_obvious_emergency(message)
+    assert orchestrator_routes.keyword_intent("cancel my painting class")["intent"] == "cancel_event"
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"✅ {name}")
@@ -0,0 +1,76 @@
+"""
+Chat model fallback checks for the orchestrator
+Runs offline against a fake OpenAI client
+
+Run with: python -m pytest test/test_orchestrator_models.py
+"""
+import asyncio
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import httpx
+import openai
+
+import app.orchestrator.routes as orchestrator_routes
+
+
+def api_error(error_class, status_code, message, code=None):
+    request = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+    response = httpx.Response(status_code, request=request)
+    return error_class(message, response=response, body={"message": message, "code": code})
+
+
+class FakeCompletions:
+    """Raises the queued errors in order, then answers with the model name"""
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.models = []
+
+    async def create(self, model, **kwargs):
+        self.models.append(model)
+        if self.errors:
+            raise self.errors.pop(0)
+        return model
+
+
+class FakeClient:
+    def __init__(self, errors):
+        self.chat = type("Chat", (), {})()
+        self.chat.completions = FakeCompletions(errors)
+
+
+def run_completion(errors):
+    orchestrator_routes.unavailable_models.clear()
+    client = FakeClient(errors)
+    try:
+        return asyncio.run(orchestrator_routes.create_chat_completion(client, ("gpt-4", "gpt-3.5-turbo"))), client
+    except Exception as e:
+        return e, client
+
+
+def test_missing_model_falls_back_and_is_remembered():
+    result, client = run_completion([api_error(openai.NotFoundError, 404, "The model `gpt-4` does not exist", "model_not_found")])
+    assert result == "gpt-3.5-turbo"
+    assert orchestrator_routes.unavailable_models == {"gpt-4"}
+    orchestrator_routes.unavailable_models.clear()
+
+
+def test_context_length_error_is_not_a_model_error():
+    """A request that's too long for the model must not retire the model"""
+    error = api_error(
+        openai.BadRequestError, 400,
+        "This model's maximum context length is 8192 tokens", "context_length_exceeded"
+    )
+    result, client = run_completion([error])
+    assert result is error
+    assert client.chat.completions.models == ["gpt-4"]
+    assert orchestrator_routes.unavailable_models == set()
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"✅ {name}")
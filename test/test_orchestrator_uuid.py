@@ -0,0 +1,35 @@
+"""
+Event ID validation checks for the orchestrator
+Runs offline - only imports the orchestrator routes module
+
+Run with: python -m pytest test/test_orchestrator_uuid.py
+"""
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app.orchestrator.routes import validate_and_get_uuid
+
+
+def test_accepts_canonical_uuid():
+    assert validate_and_get_uuid(" 11111111-2222-3333-4444-555555555555 ") == "11111111-2222-3333-4444-555555555555"
+    assert validate_and_get_uuid("ABCDEF12-abcd-EF12-3456-7890abcdef12") == "ABCDEF12-abcd-EF12-3456-7890abcdef12"
+
+
+def test_rejects_non_uuids():
+    for value in (None, "", "1", 1, "11111111222233334444555555555555", "1111111-2222-3333-4444-555555555555g"):
+        assert validate_and_get_uuid(value) is None
+
+
+def test_rejects_dash_only_and_misplaced_dashes():
+    assert validate_and_get_uuid("-" * 36) is None
+    assert validate_and_get_uuid("12345678-1234-1234-1234-1234-5678901") is None
+    assert validate_and_get_uuid("12345678-1234-1234-1234-12345678901-") is None
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith("test_") and callable(func):
+            func()
+            print(f"✅ {name}")